@@ -0,0 +1,191 @@
+"""
+This module contains a paired-seed (common random numbers) harness for
+comparing two `Player.play_card` policies.
+
+Every seeded deal is played twice, once with each policy in the tested seat
+and greedy `Player`s in the others. Each game draws its deck order and
+reshuffles from one `RandomStream` and its wild colors from another, both
+seeded from the deal, so the two games see the same deck, the same reshuffle
+draws and the same k-th wild color however the policies diverge. The
+difference in wins is then recorded per deal, and since the deal dominates
+the variance of a single game, the paired difference has a much smaller
+variance than two independent samples. The tested seat rotates with the seed
+to remove the seat advantage.
+
+Usage: python ab_test.py [games] [players]
+"""
+
+from __future__ import annotations
+import sys
+from typing import Callable
+from card import Card, CardColor, CardLabel, NUM_CARD_CODES, PLAYABLE, card_code
+from data_structures import ArrayList
+from game import Game
+from player import Player
+from random_gen import RandomStream
+from simulation_stats import RunningStat
+
+Policy = Callable[[str], Player]
+
+
+def paired_game(policy: Policy, seed: int, num_players: int) -> tuple[Game, Player]:
+    """
+    Method to deal the game of a seed with the policy in the tested seat
+
+    Args:
+        policy (Policy): Builds the tested player from a name, e.g. a Player subclass
+        seed (int): The seed of the deal
+        num_players (int): The number of seats; the tested seat is seed % num_players
+
+    Returns:
+        tuple[Game, Player]: The initialised game and the tested player
+
+    Complexity:
+        Best Case Complexity: O(KP + M), see Game.initialise_game
+        Worst Case Complexity: O(KP + M)
+    """
+    tested = policy("tested")
+    players = ArrayList[Player](num_players)
+    for seat in range(num_players):
+        players.append(tested if seat == seed % num_players else Player(f"greedy{seat}"))
+    game = Game()
+    game.verbose = False
+    game.deck_random = RandomStream(2 * seed)
+    game.color_random = RandomStream(2 * seed + 1)
+    game.initialise_game(players)
+    return game, tested
+
+
+def play_paired(
+    policy_a: Policy, policy_b: Policy, seed: int, num_players: int, time_limit: float | None = Game.TIME_LIMIT
+) -> tuple[float, float] | None:
+    """
+    Method to play one deal with each policy
+
+    Args:
+        policy_a (Policy): The first policy
+        policy_b (Policy): The second policy
+        seed (int): The seed of the deal
+        num_players (int): The number of seats
+        time_limit (float | None): The wall-clock seconds each game may take, see Game.play_game
+
+    Returns:
+        tuple[float, float] | None: 1.0 for a win of the tested seat and 0.0 otherwise,
+        for policy_a then policy_b, or None if either game raised or ended without a winner
+
+    Complexity:
+        Best Case Complexity: O(T), where T is the cost of playing both games
+        Worst Case Complexity: O(T)
+    """
+    scores = []
+    for policy in (policy_a, policy_b):
+        game, tested = paired_game(policy, seed, num_players)
+        try:
+            winner = game.play_game(time_limit)
+        except Exception:
+            return None
+        if winner is None:
+            return None
+        scores.append(1.0 if winner is tested else 0.0)
+    return scores[0], scores[1]
+
+
+def compare(
+    policy_a: Policy,
+    policy_b: Policy,
+    num_games: int,
+    num_players: int = 2,
+    first_seed: int = 0,
+    time_limit: float | None = Game.TIME_LIMIT,
+) -> dict:
+    """
+    Method to compare two policies on paired deals
+
+    Args:
+        policy_a (Policy): The first policy
+        policy_b (Policy): The second policy
+        num_games (int): The number of deals, each played twice
+        num_players (int): The number of seats
+        first_seed (int): The seed of the first deal, the next ones count up
+        time_limit (float | None): The wall-clock seconds each game may take
+
+    Returns:
+        dict: pairs, errors (deals with a game that raised or had no winner), win_rate_a, win_rate_b, difference (a - b), half_width of the
+        95% interval of the difference, paired_variance and unpaired_variance of the
+        difference of the means, and variance_reduction, their ratio
+
+    Complexity:
+        Best Case Complexity: O(num_games * T), where T is the cost of playing two games
+        Worst Case Complexity: O(num_games * T)
+    """
+    wins_a, wins_b, difference = RunningStat(), RunningStat(), RunningStat()
+    errors = 0
+    for seed in range(first_seed, first_seed + num_games):
+        scores = play_paired(policy_a, policy_b, seed, num_players, time_limit)
+        if scores is None:
+            errors += 1
+            continue
+        wins_a.add(scores[0])
+        wins_b.add(scores[1])
+        difference.add(scores[0] - scores[1])
+    pairs = difference.count
+    paired = difference.variance / pairs if pairs else 0.0
+    unpaired = (wins_a.variance + wins_b.variance) / pairs if pairs else 0.0
+    return {
+        "pairs": pairs,
+        "errors": errors,
+        "win_rate_a": wins_a.mean,
+        "win_rate_b": wins_b.mean,
+        "difference": difference.mean,
+        "half_width": difference.half_width(0.95),
+        "paired_variance": paired,
+        "unpaired_variance": unpaired,
+        "variance_reduction": unpaired / paired if paired else float("inf"),
+    }
+
+
+class ReversePlayer(Player):
+    """
+    Player who plays the playable card the greedy Player would play last
+    """
+
+    def play_card(self, current_color: CardColor, current_label: CardLabel) -> Card | None:
+        """
+        Method to play the playable card with the largest code
+
+        Args:
+            current_color (CardColor): The current color of the game
+            current_label (CardLabel): The current label of the game
+
+        Returns:
+            Card: The card played, or None to draw
+
+        Complexity:
+            Best Case Complexity: O(N), where N is the length of self.hand
+            Worst Case Complexity: O(N)
+        """
+        state = card_code(current_color, current_label) * NUM_CARD_CODES
+        selected_index = -1
+        selected_code = -1
+        for i in range(len(self.hand)):
+            code = self.hand[i].code
+            if PLAYABLE[state + code] and code > selected_code:
+                selected_index = i
+                selected_code = code
+        if selected_index < 0:
+            return None
+        card = self.hand.delete_at_index(selected_index)
+        if self.observer is not None:
+            self.observer.card_removed(self, card)
+        return card
+
+
+if __name__ == "__main__":
+    num_games = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    num_players = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    report = compare(Player, ReversePlayer, num_games, num_players)
+    print(
+        f"greedy {report['win_rate_a']:.3f} vs reverse {report['win_rate_b']:.3f} over {report['pairs']} pairs: "
+        f"difference {report['difference']:+.4f} +- {report['half_width']:.4f}, "
+        f"variance {report['variance_reduction']:.2f}x smaller than unpaired"
+    )
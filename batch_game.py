@@ -0,0 +1,338 @@
+"""
+This module contains the `BatchGame` class, a lockstep NumPy engine that
+plays many independent games at once.
+
+Every game keeps exactly the state the object engine keeps, stored as rows of
+NumPy arrays: hands as per-seat counts of each packed card code, the draw and
+discard piles as code arrays with length pointers, the turn order as a front
+seat plus a direction, and a private copy of the `RandomGen` LCG state. Each
+rule of `Game.play_game` is applied to all active games as a masked array
+operation, and games leave the active set as soon as they are won. Given the
+same seed, a game finishes with the same winner as the scalar `Game`, and a
+game still unwon at the turn cap of `Game.check_progress` ends as a draw.
+
+NumPy is an optional dependency and is only needed by this module.
+"""
+
+from __future__ import annotations
+import numpy as np
+from card import CardColor, CardLabel, NUM_LABELS, NUM_CARD_CODES, PLAYABLE
+from random_gen import RandomGen
+from config import Config
+
+BLACK = int(CardColor.BLACK)
+NUM_COLORS = len(CardColor) - 1
+MASK_48 = RandomGen.MOD - 1
+TURN_LIMIT = -3
+ERROR = -2
+PLAYING = -1
+
+
+def deck_codes() -> np.ndarray:
+    """
+    Method to build the sorted card codes of one deck, in the composition
+    used by Game.generate_cards
+
+    Args:
+        None
+
+    Returns:
+        np.ndarray: The card codes of one deck in ascending order
+
+    Complexity:
+        Best Case Complexity: O(N), where N is Config.DECK_SIZE
+        Worst Case Complexity: O(N), where N is Config.DECK_SIZE
+        Explanation: Each card code is written once and the result is sorted once
+    """
+    codes = []
+    for color in range(NUM_COLORS):
+        for label in range(CardLabel.NINE + 1):
+            codes += [color * NUM_LABELS + label] * 2
+        for label in (CardLabel.SKIP, CardLabel.REVERSE, CardLabel.DRAW_TWO):
+            codes += [color * NUM_LABELS + label] * 2
+    for label in (CardLabel.CRAZY, CardLabel.DRAW_FOUR):
+        codes += [BLACK * NUM_LABELS + label] * 4
+    if len(codes) != Config.DECK_SIZE:
+        raise ValueError(f"Deck has {len(codes)} cards, expected {Config.DECK_SIZE}")
+    return np.sort(np.array(codes, dtype=np.int16), kind="stable")
+
+
+def playable_table() -> np.ndarray:
+    """
+    Method to view the card.PLAYABLE table as a NumPy boolean matrix
+
+    Args:
+        None
+
+    Returns:
+        np.ndarray: table[state, code], True if the card code is playable on the
+        (current color, current label) state packed the same way
+
+    Complexity:
+        Best Case Complexity: O(C^2), where C is NUM_CARD_CODES
+        Worst Case Complexity: O(C^2), where C is NUM_CARD_CODES
+        Explanation: The shared bytes are read without copying and converted to booleans once
+    """
+    return PLAYABLE.to_numpy().reshape(NUM_CARD_CODES, NUM_CARD_CODES).astype(bool)
+
+
+class BatchGame:
+    """
+    BatchGame class to play many seeded games in lockstep
+    """
+
+    def __init__(self, seeds, num_players: int) -> None:
+        """
+        Constructor for the BatchGame class, which deals every game
+
+        Args:
+            seeds: The RandomGen seed of each game, one game per seed
+            num_players (int): The number of players at every table
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(G * (M log M + C * N)), where G is the number of games,
+            M is Config.DECK_SIZE, C is NUM_CARD_CODES and N is num_players
+            Worst Case Complexity: O(G * (M log M + C * N))
+            Explanation:
+            - Shuffling every deck sorts M random keys per game, O(G * M log M)
+            - The hand count arrays hold C counters per seat per game, O(G * C * N)
+        """
+        seeds = np.asarray(seeds, dtype=np.uint64) & np.uint64(MASK_48)
+        self.num_games = len(seeds)
+        self.num_players = num_players
+        self.deck = deck_codes()
+        self.playable = playable_table()
+        self.__jumps(2 * len(self.deck))
+
+        games = np.arange(self.num_games)
+        self.seed = seeds.copy()
+        self.draw_pile = self.deck[self.__shuffle_order(games, len(self.deck))]
+        self.draw_pos = np.zeros(self.num_games, dtype=np.int64)
+        self.draw_len = np.full(self.num_games, len(self.deck), dtype=np.int64)
+        self.discard_pile = np.zeros((self.num_games, 2 * len(self.deck)), dtype=np.int16)
+        self.discard_len = np.zeros(self.num_games, dtype=np.int64)
+
+        self.hands = np.zeros((self.num_games, num_players, NUM_CARD_CODES), dtype=np.int32)
+        self.hand_size = np.zeros((self.num_games, num_players), dtype=np.int32)
+        self.front = np.zeros(self.num_games, dtype=np.int64)
+        self.direction = np.ones(self.num_games, dtype=np.int64)
+        self.state = np.zeros(self.num_games, dtype=np.int64)
+        self.winner = np.full(self.num_games, PLAYING, dtype=np.int64)
+        self.turns = np.zeros(self.num_games, dtype=np.int64)
+        self.active = np.ones(self.num_games, dtype=bool)
+
+        for _ in range(Config.NUM_CARDS_AT_INIT):
+            for seat in range(num_players):
+                self.__add_to_hand(games, seat, self.__draw(games))
+        waiting = games
+        while len(waiting) > 0:
+            codes = self.__draw(waiting)
+            self.__discard(waiting, codes)
+            started = codes % NUM_LABELS <= CardLabel.NINE
+            self.state[waiting[started]] = codes[started]
+            waiting = waiting[~started & self.active[waiting]]
+
+    def __jumps(self, length: int) -> None:
+        """
+        Precomputes the LCG multipliers and increments that advance a seed
+        by 1..length steps, so a run of random numbers can be made at once.
+        :complexity: O(length)
+        """
+        multipliers, increments = [], []
+        a, c = 1, 0
+        for _ in range(length):
+            a, c = (a * RandomGen.A) % RandomGen.MOD, (c * RandomGen.A + RandomGen.C) % RandomGen.MOD
+            multipliers.append(a)
+            increments.append(c)
+        self.multipliers = np.array(multipliers, dtype=np.uint64)
+        self.increments = np.array(increments, dtype=np.uint64)
+
+    def __random(self, games: np.ndarray, count: int) -> np.ndarray:
+        """
+        Returns the next count RandomGen.random() values of each game as a
+        (len(games), count) array and advances the seeds past them.
+        :complexity: O(len(games) * count)
+        """
+        if count > len(self.multipliers):
+            self.__jumps(2 * count)
+        states = (
+            self.seed[games, None] * self.multipliers[None, :count] + self.increments[None, :count]
+        ) & np.uint64(MASK_48)
+        self.seed[games] = states[:, -1]
+        return states >> np.uint64(16)
+
+    def __shuffle_order(self, games: np.ndarray, count: int) -> np.ndarray:
+        """
+        Returns the permutation RandomGen.random_shuffle applies to a sorted
+        collection of count cards, one row per game.
+        :complexity: O(len(games) * count log count)
+        """
+        return np.argsort(self.__random(games, count), axis=1, kind="stable")
+
+    def __reshuffle(self, game: int) -> None:
+        """
+        Moves the shuffled discard pile of one game to its draw pile, as
+        GameBoard.reshuffle does. A game whose object counterpart would raise
+        (nothing to reshuffle, or more cards than the draw pile holds) is
+        marked as an error and leaves the active set.
+        :complexity: O(M log M), where M is the number of discarded cards
+        """
+        count = int(self.discard_len[game])
+        if count == 0 or count > len(self.deck):
+            self.winner[game] = ERROR
+            self.active[game] = False
+            return
+        cards = np.sort(self.discard_pile[game, :count], kind="stable")
+        order = self.__shuffle_order(np.array([game]), count)[0]
+        self.draw_pile[game, :count] = cards[order]
+        self.draw_pos[game] = 0
+        self.draw_len[game] = count
+        self.discard_len[game] = 0
+
+    def __draw(self, games: np.ndarray) -> np.ndarray:
+        """
+        Draws the top card of each game's draw pile, reshuffling empty piles.
+        :complexity: O(len(games)) unless a pile is reshuffled
+        """
+        for game in games[self.draw_pos[games] == self.draw_len[games]]:
+            self.__reshuffle(game)
+        positions = np.minimum(self.draw_pos[games], self.draw_pile.shape[1] - 1)
+        codes = self.draw_pile[games, positions]
+        self.draw_pos[games] += 1
+        return codes
+
+    def __discard(self, games: np.ndarray, codes: np.ndarray) -> None:
+        """
+        Appends one card to each game's discard pile, growing the piles if needed.
+        :complexity: O(len(games)) unless the piles grow
+        """
+        if len(games) > 0 and self.discard_len[games].max() >= self.discard_pile.shape[1]:
+            grown = np.zeros((self.num_games, 2 * self.discard_pile.shape[1]), dtype=np.int16)
+            grown[:, : self.discard_pile.shape[1]] = self.discard_pile
+            self.discard_pile = grown
+        self.discard_pile[games, self.discard_len[games]] = codes
+        self.discard_len[games] += 1
+
+    def __add_to_hand(self, games: np.ndarray, seats, codes: np.ndarray) -> None:
+        """
+        Adds one card to one seat of each game.
+        :complexity: O(len(games))
+        """
+        self.hands[games, seats, codes] += 1
+        self.hand_size[games, seats] += 1
+
+    def __penalise(self, games: np.ndarray, victims: np.ndarray, count: int) -> None:
+        """
+        Makes the victim of each game draw count cards into their hand.
+        :complexity: O(count * len(games)) unless a pile is reshuffled
+        """
+        for _ in range(count):
+            self.__add_to_hand(games, victims, self.__draw(games))
+
+    def step(self) -> int:
+        """
+        Method to play one turn of every active game
+
+        Args:
+            None
+
+        Returns:
+            int: The number of games still being played
+
+        Complexity:
+            Best Case Complexity: O(G * C), where G is the number of active games and C is NUM_CARD_CODES
+            Worst Case Complexity: O(G * C + R * M log M), where R is the number of games that
+            reshuffle during the turn and M is the number of cards in their discard piles
+            Explanation:
+            - Choosing the smallest playable card scans the C code counters of each current hand
+            - Every other rule is a constant number of masked array operations per game
+            - A reshuffle sorts the discard pile of that game, O(M log M)
+        """
+        games = np.flatnonzero(self.active)
+        seats = self.front[games]
+        self.turns[games] += 1
+
+        # Player.play_card: the playable card with the smallest (color, label)
+        options = self.playable[self.state[games]] & (self.hands[games, seats] > 0)
+        has_card = options.any(axis=1)
+        codes = np.argmax(options, axis=1)
+        played = games[has_card]
+        self.hands[played, seats[has_card], codes[has_card]] -= 1
+        self.hand_size[played, seats[has_card]] -= 1
+
+        won = self.hand_size[games, seats] == 0
+        self.winner[games[won]] = seats[won]
+        self.active[games[won]] = False
+
+        # No playable card in hand: draw one and play it at once if possible
+        drawing = ~has_card & ~won
+        drawers = games[drawing]
+        drawn = self.__draw(drawers).astype(np.int64)
+        drawn_playable = self.playable[self.state[drawers], drawn]
+        self.__discard(drawers[drawn_playable], drawn[drawn_playable])
+        keep = ~drawn_playable
+        self.__add_to_hand(drawers[keep], seats[drawing][keep], drawn[keep])
+        codes[drawing] = drawn
+
+        playing = (has_card & ~won) | drawing
+        playing[drawing] = drawn_playable
+        playing &= self.active[games]
+        self.front[games[~playing]] += self.direction[games[~playing]]
+
+        # Rules of the played card
+        games, seats, codes = games[playing], seats[playing], codes[playing]
+        self.__discard(games, codes)
+        self.state[games] = codes
+        colors, labels = codes // NUM_LABELS, codes % NUM_LABELS
+        direction = self.direction[games]
+
+        black = colors == BLACK
+        wild_games = games[black]
+        new_colors = (self.__random(wild_games, 1)[:, 0] % np.uint64(NUM_COLORS)).astype(np.int64)
+        self.state[wild_games] = new_colors * NUM_LABELS + labels[black]
+
+        penalty = np.zeros(len(games), dtype=np.int64)
+        penalty[labels == CardLabel.DRAW_FOUR] = 4
+        penalty[~black & (labels == CardLabel.DRAW_TWO)] = 2
+        for count in (2, 4):
+            hit = penalty == count
+            victims = (seats[hit] + direction[hit]) % self.num_players
+            self.__penalise(games[hit], victims, count)
+
+        skips = (penalty > 0) | (~black & (labels == CardLabel.SKIP))
+        reverse = ~black & (labels == CardLabel.REVERSE)
+        direction = np.where(reverse, -direction, direction)
+        self.direction[games] = direction
+        self.front[games] = seats + np.where(skips, 2 * direction, direction)
+
+        self.front %= self.num_players
+        return int(self.active.sum())
+
+    def play(self, max_turns: int | None = None) -> np.ndarray:
+        """
+        Method to play every game until it is won or reaches the turn cap
+
+        Args:
+            max_turns (int | None): The turn cap, Config.MAX_ROUNDS_PER_PLAYER rounds if None
+
+        Returns:
+            np.ndarray: The winning seat of each game, TURN_LIMIT for games still
+            unwon at the cap and ERROR for games the object engine could not finish
+
+        Complexity:
+            Best Case Complexity: O(T * G * C), where T is the number of turns of the longest game
+            Worst Case Complexity: O(max_turns * (G * C + R * M log M)), see step
+            Explanation: step is called once per turn until every game has ended
+        """
+        if max_turns is None:
+            max_turns = Config.MAX_ROUNDS_PER_PLAYER * self.num_players
+        turns = 0
+        while self.active.any() and turns < max_turns:
+            self.step()
+            turns += 1
+        self.winner[self.active] = TURN_LIMIT
+        self.active[:] = False
+        return self.winner
@@ -0,0 +1,54 @@
+"""
+Benchmark comparing the lockstep BatchGame engine against looping Game.
+
+Usage: python -m benchmarks.bench_batch_game [games] [players]
+"""
+
+import io
+import sys
+import time
+from contextlib import redirect_stdout
+
+from batch_game import BatchGame
+from config import Config
+from data_structures import ArrayList
+from game import Game
+from player import Player
+from random_gen import RandomGen
+
+
+def play_object_games(seeds: range, num_players: int) -> None:
+    """Plays one object engine game per seed."""
+    for seed in seeds:
+        RandomGen.set_seed(seed)
+        players = ArrayList(num_players)
+        for seat in range(num_players):
+            players.append(Player(str(seat)))
+        game = Game()
+        game.initialise_game(players)
+        try:
+            with redirect_stdout(io.StringIO()):
+                game.play_game()
+        except Exception as error:
+            # the double discard of a drawn playable card can overfill the discard pile
+            if str(error) != "Stack is full":
+                raise
+
+
+if __name__ == "__main__":
+    num_games = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    num_players = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    Config.NUM_CARDS_AT_INIT = 7
+    seeds = range(num_games)
+
+    start = time.perf_counter()
+    play_object_games(seeds, num_players)
+    object_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    BatchGame(seeds, num_players).play()
+    batch_time = time.perf_counter() - start
+
+    print(f"Game loop:  {num_games / object_time:10.0f} games/s")
+    print(f"BatchGame:  {num_games / batch_time:10.0f} games/s")
+    print(f"Speed-up:   {object_time / batch_time:10.1f}x")
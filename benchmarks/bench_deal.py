@@ -0,0 +1,64 @@
+"""
+Benchmark of dealing the starting hands of a large table, card by card
+around the player queue against Game.deal_cards, which draws one batch and
+hands each player every N-th card of it.
+
+Usage: python -m benchmarks.bench_deal [deals] [players] [decks]
+"""
+
+import sys
+import time
+
+from config import Config
+from data_structures import ArrayList
+from game import Game
+from player import Player
+from random_gen import RandomGen
+
+
+def deal_by_rotation(game: Game) -> None:
+    """The deal as Game.deal_cards did it before batching, without the starting card."""
+    for _ in range(Config.NUM_CARDS_AT_INIT):
+        for _ in range(len(game.players)):
+            player = game.players.serve()
+            player.add_card(game.game_board.draw_card())
+            game.players.append(player)
+
+
+def deal_in_batch(game: Game) -> None:
+    """The batched deal of Game.deal_cards, without the starting card."""
+    num_players = len(game.players)
+    dealt = game.draw_batch = game.game_board.draw_many(Config.NUM_CARDS_AT_INIT * num_players, game.draw_batch)
+    for position in range(num_players):
+        game.players.peek_at(position).add_cards(dealt.array[position : len(dealt) : num_players])
+
+
+def run(deal, num_deals: int, num_players: int, decks: int) -> float:
+    """Returns the seconds spent dealing num_deals tables."""
+    players = ArrayList(num_players)
+    for seat in range(num_players):
+        players.append(Player(str(seat)))
+    game = Game()
+    game.verbose = False
+    game.decks = decks
+    RandomGen.set_seed(0)
+    game.initialise_game(players)
+    elapsed = 0.0
+    for _ in range(num_deals):
+        for seat in range(num_players):
+            players[seat].reset()
+        game.game_board.reset(game.deck)
+        start = time.perf_counter()
+        deal(game)
+        elapsed += time.perf_counter() - start
+    return elapsed
+
+
+if __name__ == "__main__":
+    num_deals = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    num_players = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    decks = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+    Config.NUM_CARDS_AT_INIT = 7
+    for name, deal in (("rotating the queue", deal_by_rotation), ("draw_many batch", deal_in_batch)):
+        elapsed = run(deal, num_deals, num_players, decks)
+        print(f"{name}: {1e6 * elapsed / num_deals:8.1f} us/deal of {num_players} hands")
@@ -0,0 +1,74 @@
+"""
+Benchmark of EndgameSolver.solve on two-player positions with small hands:
+every turn of EndgamePlayer against the greedy Player is timed, together with
+how often the solver proved the position. The p99 latency is checked against
+the single-digit millisecond target and the proven rate against a regression
+floor; the exit status is 1 if either is missed.
+
+Usage: python -m benchmarks.bench_endgame [games] [cards]
+"""
+
+import statistics
+import sys
+import time
+
+from config import Config
+from data_structures import ArrayList
+from endgame import EndgamePlayer, EndgameSolver, UNKNOWN
+from game import Game
+from player import Player
+from random_gen import RandomGen
+
+MAX_P99_MS = 10.0
+# The solver is a bounded search, not an exact one: this floor only guards the
+# rate of the default run (200 games of 5 cards) against regressions
+MIN_PROVEN = 0.40
+
+
+class TimedSolver(EndgameSolver):
+    """EndgameSolver recording the time and value of every solve."""
+
+    def __init__(self) -> None:
+        EndgameSolver.__init__(self)
+        self.times: list[float] = []
+        self.proven = 0
+
+    def solve(self, player: Player) -> tuple[int, int]:
+        start = time.perf_counter()
+        value, move = EndgameSolver.solve(self, player)
+        self.times.append(time.perf_counter() - start)
+        self.proven += value != UNKNOWN
+        return value, move
+
+
+if __name__ == "__main__":
+    num_games = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    Config.NUM_CARDS_AT_INIT = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    times: list[float] = []
+    proven = 0
+    for seed in range(num_games):
+        RandomGen.set_seed(seed)
+        solver = TimedSolver()
+        players = ArrayList(2)
+        players.append(EndgamePlayer("solver", solver))
+        players.append(Player("greedy"))
+        game = Game()
+        game.verbose = False
+        game.initialise_game(players)
+        game.attach(solver)
+        try:
+            game.play_game()
+        except Exception as error:
+            # the double discard of a drawn playable card can overfill the discard pile
+            if str(error) != "Stack is full":
+                raise
+        times.extend(solver.times)
+        proven += solver.proven
+    times.sort()
+    rate = proven / len(times)
+    p99 = 1000 * times[int(0.99 * (len(times) - 1))]
+    print(f"{len(times)} solves, {100 * rate:.1f}% proven (floor {100 * MIN_PROVEN:.0f}%)")
+    print(f"median {1000 * statistics.median(times):6.2f} ms")
+    print(f"p99    {p99:6.2f} ms (target < {MAX_P99_MS:.0f} ms)")
+    print(f"max    {1000 * times[-1]:6.2f} ms")
+    sys.exit(0 if rate >= MIN_PROVEN and p99 < MAX_P99_MS else 1)
@@ -0,0 +1,41 @@
+"""
+Benchmark of the time to import the engine in a fresh interpreter, as a
+short-lived batch worker does, read from `python -X importtime`.
+
+Prints the median cumulative import time of each module over the runs, and
+the heaviest imports of the last run.
+
+Usage: python -m benchmarks.bench_import [runs] [module]
+"""
+
+import statistics
+import subprocess
+import sys
+
+BUDGET_MS = 150
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Imports module in a fresh interpreter and returns the cumulative
+    microseconds of every module it imported, keyed by module name."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True, check=True
+    ).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    module = sys.argv[2] if len(sys.argv) > 2 else "game"
+    samples = [import_times(module) for _ in range(runs)]
+    median = statistics.median(times[module] for times in samples) / 1000
+    print(f"import {module}: {median:.1f} ms median of {runs} runs (budget {BUDGET_MS} ms)")
+    print(f"unittest imported: {'unittest' in samples[-1]}")
+    for name, cumulative in sorted(samples[-1].items(), key=lambda item: -item[1])[:10]:
+        print(f"{cumulative / 1000:8.1f} ms  {name}")
@@ -0,0 +1,64 @@
+"""
+Benchmark of the plain-int fast path of the engine core: turns per second of
+Game.play_game, and the cost of the enum operations it replaced next to
+their plain-int counterparts.
+
+Usage: python -m benchmarks.bench_int_fast_path [games] [players]
+"""
+
+import sys
+import time
+import timeit
+
+from card import BLACK, COLORS, NUM_LABELS, Card, CardColor, CardLabel
+from config import Config
+from data_structures import ArrayList
+from game import Game
+from player import Player
+from random_gen import RandomGen
+
+
+def turns_per_second(num_games: int, num_players: int) -> float:
+    """Plays seeded games between greedy players and returns turns per second of play_game."""
+    turns, elapsed = 0, 0.0
+    for seed in range(num_games):
+        RandomGen.set_seed(seed)
+        players = ArrayList(num_players)
+        for seat in range(num_players):
+            players.append(Player(str(seat)))
+        game = Game()
+        game.verbose = False
+        game.initialise_game(players)
+        start = time.perf_counter()
+        try:
+            game.play_game()
+        except Exception as error:
+            # the double discard of a drawn playable card can overfill the discard pile
+            if str(error) != "Stack is full":
+                raise
+        elapsed += time.perf_counter() - start
+        turns += game.turn_counter
+    return turns / elapsed
+
+
+OPERATIONS = (
+    ("card.color == CardColor.BLACK", "card.code // NUM_LABELS == BLACK"),
+    ("CardColor(3)", "COLORS[3]"),
+)
+
+
+if __name__ == "__main__":
+    num_games = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    num_players = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    Config.NUM_CARDS_AT_INIT = 7
+    print(f"play_game: {turns_per_second(num_games, num_players):,.0f} turns/s")
+    namespace = {
+        "card": Card(CardColor.RED, CardLabel.FIVE),
+        "CardColor": CardColor,
+        "BLACK": BLACK,
+        "COLORS": COLORS,
+        "NUM_LABELS": NUM_LABELS,
+    }
+    for enum_op, int_op in OPERATIONS:
+        costs = [min(timeit.repeat(op, globals=namespace, number=200_000, repeat=5)) / 200_000 for op in (enum_op, int_op)]
+        print(f"{enum_op:30s} {1e9 * costs[0]:6.1f} ns   {int_op:32s} {1e9 * costs[1]:6.1f} ns")
@@ -0,0 +1,102 @@
+"""
+Benchmark of the memory held by idle tables: games that were played and
+then left waiting, as a long-running server keeps them. Each mode runs in fresh
+processes and reports the traced Python heap and, measured without
+tracing, the growth of the resident set per 1,000 tables:
+
+- grow-only: ArrayList.SHRINK_THRESHOLD = 0, capacities only ever double
+- shrink: the default hysteresis, hands that grew shrink back as
+  delete_at_index plays them down
+- shrink+fit: the default, and every hand is shrunk to fit once its game ends
+
+Usage: python -m benchmarks.bench_memory [tables] [games] [players]
+"""
+
+import subprocess
+import sys
+import tracemalloc
+
+from config import Config
+from data_structures import ArrayList
+from game import Game
+from player import Player
+from random_gen import RandomGen
+
+MODES = ("grow-only", "shrink", "shrink+fit")
+
+
+def resident_kib() -> int:
+    """The resident set size of this process in KiB, from /proc (Linux only)."""
+    with open("/proc/self/statm") as statm:
+        pages = int(statm.read().split()[1])
+    import resource
+
+    return pages * resource.getpagesize() // 1024
+
+
+def idle_tables(num_tables: int, num_games: int, num_players: int, fit: bool) -> list[Game]:
+    """Plays num_games seeded games at each of num_tables tables and leaves them idle."""
+    tables = []
+    for table in range(num_tables):
+        RandomGen.set_seed(table)
+        players = ArrayList(num_players)
+        for seat in range(num_players):
+            players.append(Player(str(seat)))
+        game = Game()
+        game.verbose = False
+        game.initialise_game(players)
+        for seed in range(num_games):
+            if seed:
+                game.reset(table * num_games + seed)
+            try:
+                game.play_game()
+            except Exception as error:
+                # the double discard of a drawn playable card can overfill the discard pile
+                if str(error) != "Stack is full":
+                    raise
+        if fit:
+            for seat in range(num_players):
+                game.seating[seat].hand.shrink_to_fit()
+        tables.append(game)
+    return tables
+
+
+def measure(mode: str, traced: bool, num_tables: int, num_games: int, num_players: int) -> float:
+    """Returns the traced heap, or without tracing the resident growth, in KiB per 1,000 tables."""
+    if mode == "grow-only":
+        ArrayList.SHRINK_THRESHOLD = 0
+    rss_before = resident_kib()
+    if traced:
+        tracemalloc.start()
+    tables = idle_tables(num_tables, num_games, num_players, mode == "shrink+fit")
+    if traced:
+        used = tracemalloc.get_traced_memory()[0] / 1024
+        tracemalloc.stop()
+    else:
+        used = resident_kib() - rss_before
+    assert len(tables) == num_tables
+    return 1000 * used / num_tables
+
+
+def run_child(mode: str, traced: bool, num_tables: int, num_games: int, num_players: int) -> float:
+    """Runs measure in a fresh process, so the modes do not share a heap."""
+    args = [mode, "heap" if traced else "rss", str(num_tables), str(num_games), str(num_players)]
+    out = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_memory", *args], capture_output=True, text=True, check=True
+    ).stdout
+    return float(out)
+
+
+if __name__ == "__main__":
+    Config.NUM_CARDS_AT_INIT = 7
+    if len(sys.argv) > 1 and sys.argv[1] in MODES:
+        print(measure(sys.argv[1], sys.argv[2] == "heap", *map(int, sys.argv[3:6])))
+    else:
+        num_tables = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+        num_games = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+        num_players = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+        print(f"{num_tables} tables of {num_players} players, idle after {num_games} games, per 1,000 tables:")
+        for mode in MODES:
+            heap = run_child(mode, True, num_tables, num_games, num_players)
+            rss = run_child(mode, False, num_tables, num_games, num_players)
+            print(f"{mode:10s} heap {heap / 1024:7.2f} MiB  resident {rss / 1024:7.2f} MiB")
@@ -0,0 +1,88 @@
+"""
+Benchmark of playing many games with a fresh Game per seed against one Game
+recycled with Game.reset, reporting the time per game and how many arrays
+and cards each run built per game.
+
+Usage: python -m benchmarks.bench_reset [games] [players]
+"""
+
+import sys
+import time
+
+from card import Card
+from config import Config
+from data_structures.referential_array import ArrayR
+from data_structures import ArrayList
+from game import Game
+from player import Player
+from random_gen import RandomGen
+
+
+built = [0]
+
+
+def counting(init):
+    """Wraps a constructor to count the objects it builds."""
+    def wrapper(self, *args, **kwargs):
+        built[0] += 1
+        init(self, *args, **kwargs)
+    return wrapper
+
+
+def run_fresh(num_games: int, num_players: int) -> tuple[float, int]:
+    """Builds new players, deck, board and hands for every game."""
+    built[0] = 0
+    start = time.perf_counter()
+    for seed in range(num_games):
+        RandomGen.set_seed(seed)
+        players = ArrayList(num_players)
+        for seat in range(num_players):
+            players.append(Player(str(seat)))
+        game = Game()
+        game.verbose = False
+        game.initialise_game(players)
+        try:
+            game.play_game()
+        except Exception as error:
+            # the double discard of a drawn playable card can overfill the discard pile
+            if str(error) != "Stack is full":
+                raise
+    elapsed = time.perf_counter() - start
+    return elapsed, built[0]
+
+
+def run_reset(num_games: int, num_players: int) -> tuple[float, int]:
+    """Deals every game into the deck, board and hands of the first one."""
+    built[0] = 0
+    start = time.perf_counter()
+    players = ArrayList(num_players)
+    for seat in range(num_players):
+        players.append(Player(str(seat)))
+    game = Game()
+    game.verbose = False
+    RandomGen.set_seed(0)
+    game.initialise_game(players)
+    for seed in range(num_games):
+        if seed:
+            game.reset(seed)
+        try:
+            game.play_game()
+        except Exception as error:
+            # the double discard of a drawn playable card can overfill the discard pile
+            if str(error) != "Stack is full":
+                raise
+    elapsed = time.perf_counter() - start
+    return elapsed, built[0]
+
+
+if __name__ == "__main__":
+    num_games = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    num_players = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    Config.NUM_CARDS_AT_INIT = 7
+    for name, run in (("fresh Game", run_fresh), ("Game.reset", run_reset)):
+        elapsed, _ = run(num_games, num_players)
+        array_init, card_init = ArrayR.__init__, Card.__init__
+        ArrayR.__init__, Card.__init__ = counting(array_init), counting(card_init)
+        _, objects = run(num_games, num_players)
+        ArrayR.__init__, Card.__init__ = array_init, card_init
+        print(f"{name}: {1e6 * elapsed / num_games:8.1f} us/game  {objects / num_games:7.1f} arrays and cards built per game")
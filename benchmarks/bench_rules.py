@@ -0,0 +1,54 @@
+"""
+Benchmark of the throughput of every registered rule set, so a house-rule
+variant can be checked to cost no more per turn than the standard rules.
+
+Usage: python -m benchmarks.bench_rules [games] [players]
+"""
+
+import sys
+import time
+
+from config import Config
+from data_structures import ArrayList
+from game import Game
+from player import Player
+from random_gen import RandomGen
+from rules import RULE_SETS, RuleSet
+
+
+def run(rules: RuleSet, num_games: int, num_players: int) -> tuple[int, int, float]:
+    """Plays seeded games under a rule set and returns the turns, errors and seconds spent playing."""
+    turns, errors, elapsed = 0, 0, 0.0
+    for seed in range(num_games):
+        RandomGen.set_seed(seed)
+        players = ArrayList(num_players)
+        for seat in range(num_players):
+            players.append(Player(str(seat)))
+        game = Game()
+        game.verbose = False
+        game.rules = rules
+        game.initialise_game(players)
+        start = time.perf_counter()
+        try:
+            game.play_game()
+        except Exception as error:
+            # the double discard of a drawn playable card can overfill the discard pile
+            if str(error) != "Stack is full":
+                raise
+            errors += 1
+        elapsed += time.perf_counter() - start
+        turns += game.turn_counter
+    return turns, errors, elapsed
+
+
+if __name__ == "__main__":
+    num_games = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    num_players = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    Config.NUM_CARDS_AT_INIT = 7
+    for name, rules in RULE_SETS.items():
+        best = min((run(rules, num_games, num_players) for _ in range(3)), key=lambda result: result[2] / result[0])
+        turns, errors, elapsed = best
+        print(
+            f"{name:10s} {1e6 * elapsed / turns:6.2f} us/turn  {turns / elapsed:10,.0f} turns/s  "
+            f"{turns / num_games:6.1f} turns/game  {errors} errors"
+        )
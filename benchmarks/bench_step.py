@@ -0,0 +1,79 @@
+"""
+Benchmark of the cost per turn of Game.step against the monolithic
+Game.play_game loop, and of round-robin scheduling many tables in one thread.
+
+Usage: python -m benchmarks.bench_step [tables] [players]
+"""
+
+import io
+import sys
+import time
+from contextlib import redirect_stdout
+
+from config import Config
+from data_structures import ArrayList, CircularQueue
+from game import Game, GameOutcome
+from player import Player
+from random_gen import RandomGen
+
+
+def new_game(seed: int, num_players: int) -> Game:
+    """Deals a seeded game."""
+    RandomGen.set_seed(seed)
+    players = ArrayList(num_players)
+    for seat in range(num_players):
+        players.append(Player(str(seat)))
+    game = Game()
+    game.initialise_game(players)
+    return game
+
+
+def run_monolithic(num_tables: int, num_players: int) -> tuple[int, float]:
+    """Plays each table to the end with play_game, one after another."""
+    turns, elapsed = 0, 0.0
+    for seed in range(num_tables):
+        game = new_game(seed, num_players)
+        start = time.perf_counter()
+        try:
+            game.play_game()
+        except Exception as error:
+            # the double discard of a drawn playable card can overfill the discard pile
+            if str(error) != "Stack is full":
+                raise
+        elapsed += time.perf_counter() - start
+        turns += game.turn_counter
+    return turns, elapsed
+
+
+def run_round_robin(num_tables: int, num_players: int) -> tuple[int, float]:
+    """Advances every live table by one step in turn until all have ended.
+    All tables share the global RandomGen, so their results differ from
+    the monolithic run; only the cost per turn is comparable.
+    """
+    tables = CircularQueue[Game](num_tables)
+    for seed in range(num_tables):
+        tables.append(new_game(seed, num_players))
+    turns = 0
+    start = time.perf_counter()
+    while not tables.is_empty():
+        game = tables.serve()
+        turns += 1
+        try:
+            if game.step() is None and game.outcome == GameOutcome.PLAYING:
+                tables.append(game)
+        except Exception as error:
+            # the double discard of a drawn playable card can overfill the discard pile
+            if str(error) != "Stack is full":
+                raise
+    return turns, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    num_tables = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    num_players = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    Config.NUM_CARDS_AT_INIT = 7
+    with redirect_stdout(io.StringIO()):
+        mono_turns, mono_time = run_monolithic(num_tables, num_players)
+        rr_turns, rr_time = run_round_robin(num_tables, num_players)
+    print(f"play_game:          {1e6 * mono_time / mono_turns:8.2f} us/turn")
+    print(f"step, round-robin:  {1e6 * rr_time / rr_turns:8.2f} us/turn ({num_tables} live tables)")
@@ -0,0 +1,62 @@
+"""
+Report of the element operations the data structures perform per game,
+counted by the instrumented ADTs of data_structures/instrumented.py rather
+than timed, so the numbers are exact and the same on every machine.
+
+Usage: python -m benchmarks.report_ops [games] [players]
+"""
+
+import os
+import sys
+
+# Must be set before data_structures is first imported
+os.environ["UNO_COUNT_OPS"] = "1"
+
+from config import Config
+from data_structures import ArrayList
+from data_structures.instrumented import COUNTS, OpReport
+from game import Game
+from game_board import GameBoard
+from player import Player
+from random_gen import RandomGen
+
+
+def play(num_games: int, num_players: int) -> tuple[OpReport, int, int]:
+    """Plays seeded games and returns the operations under play_card and reshuffle, the turns and the errors."""
+    report = OpReport()
+    report.watch(Player, "play_card")
+    report.watch(GameBoard, "reshuffle")
+    turns, errors = 0, 0
+    try:
+        for seed in range(num_games):
+            RandomGen.set_seed(seed)
+            players = ArrayList(num_players)
+            for seat in range(num_players):
+                players.append(Player(str(seat)))
+            game = Game()
+            game.verbose = False
+            game.initialise_game(players)
+            try:
+                game.play_game()
+            except Exception as error:
+                # the double discard of a drawn playable card can overfill the discard pile
+                if str(error) != "Stack is full":
+                    raise
+                errors += 1
+            turns += game.turn_counter
+    finally:
+        report.close()
+    return report, turns, errors
+
+
+if __name__ == "__main__":
+    num_games = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    num_players = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    Config.NUM_CARDS_AT_INIT = 7
+    report, turns, errors = play(num_games, num_players)
+    print(f"{num_games} games, {errors} errors, {turns / num_games:.1f} turns/game, operations per game:")
+    for key, totals in report.totals.items():
+        per_game = "  ".join(f"{field} {value / num_games:9.1f}" for field, value in totals.as_dict().items())
+        print(f"{key:20s} calls {report.calls[key] / num_games:7.2f}  {per_game}")
+    everything = "  ".join(f"{field} {value / num_games:9.1f}" for field, value in COUNTS.as_dict().items())
+    print(f"{'all':20s} {'':13s}  {everything}")
@@ -4,12 +4,23 @@ This module defines the fundamental components of a playing card for the game.
 It includes the `Card` class, which represents a single card with a color and
 a label. It also defines two enumerations, `CardColor` and `CardLabel`, to
 provide a set of constant, valid values for card attributes.
+
+Every card also has a packed integer code, color * NUM_LABELS + label, which
+orders cards the same way as comparing (color, label) and is used to encode
+cards compactly. The current color and label of a game pack the same way, so
+the module precomputes `PLAYABLE`, indexed by (current code, candidate code).
+Since codes order like (color, label), `Player.play_card` prefers cards by
+comparing their codes directly.
+
+A card stores only its code, a plain int, and the engine core works on codes
+and plain ints; `Card.color` and `Card.label` turn the code back into
+`CardColor` and `CardLabel` members for callers that want enums.
 """
 
 from __future__ import annotations
 from enum import auto, IntEnum
 from config import Config
-from data_structures import *
+from data_structures.referential_array import ArrayR
 
 class CardColor(IntEnum):
     """
@@ -68,6 +79,24 @@ class CardLabel(IntEnum):
         return self.name
 
 
+NUM_LABELS = len(CardLabel)
+NUM_CARD_CODES = len(CardColor) * NUM_LABELS
+
+# Plain-int copies of the members the engine core compares against. Reading a
+# member off an IntEnum class costs an attribute lookup through the enum
+# machinery every time; these are ordinary globals. COLORS and LABELS turn an
+# int back into its member with a tuple index instead of an enum call, which is
+# how Card and Game convert at the API boundary.
+BLACK = int(CardColor.BLACK)
+NINE = int(CardLabel.NINE)
+SKIP = int(CardLabel.SKIP)
+REVERSE = int(CardLabel.REVERSE)
+DRAW_TWO = int(CardLabel.DRAW_TWO)
+DRAW_FOUR = int(CardLabel.DRAW_FOUR)
+COLORS = tuple(CardColor)
+LABELS = tuple(CardLabel)
+
+
 class Card:
     def __init__(self, color: CardColor, label: CardLabel) -> None:
         """
@@ -83,10 +112,62 @@ class Card:
         Complexity:
             Best Case: O(1)
             Worst Case: O(1)
-            Explanation: Assignment operations are constant time
+            Explanation: Only the packed code is stored, as a plain int
+        """
+        self.code = int(color) * NUM_LABELS + int(label)
+
+    @property
+    def color(self) -> CardColor:
+        """
+        The color of the card, converted from its code.
+
+        Complexity:
+            Best Case: O(1)
+            Worst Case: O(1)
+            Explanation: One division and one tuple index into COLORS
+        """
+        return COLORS[self.code // NUM_LABELS]
+
+    @property
+    def label(self) -> CardLabel:
+        """
+        The label of the card, converted from its code.
+
+        Complexity:
+            Best Case: O(1)
+            Worst Case: O(1)
+            Explanation: One modulo and one tuple index into LABELS
         """
-        self.color = color
-        self.label = label
+        return LABELS[self.code % NUM_LABELS]
+
+    @classmethod
+    def from_code(cls, code: int) -> Card:
+        """
+        Create a card from its packed code.
+
+        Args:
+            code (int): The packed code, color * NUM_LABELS + label.
+
+        Returns:
+            Card: The card with the color and label encoded by the code.
+
+        Complexity:
+            Best Case: O(1)
+            Worst Case: O(1)
+            Explanation: The code is stored as it is, without going through the enums
+        """
+        card = cls.__new__(cls)
+        card.code = int(code)
+        return card
+
+    def __reduce__(self) -> tuple:
+        """
+        Pickle the card as its packed code only.
+
+        Returns:
+            tuple: The callable and arguments that rebuild the card.
+        """
+        return Card.from_code, (self.code,)
 
     def __str__(self) -> str:
         """
@@ -118,4 +199,120 @@ class Card:
         Returns:
             bool: True if this card is equal to the other card, False otherwise.
         """
-        return self.color == other.color and self.label == other.label
+        return self.code == other.code
+
+
+def card_code(color: CardColor, label: CardLabel) -> int:
+    """
+    Pack a color and a label into a card code.
+
+    Args:
+        color (CardColor): The color of the card or the current color.
+        label (CardLabel): The label of the card or the current label.
+
+    Returns:
+        int: color * NUM_LABELS + label
+
+    Complexity:
+        Best Case: O(1)
+        Worst Case: O(1)
+        Explanation: Integer arithmetic is constant time
+    """
+    return color * NUM_LABELS + label
+
+
+def is_playable(card: Card, current_color: CardColor, current_label: CardLabel) -> bool:
+    """
+    Reference playability rule, kept for differential tests of PLAYABLE.
+
+    Args:
+        card (Card): The candidate card.
+        current_color (CardColor): The current color of the game.
+        current_label (CardLabel): The current label of the game.
+
+    Returns:
+        bool: True if the card matches the color or label, or is BLACK.
+
+    Complexity:
+        Best Case: O(1)
+        Worst Case: O(1)
+        Explanation: Three enum comparisons are constant time
+    """
+    return card.color == current_color or card.color == CardColor.BLACK or card.label == current_label
+
+
+def _build_playable() -> ArrayR[int]:
+    """
+    Build the flattened playability table, PLAYABLE[current * NUM_CARD_CODES + candidate].
+
+    Complexity:
+        Best Case: O(C^2), where C is NUM_CARD_CODES
+        Worst Case: O(C^2), where C is NUM_CARD_CODES
+        Explanation: is_playable is evaluated once for every pair of codes
+    """
+    table = ArrayR.lookup_table("B", NUM_CARD_CODES * NUM_CARD_CODES)
+    for current in range(NUM_CARD_CODES):
+        top = Card.from_code(current)
+        for candidate in range(NUM_CARD_CODES):
+            table[current * NUM_CARD_CODES + candidate] = is_playable(
+                Card.from_code(candidate), top.color, top.label
+            )
+    return table
+
+
+PLAYABLE = _build_playable()
+
+
+_DECK_TEMPLATES: dict[int, ArrayR[Card]] = {}
+
+
+def deck_template(decks: int = 1) -> ArrayR[Card]:
+    """
+    Return the canonical ordered cards of a table playing with several decks.
+
+    The template is built on the first request for a number of decks and cached,
+    so Game.generate_cards only bulk copies it. Every card is its own Card object,
+    and since cards are never mutated, games may share them.
+
+    Args:
+        decks (int): The number of decks shuffled together, e.g. 2 or 4 for 20+ players.
+
+    Returns:
+        ArrayR[Card]: Config.DECK_SIZE * decks cards, deck after deck, each in the order
+        Game.generate_cards has always dealt them: per color, two of each number then
+        two rounds of SKIP, REVERSE and DRAW_TWO, and finally four rounds of CRAZY and DRAW_FOUR.
+
+    Raises:
+        ValueError: If decks is not positive or a deck does not have Config.DECK_SIZE cards.
+
+    Complexity:
+        Best Case: O(1) once the template is cached
+        Worst Case: O(N), where N is Config.DECK_SIZE * decks, to build it the first time
+    """
+    template = _DECK_TEMPLATES.get(decks)
+    if template is not None:
+        return template
+    if decks <= 0:
+        raise ValueError("A table needs at least one deck.")
+    template = ArrayR[Card](Config.DECK_SIZE * decks)
+    idx = 0
+    for _ in range(decks):
+        for color in CardColor:
+            if color != CardColor.BLACK:
+                for label in range(CardLabel.NINE + 1):
+                    for _ in range(2):
+                        template[idx] = Card(color, CardLabel(label))
+                        idx += 1
+                for _ in range(2):
+                    for label in (CardLabel.SKIP, CardLabel.REVERSE, CardLabel.DRAW_TWO):
+                        template[idx] = Card(color, label)
+                        idx += 1
+            else:
+                for _ in range(4):
+                    for label in (CardLabel.CRAZY, CardLabel.DRAW_FOUR):
+                        template[idx] = Card(color, label)
+                        idx += 1
+    if idx != len(template):
+        raise ValueError(f"Deck has {idx // decks} cards, expected {Config.DECK_SIZE}")
+    _DECK_TEMPLATES[decks] = template
+    return template
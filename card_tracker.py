@@ -0,0 +1,341 @@
+"""
+This module contains the `CardCounter` and `CardTracker` classes, which keep
+card counts up to date as a `Game` is played.
+
+A `CardCounter` is a multiset of card codes with running totals per color and
+per label, so the number of cards playable against any color and label is an
+inclusion-exclusion of four counters and every query is O(1).
+
+The `CardTracker` is a `GameObserver` that keeps one counter for the real
+contents of the draw pile, for analytics, and one counter per player of the
+cards that player has not seen: the draw pile plus the other hands. A card
+stops being unseen for a player when it enters their hand or the discard
+pile, and a reshuffle makes the discard pile unseen again. Both views answer
+"P(next draw playable)" and "expected draws until playable" in O(1).
+"""
+
+from __future__ import annotations
+from card import Card, CardColor, NUM_CARD_CODES, NUM_LABELS, card_code
+from data_structures.referential_array import ArrayR
+from observer import GameObserver
+
+
+class CardCounter:
+    """
+    CardCounter class to count cards by code, color and label
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor for the CardCounter class
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(C), where C is NUM_CARD_CODES
+            Worst Case Complexity: O(C)
+        """
+        self.counts = ArrayR.typed("h", NUM_CARD_CODES)
+        self.color_counts = ArrayR.typed("h", len(CardColor))
+        self.label_counts = ArrayR.typed("h", NUM_LABELS)
+        self.total = 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of cards counted
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return self.total
+
+    def __getitem__(self, code: int) -> int:
+        """
+        Returns the number of cards counted with a code
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return self.counts[code]
+
+    def add(self, code: int, count: int = 1) -> None:
+        """
+        Method to count cards of a code
+
+        Args:
+            code (int): The card code
+            count (int): The number of cards, negative to remove them
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.counts[code] += count
+        self.color_counts[code // NUM_LABELS] += count
+        self.label_counts[code % NUM_LABELS] += count
+        self.total += count
+
+    def remove(self, code: int) -> None:
+        """
+        Method to stop counting one card of a code
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.add(code, -1)
+
+    def clear(self) -> None:
+        """
+        Method to reset every count to zero
+
+        Complexity:
+            Best Case Complexity: O(C), where C is NUM_CARD_CODES
+            Worst Case Complexity: O(C)
+        """
+        for code in range(NUM_CARD_CODES):
+            self.counts[code] = 0
+        for color in range(len(self.color_counts)):
+            self.color_counts[color] = 0
+        for label in range(NUM_LABELS):
+            self.label_counts[label] = 0
+        self.total = 0
+
+    def playable(self, current_color: CardColor, current_label: int) -> int:
+        """
+        Method to count the cards playable against a color and label
+
+        Args:
+            current_color (CardColor): The current color of the game
+            current_label (CardLabel): The current label of the game
+
+        Returns:
+            int: The number of cards that match the color or the label, or are BLACK
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+            Explanation: The cards of the color, the BLACK cards and the cards of the label
+            are added, and the cards counted twice (the label in the color and in BLACK) taken off
+        """
+        black = CardColor.BLACK
+        count = self.color_counts[black] + self.label_counts[current_label] - self.counts[card_code(black, current_label)]
+        if current_color != black:
+            count += self.color_counts[current_color] - self.counts[card_code(current_color, current_label)]
+        return count
+
+    def probability(self, current_color: CardColor, current_label: int) -> float:
+        """
+        Method to compute the probability that a random counted card is playable
+
+        Args:
+            current_color (CardColor): The current color of the game
+            current_label (CardLabel): The current label of the game
+
+        Returns:
+            float: The probability, 0.0 if nothing is counted
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if self.total == 0:
+            return 0.0
+        return self.playable(current_color, current_label) / self.total
+
+    def expected_draws(self, current_color: CardColor, current_label: int) -> float:
+        """
+        Method to compute the expected number of draws, without replacement, up
+        to and including the first playable card
+
+        Args:
+            current_color (CardColor): The current color of the game
+            current_label (CardLabel): The current label of the game
+
+        Returns:
+            float: (N + 1) / (K + 1) for N cards of which K are playable, or inf if K is 0
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        playable = self.playable(current_color, current_label)
+        if playable == 0:
+            return float("inf")
+        return (self.total + 1) / (playable + 1)
+
+
+class CardTracker(GameObserver):
+    """
+    CardTracker class to count the draw pile and the cards each player has not seen
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor for the CardTracker class
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(C), where C is NUM_CARD_CODES
+            Worst Case Complexity: O(C)
+        """
+        self.game = None
+        self.pile = CardCounter()
+        self.unseen: dict = {}
+        self.in_flight: Card | None = None
+
+    def attached(self, game) -> None:
+        """
+        Method to count the piles and hands of a game from scratch
+
+        Args:
+            game (Game): The game the tracker is attached to
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(PC + PH + PD), where P is the number of players, C is NUM_CARD_CODES,
+            H the number of cards in hands and D in the draw pile
+            Worst Case Complexity: O(PC + PH + PD)
+        """
+        self.game = game
+        self.unseen = {}
+        for i in range(len(game.seating)):
+            self.unseen[game.seating[i]] = CardCounter()
+        self.in_flight = None
+        self.reshuffled(game.game_board)
+
+    def card_added(self, player, card: Card) -> None:
+        """
+        Method to mark a card as seen by the player whose hand it entered
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.in_flight = None
+        self.unseen[player].remove(card.code)
+
+    def card_removed(self, player, card: Card) -> None:
+        """
+        Method to mark a played card as seen by the other players
+
+        Complexity:
+            Best Case Complexity: O(P), where P is the number of players
+            Worst Case Complexity: O(P)
+        """
+        for other, unseen in self.unseen.items():
+            if other is not player:
+                unseen.remove(card.code)
+
+    def card_drawn(self, game_board, card: Card) -> None:
+        """
+        Method to take a card off the draw pile count
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.pile.remove(card.code)
+        self.in_flight = card
+
+    def card_discarded(self, game_board, card: Card) -> None:
+        """
+        Method to mark a card discarded straight from the draw pile as seen by
+        every player; a card played from a hand was handled by card_removed
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(P), where P is the number of players
+        """
+        if card is self.in_flight:
+            self.in_flight = None
+            for unseen in self.unseen.values():
+                unseen.remove(card.code)
+
+    def reshuffled(self, game_board) -> None:
+        """
+        Method to recount after the discard pile became the draw pile
+
+        Complexity:
+            Best Case Complexity: O(PC + PH + PD), see attached
+            Worst Case Complexity: O(PC + PH + PD)
+            Explanation: The reshuffle itself is O(DlogD), so recounting adds no extra order
+        """
+        draw_pile = game_board.draw_pile
+        self.pile.clear()
+        for i in range(len(draw_pile)):
+            self.pile.add(draw_pile.array[i].code)
+        for player, unseen in self.unseen.items():
+            unseen.clear()
+            for code in range(NUM_CARD_CODES):
+                if self.pile[code]:
+                    unseen.add(code, self.pile[code])
+            for other in self.unseen:
+                if other is not player:
+                    for i in range(len(other.hand)):
+                        unseen.add(other.hand[i].code)
+
+    def counter(self, player=None) -> CardCounter:
+        """
+        Method to get the counts seen by a player, or the real draw pile
+
+        Args:
+            player (Player | None): The player, or None for the real contents of the draw pile
+
+        Returns:
+            CardCounter: The counts
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return self.pile if player is None else self.unseen[player]
+
+    def draw_probability(self, player=None) -> float:
+        """
+        Method to compute P(next draw playable) against the current color and label
+
+        Args:
+            player (Player | None): The player estimating from the cards they have
+            not seen, or None for the real contents of the draw pile
+
+        Returns:
+            float: The probability
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return self.counter(player).probability(self.game.current_color, self.game.current_label)
+
+    def expected_draws(self, player=None) -> float:
+        """
+        Method to compute the expected number of draws until a playable card
+
+        Args:
+            player (Player | None): As for draw_probability
+
+        Returns:
+            float: The expected number of draws, see CardCounter.expected_draws
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return self.counter(player).expected_draws(self.game.current_color, self.game.current_label)
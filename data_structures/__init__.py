@@ -1,6 +1,44 @@
-from data_structures.array_list import ArrayList
-from data_structures.array_sorted_list import ArraySortedList
-from data_structures.aset import ASet
-from data_structures.bset import BSet
-from data_structures.queue_adt import CircularQueue
-from data_structures.stack_adt import ArrayStack
+"""The array-based ADTs of the game.
+
+The classes are loaded on first access (PEP 562 module __getattr__), so
+`from data_structures import ArrayList` imports array_list.py and its own
+dependencies only, and short-lived processes do not pay for the ADTs they
+never use.
+"""
+
+from os import environ as _environ
+
+__all__ = ["ArrayList", "ArraySortedList", "ASet", "BSet", "CircularQueue", "ArrayStack"]
+
+_MODULES = {
+    "ArrayList": "data_structures.array_list",
+    "ArraySortedList": "data_structures.array_sorted_list",
+    "ASet": "data_structures.aset",
+    "BSet": "data_structures.bset",
+    "CircularQueue": "data_structures.queue_adt",
+    "ArrayStack": "data_structures.stack_adt",
+}
+
+
+def __getattr__(name: str):
+    """Imports the module of an exported class on first access and caches the class.
+    :raises AttributeError: if name is not exported
+    :complexity: O(1) after the first access, which is cached in the module
+    """
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(__import__(module, fromlist=[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+# Opt-in operation counting, see data_structures/instrumented.py
+if _environ.get("UNO_COUNT_OPS"):
+    from data_structures.instrumented import install as _install
+
+    ArrayList, ArraySortedList, ASet, BSet, CircularQueue, ArrayStack = _install()
@@ -3,6 +3,8 @@
 __author__ = "Maria Garcia de la Banda, modified by Brendon Taylor, Graeme Gange, and Alexey Ignatiev"
 __docformat__ = "reStructuredText"
 
+from array import array
+from typing import Sequence
 from data_structures.abstract_list import *
 from data_structures.referential_array import ArrayR
 
@@ -15,17 +17,32 @@ class ArrayList(List[T]):
          array (ArrayR[T]): array storing the elements of the list
 
     ArrayR cannot create empty arrays. So MIN_CAPCITY used to avoid this.
+    Passing a typecode backs the list with a typed ArrayR (see ArrayR.typed).
+
+    A full list grows its capacity GROWTH_FACTOR times. Once deletions leave
+    it at most SHRINK_THRESHOLD full, it shrinks to GROWTH_FACTOR times its
+    length, but never below GROWTH_FACTOR ** 2 times the capacity it was
+    created with, so a list that ballooned gives the memory back while one
+    that moves within its usual sizes never reallocates. Keeping
+    SHRINK_THRESHOLD below 1 / GROWTH_FACTOR leaves a gap between the two,
+    so alternating appends and deletions cannot resize every time. clear
+    keeps the storage for the next fill; shrink_to_fit gives it back. Both
+    can be overridden on a subclass or an instance; a SHRINK_THRESHOLD of 0
+    never shrinks.
     """
 
     MIN_CAPACITY = 1
+    GROWTH_FACTOR = 2
+    SHRINK_THRESHOLD = 0.25
 
-    def __init__(self, capacity: int = 1) -> None:
+    def __init__(self, capacity: int = 1, typecode: str | None = None) -> None:
         """Initialises self.length by calling its parent and
         self.array as an ArrayList of appropriate capacity
         :complexity: O(len(self)) always due to the ArrarR call
         """
         List.__init__(self)
-        self.array = ArrayR(max(self.MIN_CAPACITY, capacity))
+        self.min_capacity = max(self.MIN_CAPACITY, capacity)
+        self.array = ArrayR(self.min_capacity, typecode)
 
     def __getitem__(self, index: int) -> T:
         """Returns the value of the element at position index
@@ -45,6 +62,27 @@ class ArrayList(List[T]):
             raise IndexError("Out of bounds access in array.")
         self.array[index] = value
 
+    def __getstate__(self) -> dict:
+        """Pickles only the live elements of the list, its capacity and the
+        capacity it does not shrink below.
+        :complexity: O(len(self))
+        """
+        return {
+            "capacity": len(self.array),
+            "min_capacity": self.min_capacity,
+            "typecode": self.array.typecode,
+            "items": self.array[: len(self)],
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        """Rebuilds the list from the state made by __getstate__.
+        :complexity: O(capacity)
+        """
+        ArrayList.__init__(self, state["capacity"], state["typecode"])
+        self.min_capacity = state["min_capacity"]
+        self.length = len(state["items"])
+        self.array[: self.length] = state["items"]
+
     def __shuffle_right(self, index: int) -> None:
         """Shuffles all the items to the right from index
         :complexity best: O(1) shuffle from the end of the list
@@ -65,16 +103,17 @@ class ArrayList(List[T]):
 
     def __resize(self) -> None:
         """
-        If the list is full, doubles the internal capacity of the list,
-        copying all existing elements. Does nothing if the list is not full.
+        If the list is full, grows the internal capacity of the list
+        GROWTH_FACTOR times, copying all existing elements. Does nothing if
+        the list is not full.
 
         :post:       Capacity is strictly greater than the list length.
         :complexity: Worst case O(N), for list of length N.
         """
 
         if len(self) == len(self.array):
-            new_cap = int(2 * len(self.array))
-            new_array = ArrayR(new_cap)
+            new_cap = max(len(self.array) + 1, int(self.GROWTH_FACTOR * len(self.array)))
+            new_array = ArrayR(new_cap, self.array.typecode)
             for i in range(len(self)):
                 new_array[i] = self.array[i]
             self.array = new_array
@@ -82,6 +121,79 @@ class ArrayList(List[T]):
             self.array
         ), "Capacity not greater than length after __resize."
 
+    def __shrink(self) -> None:
+        """
+        If the list is at most SHRINK_THRESHOLD full and larger than
+        GROWTH_FACTOR ** 2 times its initial capacity, moves its elements to
+        an array GROWTH_FACTOR times their number, but no smaller than that.
+
+        :post:       Capacity is at least the list length.
+        :complexity: O(1) if it does not shrink, O(C) otherwise, where C is
+                     the new capacity
+        """
+        capacity = len(self.array)
+        if self.SHRINK_THRESHOLD <= 0 or self.length > capacity * self.SHRINK_THRESHOLD:
+            return
+        floor = int(self.GROWTH_FACTOR ** 2 * self.min_capacity)
+        if capacity > floor:
+            self.__reallocate(max(floor, int(self.GROWTH_FACTOR * self.length)))
+
+    def __reallocate(self, capacity: int) -> None:
+        """Moves the elements to a new array of the given capacity with one
+        slice copy.
+        :pre: capacity >= len(self)
+        :complexity: O(capacity)
+        """
+        new_array = ArrayR(capacity, self.array.typecode)
+        new_array[: len(self)] = self.array[: len(self)]
+        self.array = new_array
+
+    def shrink_to_fit(self) -> None:
+        """Reduces the capacity to the length of the list (MIN_CAPACITY if
+        empty), e.g. for a list that stays idle. The list may still grow
+        afterwards, and no longer shrinks on its own below the new capacity.
+        :complexity: O(len(self))
+        """
+        capacity = max(self.MIN_CAPACITY, len(self))
+        if capacity < len(self.array):
+            self.__reallocate(capacity)
+        self.min_capacity = min(self.min_capacity, capacity)
+
+    def clear(self) -> None:
+        """Empties the list, keeping its storage so that refilling it does not
+        reallocate. Call shrink_to_fit afterwards to release it.
+        :complexity: O(1)
+        """
+        List.clear(self)
+
+    def extend(self, items: "ArrayR[T] | ArrayList[T] | Sequence[T]") -> None:
+        """Appends every item of an array, another list or a plain sequence
+        (e.g. a slice of an array), in order, with one slice copy, growing the
+        capacity at most once.
+        :complexity: O(N) where N is len(items), O(len(self) + N) if it grows
+        """
+        if isinstance(items, ArrayList):
+            chunk = items.array[: len(items)]
+        elif isinstance(items, ArrayR):
+            chunk = items[:]
+        else:
+            chunk = items
+        if self.array.typecode is not None and not isinstance(chunk, array):
+            chunk = array(self.array.typecode, chunk)
+        end = len(self) + len(chunk)
+        if end > len(self.array):
+            self.__reallocate(max(end, int(self.GROWTH_FACTOR * len(self.array))))
+        self.array[len(self) : end] = chunk
+        self.length = end
+
+    def view(self) -> memoryview:
+        """Returns a zero-copy memoryview over the elements of a typed list.
+        The view is invalidated by a resize.
+        :raises TypeError: if the list stores references
+        :complexity: O(1)
+        """
+        return self.array.view()[: len(self)]
+
     def is_full(self):
         """Returns true if the list is full
         :complexity: O(1)
@@ -102,15 +214,24 @@ class ArrayList(List[T]):
 
     def delete_at_index(self, index: int) -> T:
         """Moves self[j+1] to self[j] if j>index, returns old self[index].
-        Do shuffling by means of self.__shuffle_left().
+        Do shuffling by means of self.__shuffle_left(), then lets
+        self.__shrink() shrink the list if it is mostly empty.
         :pre: index is 0 <= index < len(self) - this is checked by __getitem__() !
-        :complexity: O(len(self) - index)
+        :complexity: O(len(self) - index) if no shrinking needed, O(len(self)) otherwise
         """
         item = self[index]
         self.length -= 1
         self.__shuffle_left(index)
+        self.__shrink()
         return item
 
+    def append(self, item: T) -> None:
+        """Appends item at the end of the list, growing it first if it is full.
+        :complexity best: O(1) if the list has room
+        :complexity worst: O(N) if it grows, where N is len(self)
+        """
+        self.insert(len(self), item)
+
     def insert(self, index: int, item: T) -> None:
         """Moves self[j] to self[j+1] if j>=index & sets self[index]=item.
         Do shuffling by means of self.__shuffle_right().
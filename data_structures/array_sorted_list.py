@@ -51,7 +51,10 @@ class ArraySortedList(SortedList[T]):
             raise IndexError("Element should be inserted in sorted order")
 
     def __contains__(self, item: T) -> bool:
-        """Checks if value is in the list."""
+        """Checks if value is in the list.
+        :complexity best: O(1) if item is first
+        :complexity worst: O(N) if item is absent, where N is len(self)
+        """
         for i in range(len(self)):
             if self.array[i] == item:
                 return True
@@ -80,7 +83,10 @@ class ArraySortedList(SortedList[T]):
         self.array = new_array
 
     def delete_at_index(self, index: int) -> T:
-        """Delete item at a given position."""
+        """Delete item at a given position.
+        :complexity best: O(1) when deleting the last item
+        :complexity worst: O(N) when deleting the first, where N is len(self)
+        """
         if index >= len(self):
             raise IndexError("No such index in the list")
         item = self.array[index]
@@ -89,7 +95,10 @@ class ArraySortedList(SortedList[T]):
         return item
 
     def index(self, item: T) -> int:
-        """Find the position of a given item in the list."""
+        """Find the position of a given item in the list.
+        :complexity best: O(1) if item is in the middle
+        :complexity worst: O(logN), where N is len(self)
+        """
         pos = self._index_to_add(item)
         if pos < len(self) and self[pos] == item:
             return pos
@@ -100,7 +109,10 @@ class ArraySortedList(SortedList[T]):
         return len(self) >= len(self.array)
 
     def add(self, item: T) -> None:
-        """Add new element to the list."""
+        """Add new element to the list.
+        :complexity best: O(logN) when item goes last and the list is not full
+        :complexity worst: O(N) when item goes first or the list resizes, where N is len(self)
+        """
         if self.is_full():
             self._resize()
 
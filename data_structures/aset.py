@@ -34,7 +34,10 @@ class ASet(Set[T]):
         return len(self) == 0
 
     def __contains__(self, item: T) -> bool:
-        """True if the set contains the item."""
+        """True if the set contains the item.
+        :complexity best: O(1) if item was added first
+        :complexity worst: O(N) if item is absent, where N is len(self)
+        """
         for i in range(self.size):
             if item == self.array[i]:
                 return True
@@ -53,6 +56,8 @@ class ASet(Set[T]):
         present in the set should not be added.
         :pre: the set is not full
         :raises Exception: if the set is full.
+        :complexity best: O(1) if item was added first
+        :complexity worst: O(N) if item is absent, where N is len(self)
         """
         if item not in self:
             if self.is_full():
@@ -77,6 +82,8 @@ class ASet(Set[T]):
     def union(self, other: ASet[T]) -> ASet[T]:
         """Creates a new set equal to the union with another one,
         i.e. the result set should contains the elements of self and other.
+        :complexity: O(N + N * M), where N is len(self) and M is len(other),
+                     since every element of other is looked up in self
         """
         res = ASet(len(self.array) + len(other.array))
 
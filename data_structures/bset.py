@@ -30,6 +30,8 @@ class BSet(Set[int]):
     def __contains__(self, item: int) -> bool:
         """True if the set contains the item.
         :raises TypeError: if the item is not integer or if not positive.
+        :complexity: O(1) while elems fits in a machine word, O(W) in general,
+                     where W is the number of words of elems
         """
         if not isinstance(item, int) or item <= 0:
             raise TypeError("Set elements should be integers")
@@ -49,6 +51,8 @@ class BSet(Set[int]):
     def add(self, item: int) -> None:
         """Adds an element to the set.
         :raises TypeError: if the item is not integer or if not positive.
+        :complexity: O(1) while elems fits in a machine word, O(W) in general,
+                     where W is the number of words of elems
         """
         if not isinstance(item, int) or item <= 0:
             raise TypeError("Set elements should be integers")
@@ -69,6 +73,7 @@ class BSet(Set[int]):
     def union(self, other: BSet[int]) -> BSet[int]:
         """Creates a new set equal to the union with another one,
         i.e. the result set should contains the elements of self and other.
+        :complexity: O(W), where W is the number of words of the larger set
         """
         res = BSet()
         res.elems = self.elems | other.elems
@@ -0,0 +1,367 @@
+""" Operation-counting versions of the array-based ADTs.
+
+Setting the environment variable UNO_COUNT_OPS (to anything but an empty
+string) before `data_structures` is first imported makes the package
+install the subclasses below in place of ArrayR, ArrayList,
+ArraySortedList, ArrayStack, CircularQueue, ASet and BSet, so every
+module that imports them gets the counting version. Without it nothing
+here is imported, and the plain classes run with no overhead at all.
+
+Each instrumented object counts into its own `ops` (an OpCounts) and into
+the global COUNTS:
+
+- reads and writes of elements, one per element for a slice
+- shifts, the elements moved one place by an insertion or a deletion
+- comparisons of a searched item with an element
+- resizes, the times a container grew or shrank its array
+
+A container adopts every array assigned to its `array` attribute, so the
+reads and writes of its array are counted on the container, including
+arrays it takes over from another container (see GameBoard.reshuffle).
+
+Lookup tables the engine computes once, e.g. card.PLAYABLE and the
+Zobrist keys, are built by ArrayR.lookup_table as a LookupArrayR, which
+counts nothing, so their reads are not taken for operations of the ADTs.
+
+`OpReport` wraps chosen methods to total the operations run under each,
+e.g. per game:
+```
+report = OpReport()
+report.watch(Player, "play_card")
+game.play_game()
+print(report)
+```
+"""
+
+__docformat__ = "reStructuredText"
+
+from typing import Callable
+from data_structures import array_list, array_sorted_list, aset, bset, queue_adt, referential_array, stack_adt
+from data_structures.array_list import ArrayList
+from data_structures.array_sorted_list import ArraySortedList
+from data_structures.aset import ASet
+from data_structures.bset import BSet
+from data_structures.queue_adt import CircularQueue
+from data_structures.referential_array import ArrayR, T
+from data_structures.stack_adt import ArrayStack
+
+
+class OpCounts:
+    """Counts of element operations.
+
+    Attributes:
+         reads, writes, shifts, comparisons, resizes (int): see the module docstring
+    """
+
+    FIELDS = ("reads", "writes", "shifts", "comparisons", "resizes")
+
+    def __init__(self) -> None:
+        """Starts every count at 0.
+        :complexity: O(1)
+        """
+        self.reads = 0
+        self.writes = 0
+        self.shifts = 0
+        self.comparisons = 0
+        self.resizes = 0
+
+    def copy(self) -> "OpCounts":
+        """Returns a snapshot of the counts.
+        :complexity: O(1)
+        """
+        counts = OpCounts()
+        counts.add(self)
+        return counts
+
+    def add(self, other: "OpCounts") -> None:
+        """Adds the counts of other to these.
+        :complexity: O(1)
+        """
+        for field in self.FIELDS:
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+
+    def __sub__(self, other: "OpCounts") -> "OpCounts":
+        """Returns the operations counted between snapshot other and these.
+        :complexity: O(1)
+        """
+        counts = OpCounts()
+        for field in self.FIELDS:
+            setattr(counts, field, getattr(self, field) - getattr(other, field))
+        return counts
+
+    def clear(self) -> None:
+        """Resets every count to 0.
+        :complexity: O(1)
+        """
+        OpCounts.__init__(self)
+
+    def as_dict(self) -> dict[str, int]:
+        """Returns the counts keyed by field name.
+        :complexity: O(1)
+        """
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __str__(self) -> str:
+        return " ".join(f"{field}={getattr(self, field)}" for field in self.FIELDS)
+
+
+COUNTS = OpCounts()
+_installed = False
+
+
+class LookupArrayR(ArrayR[T]):
+    """ArrayR of a lookup table, made by ArrayR.lookup_table; nothing is counted."""
+
+
+class CountingArrayR(ArrayR[T]):
+    """ArrayR that counts its element reads and writes."""
+
+    def __init__(self, length: int, typecode: str | None = None) -> None:
+        ArrayR.__init__(self, length, typecode)
+        self.ops = OpCounts()
+        self.adopted = False
+
+    @classmethod
+    def lookup_table(cls, typecode: str, length: int) -> LookupArrayR[int]:
+        """Creates the uncounted array of a lookup table.
+        :complexity: O(length)
+        """
+        return LookupArrayR(length, typecode)
+
+    def __getitem__(self, index: int) -> T:
+        item = self.array[index]
+        count = len(item) if isinstance(index, slice) else 1
+        self.ops.reads += count
+        COUNTS.reads += count
+        return item
+
+    def __setitem__(self, index: int, value: T) -> None:
+        self.array[index] = value
+        count = len(value) if isinstance(index, slice) else 1
+        self.ops.writes += count
+        COUNTS.writes += count
+
+    def __getstate__(self) -> tuple:
+        """Pickles the array with the counts it is attributed to and whether
+        a container adopted them.
+        :complexity: O(length)
+        """
+        return ArrayR.__getstate__(self), self.ops, self.adopted
+
+    def __setstate__(self, state: tuple) -> None:
+        """Rebuilds the array and restores its attribution. A container
+        pickled with its array keeps sharing the same counts with it.
+        :complexity: O(length)
+        """
+        array_state, ops, adopted = state
+        ArrayR.__setstate__(self, array_state)
+        self.ops = ops
+        self.adopted = adopted
+
+
+class _Counting:
+    """Mixin giving a container an `ops` shared with the arrays it holds."""
+
+    def __setattr__(self, name: str, value) -> None:
+        """Adopts an array assigned to `array`. The operations of an array the
+        container built (e.g. the copies of a resize) move to the container;
+        those of an array taken from another container stay with that one.
+        """
+        if name == "array" and isinstance(value, CountingArrayR) and value.ops is not self.ops:
+            if not value.adopted:
+                self.ops.add(value.ops)
+            value.ops = self.ops
+            value.adopted = True
+        object.__setattr__(self, name, value)
+
+    @property
+    def ops(self) -> OpCounts:
+        """The counts of this container, created on first use.
+        :complexity: O(1)
+        """
+        counts = self.__dict__.get("_ops")
+        if counts is None:
+            counts = self.__dict__["_ops"] = OpCounts()
+        return counts
+
+    def _count(self, field: str, amount: int = 1) -> None:
+        """Adds amount to a field of self.ops and of COUNTS.
+        :complexity: O(1)
+        """
+        setattr(self.ops, field, getattr(self.ops, field) + amount)
+        setattr(COUNTS, field, getattr(COUNTS, field) + amount)
+
+    def _compared(self, method: Callable, *args):
+        """Calls method, counting each element it read as a comparison.
+        :complexity: O(1) on top of method
+        """
+        before = self.ops.reads
+        try:
+            return method(self, *args)
+        finally:
+            self._count("comparisons", self.ops.reads - before)
+
+
+class CountingArrayList(_Counting, ArrayList[T]):
+    """ArrayList that counts shifts, comparisons in index, and resizes both ways."""
+
+    def _ArrayList__shuffle_right(self, index: int) -> None:
+        self._count("shifts", len(self) - index)
+        ArrayList._ArrayList__shuffle_right(self, index)
+
+    def _ArrayList__shuffle_left(self, index: int) -> None:
+        self._count("shifts", len(self) - index)
+        ArrayList._ArrayList__shuffle_left(self, index)
+
+    def _ArrayList__resize(self) -> None:
+        if self.is_full():
+            self._count("resizes")
+        ArrayList._ArrayList__resize(self)
+
+    def _ArrayList__reallocate(self, capacity: int) -> None:
+        self._count("resizes")
+        ArrayList._ArrayList__reallocate(self, capacity)
+
+    def index(self, item: T) -> int:
+        return self._compared(ArrayList.index, item)
+
+
+class CountingArraySortedList(_Counting, ArraySortedList[T]):
+    """ArraySortedList that counts shifts, comparisons and resizes."""
+
+    def _shuffle_right(self, index: int) -> None:
+        self._count("shifts", len(self) - index)
+        ArraySortedList._shuffle_right(self, index)
+
+    def _shuffle_left(self, index: int) -> None:
+        self._count("shifts", len(self) - index)
+        ArraySortedList._shuffle_left(self, index)
+
+    def _resize(self) -> None:
+        self._count("resizes")
+        ArraySortedList._resize(self)
+
+    def _index_to_add(self, item: T) -> int:
+        return self._compared(ArraySortedList._index_to_add, item)
+
+    def __contains__(self, item: T) -> bool:
+        return self._compared(ArraySortedList.__contains__, item)
+
+
+class CountingArrayStack(_Counting, ArrayStack[T]):
+    """ArrayStack whose reads and writes are counted by its array."""
+
+
+class CountingCircularQueue(_Counting, CircularQueue[T]):
+    """CircularQueue whose reads and writes are counted by its array."""
+
+
+class CountingASet(_Counting, ASet[T]):
+    """ASet that counts the comparisons of its membership test."""
+
+    def __contains__(self, item: T) -> bool:
+        return self._compared(ASet.__contains__, item)
+
+
+class CountingBSet(_Counting, BSet):
+    """BSet that counts a bit test as a read and a comparison, and a bit update as a write."""
+
+    def __contains__(self, item: int) -> bool:
+        self._count("reads")
+        self._count("comparisons")
+        return BSet.__contains__(self, item)
+
+    def add(self, item: int) -> None:
+        self._count("writes")
+        BSet.add(self, item)
+
+    def remove(self, item: int) -> None:
+        self._count("writes")
+        BSet.remove(self, item)
+
+
+def install() -> tuple:
+    """Rebinds the ADT names of the data_structures modules to the counting
+    subclasses, so that the arrays the ADTs build for themselves count too.
+    Called by data_structures/__init__.py when UNO_COUNT_OPS is set.
+    :returns: ArrayList, ArraySortedList, ASet, BSet, CircularQueue, ArrayStack
+    :complexity: O(1)
+    """
+    global _installed
+    for module in (referential_array, array_list, array_sorted_list, aset, queue_adt, stack_adt):
+        module.ArrayR = CountingArrayR
+    array_list.ArrayList = CountingArrayList
+    array_sorted_list.ArraySortedList = CountingArraySortedList
+    aset.ASet = CountingASet
+    bset.BSet = CountingBSet
+    queue_adt.CircularQueue = CountingCircularQueue
+    stack_adt.ArrayStack = CountingArrayStack
+    _installed = True
+    return (
+        CountingArrayList,
+        CountingArraySortedList,
+        CountingASet,
+        CountingBSet,
+        CountingCircularQueue,
+        CountingArrayStack,
+    )
+
+
+def installed() -> bool:
+    """True if the counting classes replaced the plain ones at import time.
+    :complexity: O(1)
+    """
+    return _installed
+
+
+class OpReport:
+    """Totals the operations counted while chosen methods run.
+
+    Attributes:
+         totals (dict[str, OpCounts]): the operations under each watched method
+         calls (dict[str, int]): the number of calls of each watched method
+    """
+
+    def __init__(self) -> None:
+        """Creates a report that watches nothing yet.
+        :complexity: O(1)
+        """
+        self.totals: dict[str, OpCounts] = {}
+        self.calls: dict[str, int] = {}
+        self.__watched: list[tuple[type, str, Callable]] = []
+
+    def watch(self, owner: type, name: str) -> None:
+        """Wraps owner.name to add the operations of every call to the report.
+        Calls nested in another watched method count for both.
+        :raises RuntimeError: if the counting classes are not installed
+        :complexity: O(1)
+        """
+        if not _installed:
+            raise RuntimeError("Set UNO_COUNT_OPS before data_structures is imported to count operations")
+        key = f"{owner.__name__}.{name}"
+        method = owner.__dict__[name]
+        totals = self.totals[key] = OpCounts()
+        self.calls[key] = 0
+
+        def counted(*args, **kwargs):
+            before = COUNTS.copy()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                totals.add(COUNTS - before)
+                self.calls[key] += 1
+
+        counted.__doc__ = method.__doc__
+        setattr(owner, name, counted)
+        self.__watched.append((owner, name, method))
+
+    def close(self) -> None:
+        """Restores every watched method.
+        :complexity: O(W) where W is the number of watched methods
+        """
+        while self.__watched:
+            owner, name, method = self.__watched.pop()
+            setattr(owner, name, method)
+
+    def __str__(self) -> str:
+        return "\n".join(f"{key:28s} calls={self.calls[key]} {self.totals[key]}" for key in self.totals)
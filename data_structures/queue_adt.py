@@ -1,13 +1,12 @@
 """ Queue ADT and an array implementation.
 
 Defines a generic abstract queue with the usual methods, and implements
-a circular queue using arrays. Also defines UnitTests for the class.
+a circular queue using arrays.
 """
 
 __author__ = "Maria Garcia de la Banda for the base" + "XXXXX student for"
 __docformat__ = "reStructuredText"
 
-import unittest
 from abc import ABC, abstractmethod
 from typing import Generic
 from data_structures.referential_array import ArrayR, T
@@ -62,20 +61,44 @@ class CircularQueue(Queue[T]):
          array (ArrayR[T]): array storing the elements of the queue
 
     ArrayR cannot create empty arrays. So MIN_CAPACITY used to avoid this.
+    Passing a typecode backs the queue with a typed ArrayR (see ArrayR.typed).
     """
 
     MIN_CAPACITY = 1
 
-    def __init__(self, max_capacity: int) -> None:
+    def __init__(self, max_capacity: int, typecode: str | None = None) -> None:
         Queue.__init__(self)
         self.front = 0
         self.rear = 0
-        self.array = ArrayR(max(self.MIN_CAPACITY, max_capacity))
+        self.array = ArrayR(max(self.MIN_CAPACITY, max_capacity), typecode)
+
+    def __getstate__(self) -> dict:
+        """Pickles only the live elements of the queue, front first."""
+        end = self.front + len(self)
+        if end <= len(self.array):
+            items = self.array[self.front : end]
+        else:
+            items = self.array[self.front :] + self.array[: end - len(self.array)]
+        return {
+            "capacity": len(self.array),
+            "typecode": self.array.typecode,
+            "items": items,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        """Rebuilds the queue from the state made by __getstate__,
+        with its front moved back to the start of the array.
+        """
+        CircularQueue.__init__(self, state["capacity"], state["typecode"])
+        self.length = len(state["items"])
+        self.array[: self.length] = state["items"]
+        self.rear = self.length % len(self.array)
 
     def append(self, item: T) -> None:
         """Adds an element to the rear of the queue.
         :pre: queue is not full
         :raises Exception: if the queue is full
+        :complexity: O(1)
         """
         if self.is_full():
             raise Exception("Queue is full")
@@ -88,6 +111,7 @@ class CircularQueue(Queue[T]):
         """Deletes and returns the element at the queue's front.
         :pre: queue is not empty
         :raises Exception: if the queue is empty
+        :complexity: O(1)
         """
         if self.is_empty():
             raise Exception("Queue is empty")
@@ -107,6 +131,28 @@ class CircularQueue(Queue[T]):
 
         return self.array[self.front]
 
+    def peek_at(self, offset: int) -> T:
+        """Returns the element offset places behind the queue's front.
+        :pre: 0 <= offset < len(self)
+        :raises IndexError: if there is no such element
+        :complexity: O(1)
+        """
+        if offset < 0 or offset >= len(self):
+            raise IndexError("Out of bounds access in queue.")
+        return self.array[(self.front + offset) % len(self.array)]
+
+    def views(self) -> tuple[memoryview, memoryview]:
+        """Returns zero-copy memoryviews of a typed queue, front first.
+        The elements may wrap around the end of the array, so they are
+        split into the run starting at front and the run that wrapped.
+        :raises TypeError: if the queue stores references
+        """
+        buffer = self.array.view()
+        end = self.front + len(self)
+        if end <= len(self.array):
+            return buffer[self.front : end], buffer[0:0]
+        return buffer[self.front :], buffer[: end - len(self.array)]
+
     def is_full(self) -> bool:
         """True if the queue is full and no element can be appended."""
         return len(self) == len(self.array)
@@ -116,95 +162,3 @@ class CircularQueue(Queue[T]):
         Queue.__init__(self)
         self.front = 0
         self.rear = 0
-
-
-class TestQueue(unittest.TestCase):
-    """Tests for the above class."""
-
-    EMPTY = 0
-    ROOMY = 5
-    LARGE = 10
-    CAPACITY = 20
-
-    def setUp(self) -> None:
-        self.lengths = [self.EMPTY, self.ROOMY, self.LARGE, self.ROOMY, self.LARGE]
-        self.queues = [CircularQueue(self.CAPACITY) for i in range(len(self.lengths))]
-        for queue, length in zip(self.queues, self.lengths):
-            for i in range(length):
-                queue.append(i)
-        self.empty_queue = self.queues[0]
-        self.roomy_queue = self.queues[1]
-        self.large_queue = self.queues[2]
-        # we build empty queues from clear.
-        # this is an indirect way of testing if clear works!
-        # (perhaps not the best)
-        self.clear_queue = self.queues[3]
-        self.clear_queue.clear()
-        self.lengths[3] = 0
-        self.queues[4].clear()
-        self.lengths[4] = 0
-
-    def tearDown(self) -> None:
-        for s in self.queues:
-            s.clear()
-
-    def test_init(self) -> None:
-        self.assertTrue(self.empty_queue.is_empty())
-        self.assertEqual(len(self.empty_queue), 0)
-
-    def test_len(self) -> None:
-        """Tests the length of all queues created during setup."""
-        for queue, length in zip(self.queues, self.lengths):
-            self.assertEqual(len(queue), length)
-
-    def test_is_empty_add(self) -> None:
-        """Tests queues that have been created empty/non-empty."""
-        self.assertTrue(self.empty_queue.is_empty())
-        self.assertFalse(self.roomy_queue.is_empty())
-        self.assertFalse(self.large_queue.is_empty())
-
-    def test_is_empty_clear(self) -> None:
-        """Tests queues that have been cleared."""
-        for queue in self.queues:
-            queue.clear()
-            self.assertTrue(queue.is_empty())
-
-    def test_is_empty_serve(self) -> None:
-        """Tests queues that have been served completely."""
-        for queue in self.queues:
-            # we empty the queue
-            try:
-                while True:
-                    was_empty = queue.is_empty()
-                    queue.serve()
-                    # if we have served without raising an assertion,
-                    # then the queue was not empty.
-                    self.assertFalse(was_empty)
-            except:
-                self.assertTrue(queue.is_empty())
-
-    def test_is_full_add(self) -> None:
-        """Tests queues that have been created not full."""
-        self.assertFalse(self.empty_queue.is_full())
-        self.assertFalse(self.roomy_queue.is_full())
-        self.assertFalse(self.large_queue.is_full())
-
-    def test_append_and_serve(self) -> None:
-        for queue in self.queues:
-            nitems = self.ROOMY
-            for i in range(nitems):
-                queue.append(i)
-            for i in range(nitems):
-                self.assertEqual(queue.serve(), i)
-
-    def test_clear(self) -> None:
-        for queue in self.queues:
-            queue.clear()
-            self.assertEqual(len(queue), 0)
-            self.assertTrue(queue.is_empty())
-
-
-if __name__ == "__main__":
-    testtorun = TestQueue()
-    suite = unittest.TestLoader().loadTestsFromModule(testtorun)
-    unittest.TextTestRunner().run(suite)
@@ -12,6 +12,12 @@ space to hold the references.
 Note that while I do check the precondition in __init__ (noone else
 would), I do not check that of getitem or setitem, since that is already
 checked by self.array[index].
+
+Typed arrays (see ArrayR.typed) swap the py_object storage for an
+array.array of machine values. They hold plain numbers only, use
+itemsize bytes per element instead of a pointer plus a boxed object, and
+expose the buffer protocol so that memoryview and NumPy can read them
+without copying.
 """
 
 __author__ = (
@@ -19,6 +25,7 @@ __author__ = (
 )
 __docformat__ = "reStructuredText"
 
+from array import array
 from ctypes import py_object
 from typing import TypeVar, Generic
 
@@ -26,15 +33,66 @@ T = TypeVar("T")
 
 
 class ArrayR(Generic[T]):
-    def __init__(self, length: int) -> None:
+    def __init__(self, length: int, typecode: str | None = None) -> None:
         """Creates an array of references to objects of the given length
+        If typecode is given, the array stores numbers of that array.array
+        typecode instead of references, initialised to 0.
         :complexity: O(length) for best/worst case to initialise to None
         :pre: length > 0
         """
         if length <= 0:
             raise ValueError("Array length should be larger than 0.")
-        self.array = (length * py_object)()  # initialises the space
-        self.array[:] = [None for _ in range(length)]
+        self.typecode = typecode
+        if typecode is None:
+            self.array = (length * py_object)()  # initialises the space
+            self.array[:] = [None for _ in range(length)]
+        else:
+            self.array = array(typecode, bytes(length * array(typecode).itemsize))
+
+    @classmethod
+    def typed(cls, typecode: str, length: int) -> "ArrayR[int]":
+        """Creates a typed array of the given array.array typecode and length,
+        e.g. ArrayR.typed('B', 112) for one byte per card code.
+        :complexity: O(length) for best/worst case to initialise to 0
+        :pre: length > 0
+        """
+        return cls(length, typecode)
+
+    @classmethod
+    def lookup_table(cls, typecode: str, length: int) -> "ArrayR[int]":
+        """Creates a typed array for a table computed once and only read
+        afterwards, e.g. card.PLAYABLE. When UNO_COUNT_OPS installs the
+        counting arrays this makes an uncounted one, so that operation counts
+        hold the operations of the ADTs and not the lookups of the engine.
+        :complexity: O(length) for best/worst case to initialise to 0
+        :pre: length > 0
+        """
+        return cls(length, typecode)
+
+    def is_typed(self) -> bool:
+        """True if the array stores typed numbers rather than references.
+        :complexity: O(1)
+        """
+        return self.typecode is not None
+
+    def view(self) -> memoryview:
+        """Returns a zero-copy memoryview over the whole typed array.
+        :complexity: O(1)
+        :raises TypeError: if the array stores references
+        """
+        if self.typecode is None:
+            raise TypeError("Only typed arrays can be viewed as a buffer.")
+        return memoryview(self.array)
+
+    def to_numpy(self):
+        """Returns a NumPy array sharing memory with this typed array.
+        NumPy is only imported here, so it stays an optional dependency.
+        :complexity: O(1)
+        :raises TypeError: if the array stores references
+        """
+        import numpy
+
+        return numpy.frombuffer(self.view(), dtype=self.typecode)
 
     def __len__(self) -> int:
         """Returns the length of the array
@@ -56,6 +114,26 @@ class ArrayR(Generic[T]):
         """
         self.array[index] = value
 
+    def __getstate__(self) -> tuple:
+        """Pickles the typecode, length and contents of the array.
+        Typed arrays travel as raw machine bytes.
+        :complexity: O(length)
+        """
+        if self.typecode is None:
+            return None, len(self), self.array[:]
+        return self.typecode, len(self), self.array.tobytes()
+
+    def __setstate__(self, state: tuple) -> None:
+        """Rebuilds the array from the state made by __getstate__.
+        :complexity: O(length)
+        """
+        typecode, length, items = state
+        _PlainArrayR.__init__(self, length, typecode)
+        if typecode is None:
+            self.array[:] = items
+        else:
+            self.array = array(typecode, items)
+
     def index(self, item: T) -> int:
         for index, arr_item in enumerate(self.array):
             if arr_item == item:
@@ -71,3 +149,8 @@ class ArrayR(Generic[T]):
 
         ret_str = ret_str[:-2] + "]"
         return ret_str
+
+
+# instrumented.install rebinds ArrayR in this module to its counting subclass,
+# __setstate__ initialises every array as the plain class does
+_PlainArrayR = ArrayR
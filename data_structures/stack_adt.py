@@ -1,13 +1,12 @@
 """ Stack ADT and an array implementation.
 
 Defines a generic abstract stack with the usual methods, and implements
-a stack using arrays. Also defines UnitTests for the class.
+a stack using arrays.
 """
 
 __author__ = "Maria Garcia de la Banda for the base" + "XXXXX student for"
 __docformat__ = "reStructuredText"
 
-import unittest
 from abc import ABC, abstractmethod
 from typing import TypeVar, Generic
 from data_structures.referential_array import ArrayR, T
@@ -58,21 +57,36 @@ class ArrayStack(Stack[T]):
          array (ArrayR[T]): array storing the elements of the queue
 
     ArrayR cannot create empty arrays. So MIN_CAPACITY used to avoid this.
+    Passing a typecode backs the stack with a typed ArrayR (see ArrayR.typed).
     """
 
     MIN_CAPACITY = 1
 
-    def __init__(self, max_capacity: int) -> None:
+    def __init__(self, max_capacity: int, typecode: str | None = None) -> None:
         """Initialises the length and the array with the given capacity.
         If max_capacity is 0, the array is created with MIN_CAPACITY.
         """
         Stack.__init__(self)
-        self.array = ArrayR(max(self.MIN_CAPACITY, max_capacity))
+        self.array = ArrayR(max(self.MIN_CAPACITY, max_capacity), typecode)
 
     def is_full(self) -> bool:
         """True if the stack is full and no element can be pushed."""
         return len(self) == len(self.array)
 
+    def __getstate__(self) -> dict:
+        """Pickles only the live elements of the stack, bottom first."""
+        return {
+            "capacity": len(self.array),
+            "typecode": self.array.typecode,
+            "items": self.array[: len(self)],
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        """Rebuilds the stack from the state made by __getstate__."""
+        ArrayStack.__init__(self, state["capacity"], state["typecode"])
+        self.length = len(state["items"])
+        self.array[: self.length] = state["items"]
+
     def push(self, item: T) -> None:
         """Pushes an element to the top of the stack.
         :pre: stack is not full
@@ -102,94 +116,40 @@ class ArrayStack(Stack[T]):
             raise Exception("Stack is empty")
         return self.array[self.length - 1]
 
-
-class TestStack(unittest.TestCase):
-    """Tests for the above class."""
-
-    EMPTY = 0
-    ROOMY = 5
-    LARGE = 10
-    CAPACITY = 20
-
-    def setUp(self) -> None:
-        self.lengths = [self.EMPTY, self.ROOMY, self.LARGE, self.ROOMY, self.LARGE]
-        self.stacks = [ArrayStack(self.CAPACITY) for i in range(len(self.lengths))]
-        for stack, length in zip(self.stacks, self.lengths):
-            for i in range(length):
-                stack.push(i)
-        self.empty_stack = self.stacks[0]
-        self.roomy_stack = self.stacks[1]
-        self.large_stack = self.stacks[2]
-        # we build empty stacks from clear.
-        # this is an indirect way of testing if clear works!
-        # (perhaps not the best)
-        self.clear_stack = self.stacks[3]
-        self.clear_stack.clear()
-        self.lengths[3] = 0
-        self.stacks[4].clear()
-        self.lengths[4] = 0
-
-    def tearDown(self) -> None:
-        for s in self.stacks:
-            s.clear()
-
-    def test_init(self) -> None:
-        self.assertTrue(self.empty_stack.is_empty())
-        self.assertEqual(len(self.empty_stack), 0)
-
-    def test_len(self) -> None:
-        """Tests the length of all stacks created during setup."""
-        for stack, length in zip(self.stacks, self.lengths):
-            self.assertEqual(len(stack), length)
-
-    def test_is_empty_add(self) -> None:
-        """Tests stacks that have been created empty/non-empty."""
-        self.assertTrue(self.empty_stack.is_empty())
-        self.assertFalse(self.roomy_stack.is_empty())
-        self.assertFalse(self.large_stack.is_empty())
-
-    def test_is_empty_clear(self) -> None:
-        """Tests stacks that have been cleared."""
-        for stack in self.stacks:
-            stack.clear()
-            self.assertTrue(stack.is_empty())
-
-    def test_is_empty_pop(self) -> None:
-        """Tests stacks that have been popped completely."""
-        for stack in self.stacks:
-            # we empty the stack
-            try:
-                while True:
-                    was_empty = stack.is_empty()
-                    stack.pop()
-                    # if we have popped without raising an assertion,
-                    # then the stack was not empty.
-                    self.assertFalse(was_empty)
-            except:
-                self.assertTrue(stack.is_empty())
-
-    def test_is_full_add(self) -> None:
-        """Tests stacks that have been created not full."""
-        self.assertFalse(self.empty_stack.is_full())
-        self.assertFalse(self.roomy_stack.is_full())
-        self.assertFalse(self.large_stack.is_full())
-
-    def test_push_and_pop(self) -> None:
-        for stack in self.stacks:
-            nitems = self.ROOMY
-            for i in range(nitems):
-                stack.push(i)
-            for i in range(nitems - 1, -1, -1):
-                self.assertEqual(stack.pop(), i)
-
-    def test_clear(self) -> None:
-        for stack in self.stacks:
-            stack.clear()
-            self.assertEqual(len(stack), 0)
-            self.assertTrue(stack.is_empty())
-
-
-if __name__ == "__main__":
-    testtorun = TestStack()
-    suite = unittest.TestLoader().loadTestsFromModule(testtorun)
-    unittest.TextTestRunner().run(suite)
+    def pop_many(self, count: int) -> "list[T]":
+        """Pops count elements with one slice copy and returns them in the
+        order repeated pops would have, the top first.
+        :pre: stack holds at least count elements
+        :raises Exception: if the stack holds fewer than count elements
+        :complexity: O(count)
+        """
+        if count > len(self):
+            raise Exception("Stack is empty")
+        items = self.array[self.__top(count)]
+        self.length -= count
+        return items
+
+    def pop_many_into(self, count: int, array: ArrayR[T], start: int) -> None:
+        """Pops count elements like pop_many, but writes them straight into
+        array[start : start + count] instead of returning them.
+        :pre: stack holds at least count elements and array has room for them
+        :raises Exception: if the stack holds fewer than count elements
+        :complexity: O(count)
+        """
+        if count > len(self):
+            raise Exception("Stack is empty")
+        array[start : start + count] = self.array[self.__top(count)]
+        self.length -= count
+
+    def __top(self, count: int) -> slice:
+        """Returns the slice of the top count elements, the top first."""
+        if count == 0:
+            return slice(0, 0)
+        bottom = self.length - count
+        return slice(self.length - 1, bottom - 1 if bottom > 0 else None, -1)
+
+    def view(self) -> memoryview:
+        """Returns a zero-copy memoryview of a typed stack, bottom first.
+        :raises TypeError: if the stack stores references
+        """
+        return self.array.view()[: len(self)]
@@ -0,0 +1,497 @@
+"""
+This module contains the `EndgameSolver` class, a bounded-depth search of the
+end of a two-player `Game` that proves wins and losses where it can, and the
+`EndgamePlayer` that switches to it once both hands are small.
+
+In simulation the draw pile order and the `RandomGen` seed are known, so
+every draw, reshuffle and black card color that follows a choice of card is
+determined and the game has no chance nodes left: the only decisions are
+which playable card each player plays. The solver copies the position into a
+compact `EndgamePosition` of packed card codes, replays the rules of
+`Game.step` on it (including the drawn playable card being discarded twice)
+and runs a negamax search. Values are WIN, LOSS or UNKNOWN (depth or node
+budget reached, or a state in which the engine would raise), and alpha-beta
+prunes on these three values: a winning move cuts off its siblings, and once
+a move is known to be UNKNOWN the other moves are only searched far enough to
+tell whether they win. The move stored for a position is tried first, then
+the moves that keep the turn, and WIN and LOSS are always proven.
+Sub-results are cached in a `TranspositionTable`, where WIN and LOSS are
+stored as proven at any depth and kept across the solves of a game. The
+search deepens four plies at a time within a node budget, which bounds each
+solve to a few milliseconds; forced draws do not use up depth, since they do
+not branch.
+
+The search is not exact: many endgames only end after long runs of draws, so
+proving them takes far more plies than the budget allows. With hands of up to
+5 cards about 40% of solves are proven (see benchmarks/bench_endgame.py; at
+14 plies about half are, at a p99 near a second). An unproven solve returns
+the best move of the deepest completed iteration, the first move not proven
+to lose, and EndgamePlayer only plays greedily when no iteration completed.
+"""
+
+from __future__ import annotations
+from bisect import insort
+from card import Card, CardColor, CardLabel, NUM_CARD_CODES, NUM_LABELS, PLAYABLE
+from config import Config
+from game_board import ReshuffleMode
+from observer import GameObserver
+from player import Player
+from random_gen import RandomGen
+from rules import STANDARD
+from transposition import TranspositionTable, NO_MOVE
+from zobrist import MASK_64, zobrist_keys
+
+WIN, UNKNOWN, LOSS = 1, 0, -1
+PROVEN = 30000
+WON, ERROR, AGAIN, PASS = range(4)
+DISCARD_KEYS = zobrist_keys(NUM_CARD_CODES, 0xD15CA2D)
+KEEPS_TURN = bytes(
+    code % NUM_LABELS in (CardLabel.SKIP, CardLabel.DRAW_TWO, CardLabel.DRAW_FOUR) for code in range(NUM_CARD_CODES)
+)
+
+
+class EndgamePosition:
+    """
+    EndgamePosition class holding a two-player position on packed card codes,
+    seen from the player to move
+    """
+
+    __slots__ = ("mine", "theirs", "state", "pile", "pile_key", "top", "discard", "discard_key", "seed")
+
+    def __init__(
+        self, mine: tuple, theirs: tuple, state: int, pile: tuple, discard: tuple, seed: int
+    ) -> None:
+        """
+        Constructor for the EndgamePosition class
+
+        Args:
+            mine (tuple): The sorted codes of the hand of the player to move
+            theirs (tuple): The sorted codes of the other hand
+            state (int): The code of the current color and label
+            pile (tuple): The codes of the draw pile, top card first
+            discard (tuple): The codes of the discard pile
+            seed (int): The RandomGen seed
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(D), where D is the number of cards in both piles
+            Worst Case Complexity: O(D)
+        """
+        self.mine = mine
+        self.theirs = theirs
+        self.state = state
+        self.pile = pile
+        self.pile_key = hash(pile)
+        self.top = 0
+        self.discard = discard
+        self.discard_key = 0
+        for code in discard:
+            self.discard_key = (self.discard_key + DISCARD_KEYS[code]) & MASK_64
+        self.seed = seed
+
+    def copy(self) -> EndgamePosition:
+        """
+        Method to copy the position; the piles are immutable and shared
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        other = EndgamePosition.__new__(EndgamePosition)
+        other.mine, other.theirs, other.state = self.mine, self.theirs, self.state
+        other.pile, other.pile_key, other.top = self.pile, self.pile_key, self.top
+        other.discard, other.discard_key, other.seed = self.discard, self.discard_key, self.seed
+        return other
+
+    def key(self) -> int:
+        """
+        Method to hash the position; the discard pile enters as a multiset since
+        a reshuffle sorts it first
+
+        Complexity:
+            Best Case Complexity: O(H), where H is the number of cards in both hands
+            Worst Case Complexity: O(H)
+        """
+        return hash((self.mine, self.theirs, self.state, self.pile_key, self.top, self.discard_key, self.seed)) & MASK_64
+
+    def moves(self) -> list[int]:
+        """
+        Method to list the distinct playable codes in the hand to move, the ones
+        that keep the turn first
+
+        Returns:
+            list[int]: The codes, empty if the player has to draw
+
+        Complexity:
+            Best Case Complexity: O(H), where H is the length of self.mine
+            Worst Case Complexity: O(H)
+        """
+        state = self.state * NUM_CARD_CODES
+        keeping, passing = [], []
+        previous = -1
+        for code in self.mine:
+            if code != previous and PLAYABLE[state + code]:
+                if KEEPS_TURN[code]:
+                    keeping.append(code)
+                else:
+                    passing.append(code)
+            previous = code
+        return keeping + passing
+
+    def swap(self) -> None:
+        """
+        Method to hand the turn to the other player
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.mine, self.theirs = self.theirs, self.mine
+
+    def __discard(self, code: int) -> None:
+        """Appends a code to the discard pile.
+        :complexity: O(D), where D is the length of the discard pile
+        """
+        self.discard += (code,)
+        self.discard_key = (self.discard_key + DISCARD_KEYS[code]) & MASK_64
+
+    def __random(self) -> int:
+        """Advances the seed like RandomGen.random.
+        :complexity: O(1)
+        """
+        self.seed = (RandomGen.A * self.seed + RandomGen.C) % RandomGen.MOD
+        return self.seed >> 16
+
+    def draw(self) -> int:
+        """
+        Method to draw the top code, reshuffling the discard pile like
+        GameBoard.reshuffle and RandomGen.random_shuffle when the pile is empty
+
+        Returns:
+            int: The code drawn, or -1 where the engine would raise because the
+            discard pile is empty or too large for the draw pile
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(DlogD), where D is the length of the discard pile
+        """
+        if self.top == len(self.pile):
+            if len(self.discard) == 0 or len(self.discard) > Config.DECK_SIZE:
+                return -1
+            cards = sorted(self.discard)
+            positions = [(self.__random(), i) for i in range(len(cards))]
+            positions.sort()
+            self.pile = tuple(cards[i] for _, i in positions)
+            self.pile_key = hash(self.pile)
+            self.top = 0
+            self.discard = ()
+            self.discard_key = 0
+        code = self.pile[self.top]
+        self.top += 1
+        return code
+
+    def __resolve(self, code: int) -> int:
+        """
+        Discards a played code and applies its effect for two players, returning
+        AGAIN if the player to move keeps the turn, PASS if not, or ERROR.
+        :complexity: O(D) amortised, O(DlogD) when a penalty draw reshuffles
+        """
+        self.__discard(code)
+        label = code % NUM_LABELS
+        if code // NUM_LABELS == CardColor.BLACK:
+            self.state = (self.__random() % 4) * NUM_LABELS + label
+            penalty = 4 if label == CardLabel.DRAW_FOUR else 0
+        else:
+            self.state = code
+            penalty = 2 if label == CardLabel.DRAW_TWO else 0
+        if penalty:
+            theirs = list(self.theirs)
+            for _ in range(penalty):
+                drawn = self.draw()
+                if drawn < 0:
+                    return ERROR
+                insort(theirs, drawn)
+            self.theirs = tuple(theirs)
+            return AGAIN
+        return AGAIN if label == CardLabel.SKIP else PASS
+
+    def play(self, code: int) -> int:
+        """
+        Method to play a code from the hand to move
+
+        Args:
+            code (int): A playable code from self.mine
+
+        Returns:
+            int: WON if the hand is now empty, otherwise AGAIN, PASS or ERROR
+
+        Complexity:
+            Best Case Complexity: O(H + D), where H is the length of self.mine and D of the discard pile
+            Worst Case Complexity: O(H + DlogD)
+        """
+        i = self.mine.index(code)
+        self.mine = self.mine[:i] + self.mine[i + 1:]
+        if len(self.mine) == 0:
+            return WON
+        return self.__resolve(code)
+
+    def draw_turn(self) -> int:
+        """
+        Method to draw for the player to move, playing the card if it is
+        playable; as in Game.step, a drawn playable card is discarded twice
+
+        Returns:
+            int: AGAIN, PASS or ERROR
+
+        Complexity:
+            Best Case Complexity: O(H + D), where H is the length of self.mine and D of the discard pile
+            Worst Case Complexity: O(H + DlogD)
+        """
+        code = self.draw()
+        if code < 0:
+            return ERROR
+        if PLAYABLE[self.state * NUM_CARD_CODES + code]:
+            self.__discard(code)
+            return self.__resolve(code)
+        mine = list(self.mine)
+        insort(mine, code)
+        self.mine = tuple(mine)
+        return PASS
+
+
+class EndgameSolver(GameObserver):
+    """
+    EndgameSolver class to search the end of a two-player game to a bounded depth
+    """
+
+    DEPTH_STEP = 4
+
+    def __init__(
+        self, threshold: int = 5, max_plies: int = 40, max_nodes: int = 600, max_bytes: int = 1 << 20
+    ) -> None:
+        """
+        Constructor for the EndgameSolver class
+
+        Args:
+            threshold (int): The hand size at or below which both hands must be for the solver to apply
+            max_plies (int): The depth limit of the search, beyond which positions are UNKNOWN
+            max_nodes (int): The number of positions one solve may search
+            max_bytes (int): The memory budget of the transposition table
+
+        Returns:
+            None
+        """
+        self.threshold = threshold
+        self.max_plies = max_plies
+        self.max_nodes = max_nodes
+        self.table = TranspositionTable(max_bytes)
+        self.game = None
+        self.nodes = 0
+        self.budget = 0
+
+    def attached(self, game) -> None:
+        """
+        Method to remember the game to solve
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.game = game
+
+    def applies(self, player: Player) -> bool:
+        """
+        Method to check whether the solver should choose the moves of a player
+
+        Args:
+            player (Player): The player to move
+
+        Returns:
+            bool: True if the game has two players, both hands are at or below the
+            threshold, the deck and wild colors come from one random stream,
+            reshuffles are not lazy, so the draws can be replayed, and the game
+            plays the standard rules the solver models
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if self.game is None or len(self.game.seating) != 2 or self.game.deck_random is not self.game.color_random:
+            return False
+        if self.game.game_board.reshuffle_mode == ReshuffleMode.LAZY or self.game.rules is not STANDARD:
+            return False
+        seating = self.game.seating
+        return seating[0].cards_in_hand() <= self.threshold and seating[1].cards_in_hand() <= self.threshold
+
+    def position(self, player: Player) -> EndgamePosition:
+        """
+        Method to copy the position of the attached game, seen from a player
+
+        Args:
+            player (Player): The player to move
+
+        Returns:
+            EndgamePosition: The position
+
+        Complexity:
+            Best Case Complexity: O(HlogH + D), where H is the number of cards in hands and D in both piles
+            Worst Case Complexity: O(HlogH + D)
+        """
+        seating = self.game.seating
+        opponent = seating[1] if seating[0] is player else seating[0]
+        board = self.game.game_board
+        draw_pile, discard_pile = board.draw_pile, board.discard_pile
+        return EndgamePosition(
+            tuple(sorted(player.hand[i].code for i in range(len(player.hand)))),
+            tuple(sorted(opponent.hand[i].code for i in range(len(opponent.hand)))),
+            self.game.current_code,
+            tuple(draw_pile.array[i].code for i in range(len(draw_pile) - 1, -1, -1)),
+            tuple(discard_pile[i].code for i in range(len(discard_pile))),
+            self.game.deck_random.seed,
+        )
+
+    def solve(self, player: Player) -> tuple[int, int]:
+        """
+        Method to solve the attached game for the player to move by iterative
+        deepening, DEPTH_STEP plies at a time, until the position is proven,
+        max_plies is reached or max_nodes positions have been searched
+
+        Args:
+            player (Player): The player to move
+
+        Returns:
+            tuple[int, int]: WIN, LOSS or UNKNOWN for the player, and the code of
+            the card to play, NO_MOVE to draw or if no iteration completed; with
+            UNKNOWN the move is the best one found, not a proven one
+
+        Complexity:
+            Best Case Complexity: O(1), when the position is cached
+            Worst Case Complexity: O(max_nodes)
+            Explanation: Each iteration reuses the table filled by the previous ones,
+            and an iteration cut short by the budget only counts if it proved the position
+        """
+        self.table.new_search()
+        root = self.position(player)
+        self.budget = self.nodes + self.max_nodes
+        result = UNKNOWN, NO_MOVE
+        for depth in range(self.DEPTH_STEP, self.max_plies + 1, self.DEPTH_STEP):
+            value, move = self.__search(root, depth)
+            if self.nodes > self.budget:
+                if value != UNKNOWN:
+                    result = value, move
+                break
+            result = value, move
+            if value != UNKNOWN:
+                break
+        return result
+
+    def __search(self, position: EndgamePosition, depth: int, alpha: int = LOSS, beta: int = WIN) -> tuple[int, int]:
+        """
+        Returns the value of a position for the player to move and the best code,
+        searched in the window (alpha, beta). A value at or above beta is a lower
+        bound and one at or below alpha an upper bound, so an UNKNOWN outside the
+        full window is stored at depth 0, which keeps only its move for ordering.
+        A forced draw does not use up depth, since it does not branch. Once the
+        node budget is spent every position is UNKNOWN and left out of the table,
+        so WIN and LOSS stay sound.
+        :complexity: O(max_nodes), see solve
+        """
+        self.nodes += 1
+        if depth == 0 or self.nodes > self.budget:
+            return UNKNOWN, NO_MOVE
+        key = position.key()
+        entry = self.table.lookup(key)
+        if entry is not None and entry[1] >= depth:
+            return int(entry[0]), entry[2]
+        moves = position.moves()
+        if entry is not None and entry[2] in moves[1:]:
+            moves.remove(entry[2])
+            moves.insert(0, entry[2])
+        remaining = depth - 1 if moves else depth
+        best, best_move = LOSS - 1, NO_MOVE
+        low = alpha
+        for code in moves or [NO_MOVE]:
+            child = position.copy()
+            outcome = child.draw_turn() if code == NO_MOVE else child.play(code)
+            if outcome == WON:
+                value = WIN
+            elif outcome == ERROR:
+                value = UNKNOWN
+            elif outcome == AGAIN:
+                value = self.__search(child, remaining, low, beta)[0]
+            else:
+                child.swap()
+                value = -self.__search(child, remaining, -beta, -low)[0]
+            if value > best:
+                best, best_move = value, code
+                if best >= beta:
+                    break
+                low = max(low, best)
+        if best != UNKNOWN:
+            self.table.store(key, best, PROVEN, best_move)
+        elif self.nodes <= self.budget:
+            self.table.store(key, best, depth if alpha < UNKNOWN < beta else 0, best_move)
+        return best, best_move
+
+
+class EndgamePlayer(Player):
+    """
+    Player who plays greedily until the solver applies, and with the solver for
+    the rest of the game, so a proven line is followed even if a hand grows
+    back above the threshold
+    """
+
+    def __init__(self, name: str, solver: EndgameSolver) -> None:
+        """
+        Constructor for the EndgamePlayer class
+
+        Args:
+            name (str): The name of the player
+            solver (EndgameSolver): The solver, attached to the game with Game.attach
+
+        Returns:
+            None
+        """
+        Player.__init__(self, name)
+        self.solver = solver
+        self.solving = False
+
+    def reset(self) -> None:
+        """
+        Method to empty the hand for a new game and go back to greedy play
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        Player.reset(self)
+        self.solving = False
+
+    def play_card(self, current_color: CardColor, current_label: CardLabel) -> Card | None:
+        """
+        Method to play the solver's move once both hands are small, otherwise the greedy move
+
+        Args:
+            current_color (CardColor): The current color of the game
+            current_label (CardLabel): The current label of the game
+
+        Returns:
+            Card: The card played, or None to draw
+
+        Complexity:
+            Best Case Complexity: O(N), where N is the length of self.hand
+            Worst Case Complexity: O(N + S), where S is the cost of EndgameSolver.solve
+        """
+        self.solving = self.solving or self.solver.applies(self)
+        if self.solving:
+            _, code = self.solver.solve(self)
+            if code != NO_MOVE:
+                for i in range(len(self.hand)):
+                    if self.hand[i].code == code:
+                        card = self.hand.delete_at_index(i)
+                        if self.observer is not None:
+                            self.observer.card_removed(self, card)
+                        return card
+        return Player.play_card(self, current_color, current_label)
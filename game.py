@@ -6,15 +6,42 @@ It orchestrates the game flow, manages player turns using a CircularQueue,
 and applies the rules associated with each card played (e.g., skip, reverse,
 draw two). This class integrates the `Player`, `GameBoard`, and `Card` objects
 to create a cohesive and playable game experience.
+
+A game that no one wins is ended by a turn cap of Config.MAX_ROUNDS_PER_PLAYER
+rounds, by stalemate detection when the hand sizes stop changing, or by an
+optional wall-clock limit on play_game; `Game.outcome` and `Game.end_reason`
+record why it ended.
 """
 
 from __future__ import annotations
+import time
+from enum import auto, IntEnum
 from player import Player
-from game_board import GameBoard
-from card import CardColor, CardLabel, Card
+from game_board import GameBoard, ReshuffleMode
+from card import CardColor, CardLabel, Card, NUM_CARD_CODES, NUM_LABELS, PLAYABLE, deck_template
+from card import NINE, DRAW_FOUR, COLORS, LABELS
 from random_gen import RandomGen
+from rules import RuleSet, STANDARD
 from config import Config
-from data_structures import *
+from data_structures import ArrayList, ArrayStack, CircularQueue
+
+
+class GameOutcome(IntEnum):
+    """
+    Enum class for how a game ended
+    """
+
+    PLAYING = 0
+    WON = auto()
+    TURN_LIMIT = auto()  # A draw: Config.MAX_ROUNDS_PER_PLAYER rounds were played without a winner
+    STALEMATE = auto()  # A draw: the hand sizes stopped changing
+    TIMEOUT = auto()  # The wall-clock limit of play_game ran out
+
+    def __str__(self) -> str:
+        """
+        Method to return the string representation of the GameOutcome
+        """
+        return self.name
 
 
 class Game:
@@ -22,6 +49,13 @@ class Game:
     Game class to play the game
     """
 
+    # Rounds in a row with the same hand sizes that make a stalemate; natural
+    # games repeat them for at most a couple of rounds
+    STALL_ROUNDS = 10
+    # Wall-clock seconds the batch runners give play_game before ending a game
+    # with GameOutcome.TIMEOUT; the turn cap normally ends a game long before
+    TIME_LIMIT = 1.0
+
     def __init__(self) -> None:
         """
         Constructor for the Game class
@@ -42,9 +76,58 @@ class Game:
         """
         self.players: CircularQueue | None = None
         self.current_player: Player | None = None
-        self.current_color: CardColor | None = None
-        self.current_label: CardLabel | None = None
+        # The current color and label packed like a card code, a plain int for the engine
+        # core; current_color and current_label convert it to enums for everyone else
+        self.current_code: int | None = None
         self.game_board: GameBoard | None = None
+        self.seating: ArrayList[Player] | None = None
+        self.turn_counter: int = 0
+        self.winner: Player | None = None
+        self.verbose: bool = True
+        self.deck: ArrayList[Card] | None = None
+        self.reverse_stack: ArrayStack[Player] | None = None
+        self.draw_batch: ArrayList[Card] | None = None
+        self.deck_random = RandomGen
+        self.color_random = RandomGen
+        self.decks: int = 1
+        self.reshuffle_mode: ReshuffleMode = ReshuffleMode.SWAP
+        self.rules: RuleSet = STANDARD
+        self.outcome: GameOutcome = GameOutcome.PLAYING
+        self.end_reason: str | None = None
+        self.__hand_sizes: tuple | None = None
+        self.__stalled_rounds: int = 0
+
+    @property
+    def current_color(self) -> CardColor | None:
+        """
+        The current color of the game, converted from self.current_code
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return None if self.current_code is None else COLORS[self.current_code // NUM_LABELS]
+
+    @current_color.setter
+    def current_color(self, color: CardColor) -> None:
+        label = 0 if self.current_code is None else self.current_code % NUM_LABELS
+        self.current_code = int(color) * NUM_LABELS + label
+
+    @property
+    def current_label(self) -> CardLabel | None:
+        """
+        The current label of the game, converted from self.current_code
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return None if self.current_code is None else LABELS[self.current_code % NUM_LABELS]
+
+    @current_label.setter
+    def current_label(self, label: CardLabel) -> None:
+        color = 0 if self.current_code is None else self.current_code // NUM_LABELS
+        self.current_code = color * NUM_LABELS + int(label)
 
     def generate_cards(self) -> ArrayList[Card]:
         """
@@ -54,42 +137,21 @@ class Game:
             None
 
         Returns:
-            ArrayList[Card]: The list of Card objects generated
-        """
-        list_of_cards: ArrayList[Card] = ArrayList(Config.DECK_SIZE)
-        idx: int = 0
-
-        # Generate 4 sets of cards from 0 to 9 for each color
-        for color in CardColor:
-            if color != CardColor.BLACK:
-                # Generate 4 sets of cards from 0 to 9 for each color
-                for i in range(10):
-                    list_of_cards.insert(idx, Card(color, CardLabel(i)))
-                    idx += 1
-                    list_of_cards.insert(idx, Card(color, CardLabel(i)))
-                    idx += 1
-
-                # Generate 2 of each special card for each color
-                for i in range(2):
-                    list_of_cards.insert(idx, Card(color, CardLabel.SKIP))
-                    idx += 1
-                    list_of_cards.insert(idx, Card(color, CardLabel.REVERSE))
-                    idx += 1
-                    list_of_cards.insert(idx, Card(color, CardLabel.DRAW_TWO))
-                    idx += 1
-            else:
-                # Generate black crazy and draw 4 cards
-                for i in range(4):
-                    list_of_cards.insert(idx, Card(CardColor.BLACK, CardLabel.CRAZY))
-                    idx += 1
-                    list_of_cards.insert(
-                        idx, Card(CardColor.BLACK, CardLabel.DRAW_FOUR)
-                    )
-                    idx += 1
-
-                # Randomly shuffle the cards
-                RandomGen.random_shuffle(list_of_cards)
-                return list_of_cards
+            ArrayList[Card]: The shuffled cards of self.decks decks
+
+        Complexity:
+            Best Case Complexity: O(MlogM), where M is Config.DECK_SIZE * self.decks
+            Worst Case Complexity: O(MlogM)
+            Explanation:
+            - The canonical ordered deck is cached by deck_template, so no Card is built
+            after the first game; it is copied into the list with one slice assignment, O(M)
+            - random_shuffle is O(MlogM)
+        """
+        list_of_cards: ArrayList[Card] = ArrayList(Config.DECK_SIZE * self.decks)
+        # Copy the cached canonical deck in one slice, then shuffle
+        list_of_cards.extend(deck_template(self.decks))
+        self.deck_random.random_shuffle(list_of_cards)
+        return list_of_cards
 
     def initialise_game(self, players: ArrayList[Player]) -> None:
         """
@@ -121,27 +183,130 @@ class Game:
             but Q is usually small which is the number of cards drawn and discarded onto the discard pile
             before a valid card is drawn, O(Q)
         """
+        self.turn_counter = 0
+        self.winner = None
+        self.__start_progress()
+        self.seating = players
         self.players = CircularQueue[Player](len(players))
+        self.reverse_stack = ArrayStack[Player](len(players))
         for i in range(len(players)):
             player = players[i]
             self.players.append(player)
         
-        self.game_board = GameBoard(self.generate_cards())
-        for _ in range(Config.NUM_CARDS_AT_INIT):
-            for _ in range(len(self.players)):
-                player = self.players.serve()
-                card = self.game_board.draw_card()
-                player.add_card(card)
-                self.players.append(player)
+        self.deck = self.generate_cards()
+        self.game_board = GameBoard(self.deck)
+        self.game_board.random = self.deck_random
+        self.game_board.reshuffle_mode = self.reshuffle_mode
+        self.deal_cards()
+
+    def deal_cards(self) -> None:
+        """
+        Method to deal the starting hands from the draw pile and turn up the starting card
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(KN), where N is the length of self.players and K is Config.NUM_CARDS_AT_INIT
+            Worst Case Complexity: O(KN + Q), where Q is the number of cards turned up before a number card
+            Explanation:
+            - The KN cards are drawn into self.draw_batch, which is kept for later deals and
+            penalties, and each hand takes every N-th card of it with one slice copy, which deals
+            the same hands as K rounds around the table without serving and appending every
+            player K times
+            - The starting card is turned up as described in initialise_game
+        """
+        num_players = len(self.players)
+        dealt = self.draw_batch = self.game_board.draw_many(Config.NUM_CARDS_AT_INIT * num_players, self.draw_batch)
+        for position in range(num_players):
+            # Round r of the deal gave this player the card at position + r * num_players
+            self.players.peek_at(position).add_cards(dealt.array[position : len(dealt) : num_players])
         start = False
         while start == False:
             card = self.game_board.draw_card()
             self.game_board.discard_card(card)
-            if card.label <= CardLabel.NINE:
-                self.current_color = card.color
-                self.current_label = card.label
+            if card.code % NUM_LABELS <= NINE:
+                self.current_code = card.code
                 start = True
 
+    def reset(self, seed: int | None = None) -> None:
+        """
+        Method to start a new game with the same players, recycling the deck,
+        the board and the hands of the previous game in place
+
+        Args:
+            seed (int | None): The seed of deck_random for the new deal, or None
+            to continue its current stream
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(MlogM + KN + H), where M is the number of cards in self.deck,
+            H the number of cards left in the hands and N, K as in deal_cards
+            Worst Case Complexity: O(MlogM + KN + H + Q)
+            Explanation:
+            - The Card objects of self.deck are reshuffled in place; since random_shuffle
+            sorts the cards first, the deal is the same as initialise_game after the same seed
+            - The draw pile, discard pile, player queue and hands are cleared and refilled in
+            place, so storage grown in earlier games is kept and no new containers are built
+            - An attached observer is detached while dealing and attached again afterwards
+        """
+        if seed is not None:
+            self.deck_random.set_seed(seed)
+        observer = self.game_board.observer
+        if observer is not None:
+            self.__set_observer(None)
+        self.turn_counter = 0
+        self.winner = None
+        self.__start_progress()
+        self.current_player = None
+        self.players.clear()
+        self.reverse_stack.clear()
+        for i in range(len(self.seating)):
+            player = self.seating[i]
+            player.reset()
+            self.players.append(player)
+        self.deck_random.random_shuffle(self.deck)
+        self.game_board.reset(self.deck)
+        self.deal_cards()
+        if observer is not None:
+            self.attach(observer)
+
+    def attach(self, observer) -> None:
+        """
+        Method to attach an observer to the game board and every player
+
+        Args:
+            observer (GameObserver): The observer notified of every card move from now on
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(N), where N is the length of self.players
+            Worst Case Complexity: O(N), where N is the length of self.players
+            Explanation:
+            - Each player is served and appended back once to set its observer, O(N)
+            - The observer is then told about the game so it can read the current state
+        """
+        self.__set_observer(observer)
+        observer.attached(self)
+
+    def __set_observer(self, observer) -> None:
+        """
+        Sets the observer slot of the game board and of every player.
+        :complexity: O(N), where N is the length of self.players
+        """
+        self.game_board.observer = observer
+        for _ in range(len(self.players)):
+            player = self.players.serve()
+            player.observer = observer
+            self.players.append(player)
+
     def next_player(self) -> Player:
         """
         Method to get the next player
@@ -173,15 +338,15 @@ class Game:
             None
 
         Complexity:
-            Best Case Complexity: O(N + N + N) = O(N), where N is the length of self.players
-            Worst Case Complexity: O(N + N + N) = O(N), where N is the length of self.players
+            Best Case Complexity: O(N + N) = O(N), where N is the length of self.players
+            Worst Case Complexity: O(N + N) = O(N), where N is the length of self.players
             Explanation: 
             - The best and worst case are the same
-            - A temp_array is initialised with the length of self.players, O(N)
+            - The scratch stack self.reverse_stack, built once in initialise_game, is reused as temp_array
             - The for loop runs N times, where N is the length of self.players, O(N)
             - The second for loop runs N times, where N is the length of temp_array which is equal of self.players, O(N)
         """
-        temp_array = ArrayStack[Player](len(self.players))
+        temp_array = self.reverse_stack
         for _ in range(len(self.players)):
             player = self.players.serve()
             temp_array.push(player)
@@ -225,14 +390,13 @@ class Game:
             Worst Case Complexity: O(NlogN + M) = O(NlogN), where N is the length of gameboard.discard_pile and M is the length of player.hand
             Explanation:
             - Since serve and append are both constant time, O(1)
-            - the for loop loops for constant time 2 times regardless of input size, O(1)
-            - The best case complexity is the same as the best case complexity of self.draw_card, O(1)
-            - The worst case complexity is the same as the worst case complexity of self.draw_card as well, O(NlogN + M)
-            - The detailed explanations are in self.draw_card method
+            - the two cards are drawn by self.draw_cards, a constant number regardless of input size
+            - The best case complexity is the same as the best case complexity of self.draw_cards, O(1)
+            - The worst case complexity is the same as the worst case complexity of self.draw_cards as well, O(NlogN + M)
+            - The detailed explanations are in self.draw_cards method
         """
         next_player = self.players.serve()
-        for _ in range(2):
-            self.draw_card(next_player, False)
+        self.draw_cards(next_player, 2)
         self.players.append(next_player)
         
 
@@ -251,23 +415,52 @@ class Game:
             Worst Case Complexity: O(NlogN + M), where N is the length of gameboard.discard_pile and 
             M is the length of player.hand
             Explanation:
-            - Since assigning the current color using RandomGen.randint is constant time, O(1) 
+            - Since assigning the current color using self.color_random.randint is constant time, O(1), and the
+            random int is packed with the label into self.current_code without going through the enums
             - and serve and append are both constant time, O(1)
-            - and we assume comparison between CardLabel.DRAW_FOUR and card.label is constant time, O(1)
-            - if the card is a draw four card, the for loop runs 4 times regardless of input size, O(1).
+            - and comparison between the plain int DRAW_FOUR and the label of card.code is constant time, O(1)
+            - if the card is a draw four card, self.draw_cards draws 4 cards regardless of input size, O(1).
             - In best case, the card is not a draw four card, which is constant time, O(1)
             - In the worst case, the card is a draw four card, the worst case complexity is the same as the 
-            worst case complexity of self.draw_card, O(NlogN + M)
-            - The detailed explanations are in self.draw_card method
+            worst case complexity of self.draw_cards, O(NlogN + M)
+            - The detailed explanations are in self.draw_cards method
         """
-        self.current_color = CardColor(RandomGen.randint(0,3))
-        if card.label == CardLabel.DRAW_FOUR:
+        label = card.code % NUM_LABELS
+        self.current_code = self.color_random.randint(0,3) * NUM_LABELS + label
+        if label == DRAW_FOUR:
             next_player = self.players.serve()
-            for _ in range (4):
-                self.draw_card(next_player, False)
+            self.draw_cards(next_player, 4)
             self.players.append(next_player)
 
 
+    def draw_cards(self, player: Player, count: int) -> None:
+        """
+        Method to make a player draw several penalty cards
+
+        Args:
+            player (Player): The player who is drawing the cards
+            count (int): The number of cards
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(count)
+            Worst Case Complexity: O(NlogN + M + count), where N is the length of gameboard.discard_pile
+            and M is the length of player.hand
+            Explanation:
+            - The cards are drawn with GameBoard.draw_many into self.draw_batch, so no list is
+            built, and added with Player.add_cards
+            - With an observer attached, each card is added before the next is drawn, as with
+            draw_card, so a reshuffle partway never finds a card between the pile and the hand
+        """
+        if self.game_board.observer is not None:
+            for _ in range(count):
+                self.draw_card(player, False)
+        else:
+            self.draw_batch = self.game_board.draw_many(count, self.draw_batch)
+            player.add_cards(self.draw_batch)
+
     def draw_card(self, player: Player, playing: bool) -> Card | None:
         """
         Method to draw a card from the deck
@@ -292,64 +485,172 @@ class Game:
             And when add_card is called, player.hand is full and resize is needed, in which case the complexity is O(M), 
             where M is the length of player.hand due to moving of cards from the original player.hand to the resized array
             in the resize method
-            - In this case we assume all comparisons between enum (int) values of CardColor and CardLabel are constant time
+            - Checking if the card is playable is a single lookup in the precomputed PLAYABLE table, O(1)
         """
         card = self.game_board.draw_card()
-        if playing and (card.color == self.current_color or card.color == CardColor.BLACK or card.label == self.current_label):
+        if playing and PLAYABLE[self.current_code * NUM_CARD_CODES + card.code]:
             return card 
         else:
             player.add_card(card)
             return None
 
-    def play_game(self) -> Player:
+    def step(self) -> Player | None:
         """
-        Method to play the game
+        Method to play exactly one turn of the game
 
         Args:
             None
 
         Returns:
-            Player: The winner of the game
+            Player: The winner if this turn won the game, otherwise None.
+            The resulting state is left in current_player, current_code,
+            turn_counter and winner, and a game that reached the
+            turn cap or stalled is ended through check_progress, so a loop of
+            steps stops once self.outcome is no longer GameOutcome.PLAYING.
+
+        Complexity:
+            Best Case Complexity: O(M), where M is the length of current_player.hand
+            Worst Case Complexity: O(NlogN + M + P), where N is the length of gameboard.discard_pile
+            and P is the length of self.players
+            Explanation:
+            - Serving the current player and appending players back are constant time, O(1)
+            - The current player examines every card in their hand, O(M) (see Player.play_card)
+            - In the worst case a drawn or penalty card forces a reshuffle, O(NlogN), or the
+            played card reverses the players, O(P)
+            - The effect of the played card is found with one lookup in self.rules.effects, O(1),
+            whatever the number of labels with an effect; house-rule effects cost what their
+            docstrings in rules.py say
+            - check_progress is O(1) amortised
         """
-        while True:
-            self.current_player = self.players.serve()
-            card = self.current_player.play_card(self.current_color, self.current_label)
-            #condition to check if the current player has no cards after playing a card and wins
-            if self.current_player.cards_in_hand() == 0:
-                return self.current_player
-            #condition to check if current player has a playable card
+        self.turn_counter += 1
+        self.current_player = self.players.serve()
+        # Players are called through the enum API, converted with two tuple indexes
+        code = self.current_code
+        card = self.current_player.play_card(COLORS[code // NUM_LABELS], LABELS[code % NUM_LABELS])
+        #condition to check if the current player has no cards after playing a card and wins
+        if self.current_player.cards_in_hand() == 0:
+            self.winner = self.current_player
+            self.outcome = GameOutcome.WON
+            self.end_reason = f"{self.winner.name} has no cards left"
+            return self.winner
+        #condition to check if current player has a playable card
+        if card is not None:
+            play_card = True
+        else:
+            card = self.draw_card(self.current_player, True)
+            #condition to check if player drew a playable card
             if card is not None:
                 play_card = True
-            else:
-                card = self.draw_card(self.current_player, True)
-                #condition to check if player drew a playable card
-                if card is not None:
-                    play_card = True
-                    self.game_board.discard_card(card)
-                    self.current_color = card.color
-                    self.current_label = card.label
-                    print(f"Current Color: {self.current_color}, Current Label: {self.current_label}")
-                else:
-                    play_card = False
-                    self.players.append(self.current_player)
-            #condition to check if a card is played 
-            if play_card == True:
                 self.game_board.discard_card(card)
-                self.current_label = card.label
-                self.current_color = card.color
+                self.current_code = card.code
+                if self.verbose:
+                    print(f"Current Color: {self.current_color}, Current Label: {self.current_label}")
+            else:
+                play_card = False
+                self.players.append(self.current_player)
+        #condition to check if a card is played 
+        if play_card == True:
+            self.game_board.discard_card(card)
+            self.current_code = card.code
+            if self.verbose:
                 print(f"Current Color: {self.current_color}, Current Label: {self.current_label}")
-                if card.color == CardColor.BLACK:
-                    self.players.append(self.current_player)
-                    self.play_black(card)
-                elif card.label == CardLabel.DRAW_TWO:
-                    self.players.append(self.current_player)
-                    self.play_draw_two()
-                elif card.label == CardLabel.SKIP:
-                    self.players.append(self.current_player)
-                    self.skip_next_player()
-                elif card.label == CardLabel.REVERSE:
-                    self.reverse_players()
-                    self.players.append(self.current_player)
-                #normal number card
-                else:
-                    self.players.append(self.current_player)
+            # One indexed lookup picks the effect of the card under the rule set
+            self.rules.effects[card.code % NUM_LABELS](self, card)
+        self.check_progress()
+        return None
+
+    def play_game(self, time_limit: float | None = None) -> Player | None:
+        """
+        Method to play the game
+
+        Args:
+            time_limit (float | None): The wall-clock seconds after which the game is
+            ended with GameOutcome.TIMEOUT, or None for no limit
+
+        Returns:
+            Player | None: The winner of the game, or None if it ended without one,
+            in which case self.outcome and self.end_reason say why
+
+        Complexity:
+            Best Case Complexity: O(T * S), where T is the number of turns and S the cost of step
+            Worst Case Complexity: O(T * S), with T at most Config.MAX_ROUNDS_PER_PLAYER times the
+            number of players
+            Explanation: step checks the progress in O(1) amortised and the clock is read once a turn
+        """
+        deadline = None if time_limit is None else time.monotonic() + time_limit
+        while True:
+            winner = self.step()
+            if winner is not None:
+                return winner
+            if self.outcome != GameOutcome.PLAYING:
+                return None
+            if deadline is not None and time.monotonic() > deadline:
+                self.end(GameOutcome.TIMEOUT, f"no winner within {time_limit}s, after {self.turn_counter} turns")
+                return None
+
+    def check_progress(self) -> GameOutcome:
+        """
+        Method to end a game without a winner once it reaches the turn cap or stalls;
+        step calls it after every turn that was not won
+
+        Args:
+            None
+
+        Returns:
+            GameOutcome: self.outcome, PLAYING while the game should go on
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(P), where P is the number of players
+            Explanation:
+            - The turn cap is Config.MAX_ROUNDS_PER_PLAYER turns per player
+            - At the end of every round of P turns the hand sizes are compared with those
+            of the previous round, O(P), so the check is O(1) amortised per turn; the game is
+            a stalemate after STALL_ROUNDS rounds in a row with the same hand sizes
+        """
+        if self.outcome != GameOutcome.PLAYING:
+            return self.outcome
+        num_players = len(self.seating)
+        if self.turn_counter >= Config.MAX_ROUNDS_PER_PLAYER * num_players:
+            return self.end(GameOutcome.TURN_LIMIT, f"no winner after {self.turn_counter} turns")
+        if self.turn_counter % num_players == 0:
+            hand_sizes = tuple(self.seating[seat].cards_in_hand() for seat in range(num_players))
+            if hand_sizes == self.__hand_sizes:
+                self.__stalled_rounds += 1
+            else:
+                self.__stalled_rounds = 0
+            self.__hand_sizes = hand_sizes
+            if self.__stalled_rounds >= self.STALL_ROUNDS:
+                return self.end(GameOutcome.STALEMATE, f"hand sizes {hand_sizes} unchanged for {self.STALL_ROUNDS} rounds")
+        return self.outcome
+
+    def end(self, outcome: GameOutcome, reason: str) -> GameOutcome:
+        """
+        Method to end the game without a winner
+
+        Args:
+            outcome (GameOutcome): Why the game ended
+            reason (str): A description for logs and clients
+
+        Returns:
+            GameOutcome: outcome
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.outcome = outcome
+        self.end_reason = reason
+        if self.verbose:
+            print(f"Game over, {outcome}: {reason}")
+        return outcome
+
+    def __start_progress(self) -> None:
+        """
+        Method to clear the outcome and the stalemate window for a new game
+        :complexity: O(1)
+        """
+        self.outcome = GameOutcome.PLAYING
+        self.end_reason = None
+        self.__hand_sizes = None
+        self.__stalled_rounds = 0
@@ -6,13 +6,57 @@ take cards) and the `discard_pile` (onto which players play cards). It uses
 an ArrayStack for the draw pile to model LIFO (Last-In, First-Out) behavior
 and an ArrayList for the discard pile. Key functionalities include drawing a card,
 discarding a card, and reshuffling the discard pile back into the draw pile when empty.
+
+With ReshuffleMode.LAZY a reshuffle only hands the discard buffer over to the
+draw pile; each draw then swaps a uniformly chosen card of the unshuffled
+part to the top before popping it, an incremental Fisher-Yates shuffle whose
+cost follows the number of cards drawn rather than the size of the pile.
 """
 
 from __future__ import annotations
+from enum import auto, IntEnum
 from card import Card
 from random_gen import RandomGen
 from config import Config
-from data_structures import *
+from data_structures import ArrayList, ArrayStack
+
+
+class ReshuffleMode(IntEnum):
+    """
+    Enum class for how GameBoard.reshuffle turns the discard pile into the draw pile
+    """
+
+    COPY = 0  # Shuffle the discard pile, then push its cards onto the draw pile one by one
+    SWAP = auto()  # Shuffle straight into stack order, then exchange the buffers of the two piles
+    LAZY = auto()  # Exchange the buffers unshuffled; every draw does one Fisher-Yates step
+
+
+class _StackOrder:
+    """
+    Shuffling target over the first length items of an ArrayR. Reads see the
+    items in list order and item x is written to position length - 1 - x, so
+    once shuffled the array pops in the order the shuffled list would be read.
+    random_shuffle reads every item before writing any.
+    """
+
+    def __init__(self, array, length: int) -> None:
+        """:complexity: O(1)"""
+        self.array = array
+        self.length = length
+
+    def __len__(self) -> int:
+        """:complexity: O(1)"""
+        return self.length
+
+    def __getitem__(self, index: int) -> Card:
+        """:complexity: O(1)"""
+        if index < 0 or index >= self.length:
+            raise IndexError("Out of bounds access in array.")
+        return self.array[index]
+
+    def __setitem__(self, index: int, card: Card) -> None:
+        """:complexity: O(1)"""
+        self.array[self.length - 1 - index] = card
 
 
 class GameBoard:
@@ -47,6 +91,32 @@ class GameBoard:
         for i in range(len(cards)-1,-1,-1):
             self.draw_pile.push(cards[i])
         self.discard_pile = ArrayList[Card](len(cards))
+        self.capacity = len(cards)
+        self.observer = None
+        self.random = RandomGen
+        self.reshuffle_mode = ReshuffleMode.SWAP
+        self.unshuffled = 0
+
+    def reset(self, cards: ArrayList[Card]) -> None:
+        """
+        Refills the draw pile with cards and empties the discard pile, reusing the storage of both.
+
+        Args:
+            cards (ArrayList[Card]): The cards of the new game, no more than the draw pile holds
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(N), where N is length of cards list, len(cards)
+            Worst Case Complexity: O(N)
+            Explanation: Clearing both piles is O(1) and the cards are pushed as in the constructor
+        """
+        self.draw_pile.clear()
+        for i in range(len(cards)-1,-1,-1):
+            self.draw_pile.push(cards[i])
+        self.discard_pile.clear()
+        self.unshuffled = 0
 
     def discard_card(self, card: Card) -> None:
         """
@@ -69,6 +139,8 @@ class GameBoard:
             considers the total number of cards in the game board
         """
         self.discard_pile.append(card)
+        if self.observer is not None:
+            self.observer.card_discarded(self, card)
 
     def reshuffle(self) -> None:
         """
@@ -80,21 +152,46 @@ class GameBoard:
         Returns:
             None
 
+        Raises:
+            Exception: "Stack is full" if the discard pile holds more cards than the draw pile
+
         Complexity:
             Best Case Complexity: O(NlogN + N) = O(NlogN), where N is the number of cards in self.discard_pile
             Worst Case Complexity: O(NlogN + N) = O(NlogN), where N is the number of cards in self.discard_pile
             Explanation: 
             - both best and worst case have the same complexity
-            - RandomGen.random_shuffle method is considered to be O(NlogN), (given)
-            - The for loop runs N times to do constant time push operation, O(1), 
+            - self.random.random_shuffle method is considered to be O(NlogN), (given)
+            - In ReshuffleMode.COPY the for loop runs N times to do constant time push operation, O(1), 
             where N is the number of cards in self.discard_pile, O(N).
+            - In ReshuffleMode.SWAP the shuffle writes the discard buffer in stack order, and the
+            draw pile, empty at this point, takes the buffer in exchange for its own, O(1). The
+            cards are drawn in exactly the same order as in ReshuffleMode.COPY
+            - In ReshuffleMode.LAZY the buffers are exchanged without shuffling, O(1), and the
+            N cards are marked unshuffled for draw_card; the draws differ from the other modes
             - the clear method is considered to be O(1) since it only assigns the list length to 0
             - The final complexity for both best and worst case are O(NlogN), considering NlogN is worst than N
         """
-        RandomGen.random_shuffle(self.discard_pile)
-        for i in range(len(self.discard_pile)-1,-1,-1):
-            self.draw_pile.push(self.discard_pile[i])     
-        self.discard_pile.clear()                
+        if self.reshuffle_mode == ReshuffleMode.SWAP:
+            count = len(self.discard_pile)
+            self.random.random_shuffle(_StackOrder(self.discard_pile.array, count))
+            if count > self.capacity:
+                raise Exception("Stack is full")
+            self.draw_pile.array, self.discard_pile.array = self.discard_pile.array, self.draw_pile.array
+            self.draw_pile.length = count
+        elif self.reshuffle_mode == ReshuffleMode.LAZY:
+            count = len(self.discard_pile)
+            if count > self.capacity:
+                raise Exception("Stack is full")
+            self.draw_pile.array, self.discard_pile.array = self.discard_pile.array, self.draw_pile.array
+            self.draw_pile.length = count
+            self.unshuffled = count
+        else:
+            self.random.random_shuffle(self.discard_pile)
+            for i in range(len(self.discard_pile)-1,-1,-1):
+                self.draw_pile.push(self.discard_pile[i])     
+        self.discard_pile.clear()
+        if self.observer is not None:
+            self.observer.reshuffled(self)
 
     def draw_card(self) -> Card:
         """
@@ -112,8 +209,57 @@ class GameBoard:
             Explanation:
             - The best case complexity happens when the draw pile is not empty
             - The worst case complexity happens when the draw pile is empty and the reshuffle method is called, O(NlogN)
+            - While cards are unshuffled, a uniformly chosen one is first swapped with the top
+            card, O(1); during card_drawn self.unshuffled is still one more than the length of
+            the draw pile, which tells observers the card came from the unshuffled part
         """
         if len(self.draw_pile) == 0:
             self.reshuffle()    
+        if self.unshuffled:
+            array = self.draw_pile.array
+            top = len(self.draw_pile) - 1
+            chosen = self.random.randint(0, top)
+            array[chosen], array[top] = array[top], array[chosen]
         card = self.draw_pile.pop()
+        if self.observer is not None:
+            self.observer.card_drawn(self, card)
+        if self.unshuffled:
+            self.unshuffled -= 1
         return card
+
+    def draw_many(self, count: int, batch: ArrayList[Card] | None = None) -> ArrayList[Card]:
+        """
+        Draws several cards from the draw pile, in the order draw_card would draw them.
+
+        Args:
+            count (int): The number of cards to draw
+            batch (ArrayList[Card] | None): A list to clear and fill, or None for a new one.
+            A new one is also made if batch cannot hold count cards
+
+        Returns:
+            ArrayList[Card]: The cards drawn, the first drawn first
+
+        Complexity:
+            Best Case Complexity: O(count)
+            Worst Case Complexity: O(count + NlogN), where N is the number of cards in self.discard_pile
+            Explanation:
+            - Runs of cards are popped off the draw pile straight into the batch's array with
+            one slice copy each, instead of count separate pops and appends
+            - Reusing a batch that can hold count cards builds no new list
+            - When the draw pile runs out partway, draw_card reshuffles the discard pile and the
+            batch carries on from the new draw pile, O(NlogN)
+            - Unshuffled cards (ReshuffleMode.LAZY) and cards drawn while an observer is
+            attached go through draw_card one at a time, so every draw is shuffled and reported
+        """
+        if batch is None or len(batch.array) < count:
+            batch = ArrayList[Card](count)
+        else:
+            batch.clear()
+        while len(batch) < count:
+            if self.observer is not None or self.unshuffled or len(self.draw_pile) == 0:
+                batch.append(self.draw_card())
+            else:
+                run = min(count - len(batch), len(self.draw_pile))
+                self.draw_pile.pop_many_into(run, batch.array, len(batch))
+                batch.length += run
+        return batch
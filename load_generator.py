@@ -0,0 +1,159 @@
+"""
+This script is a local load generator for the asyncio `GameServer`.
+
+It starts a server in-process, connects bot clients over TCP (or a Unix
+socket with --path) and has each of them play several tables at once,
+choosing moves greedily from the PLAYABLE table. Move latency
+is the time from sending a move to receiving the server's next update for
+that table. The report gives p50/p99 latency and throughput, and --sweep
+doubles the number of live tables until p99 exceeds a latency budget to find
+how many tables one core can hold.
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from card import NUM_CARD_CODES, PLAYABLE, card_code
+from server import GameServer
+
+
+def choose_move(hand: list[int], color: int, label: int) -> int | None:
+    """
+    Method to pick the greedy move for a hand of packed codes
+
+    Args:
+        hand (list[int]): The codes of the cards in hand
+        color (int): The current color
+        label (int): The current label
+
+    Returns:
+        int | None: The code of the best playable card, or None to draw
+
+    Complexity:
+        Best Case Complexity: O(N), where N is the length of hand
+        Worst Case Complexity: O(N)
+    """
+    state = card_code(color, label) * NUM_CARD_CODES
+    best = None
+    for code in hand:
+        if PLAYABLE[state + code] and (best is None or code < best):
+            best = code
+    return best
+
+
+async def bot_client(
+    server: GameServer, num_tables: int, num_players: int, seed: int, latencies: list[float], path: str | None
+) -> int:
+    """
+    Method to run one bot client until all of its tables are over
+
+    Args:
+        server (GameServer): The running server
+        num_tables (int): The number of tables the client opens
+        num_players (int): The number of seats per table
+        seed (int): The seed of the first table, the next ones count up
+        latencies (list[float]): Collects the latency of every move in seconds
+        path (str | None): The Unix socket path, or None for TCP
+
+    Returns:
+        int: The number of moves sent
+    """
+    if path is not None:
+        reader, writer = await asyncio.open_unix_connection(path)
+    else:
+        host, port = server.server.sockets[0].getsockname()[:2]
+        reader, writer = await asyncio.open_connection(host, port)
+    for i in range(num_tables):
+        writer.write(json.dumps({"type": "create", "players": num_players, "seed": seed + i}).encode() + b"\n")
+    await writer.drain()
+
+    sent_at: dict[int, float] = {}
+    moves = 0
+    finished = 0
+    while finished < num_tables:
+        message = json.loads(await reader.readline())
+        table = message.get("table")
+        if table in sent_at:
+            latencies.append(time.perf_counter() - sent_at.pop(table))
+        if message["type"] == "turn":
+            move = choose_move(message["hand"], message["color"], message["label"])
+            writer.write(json.dumps({"type": "move", "table": table, "card": move}).encode() + b"\n")
+            sent_at[table] = time.perf_counter()
+            moves += 1
+        elif message["type"] == "over":
+            finished += 1
+    writer.close()
+    return moves
+
+
+async def run_load(num_clients: int, tables_per_client: int, num_players: int, path: str | None = None) -> dict:
+    """
+    Method to run one load test against a fresh in-process server
+
+    Args:
+        num_clients (int): The number of bot clients
+        tables_per_client (int): The number of concurrent tables per client
+        num_players (int): The number of seats per table
+        path (str | None): The Unix socket path, or None for TCP
+
+    Returns:
+        dict: tables, moves, seconds, moves_per_second, tables_per_second, p50_ms and p99_ms
+    """
+    server = GameServer()
+    await server.start(path=path)
+    latencies: list[float] = []
+    start = time.perf_counter()
+    moves = await asyncio.gather(
+        *(
+            bot_client(server, tables_per_client, num_players, client * tables_per_client, latencies, path)
+            for client in range(num_clients)
+        )
+    )
+    elapsed = time.perf_counter() - start
+    await server.stop()
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [0.0] * 99
+    return {
+        "tables": num_clients * tables_per_client,
+        "moves": sum(moves),
+        "seconds": elapsed,
+        "moves_per_second": sum(moves) / elapsed,
+        "tables_per_second": num_clients * tables_per_client / elapsed,
+        "p50_ms": 1000 * quantiles[49],
+        "p99_ms": 1000 * quantiles[98],
+    }
+
+
+def print_report(report: dict) -> None:
+    """Prints one load test report on a line."""
+    print(
+        f"{report['tables']:6d} tables  {report['moves_per_second']:9.0f} moves/s  "
+        f"{report['tables_per_second']:8.1f} tables/s  p50 {report['p50_ms']:7.2f} ms  p99 {report['p99_ms']:7.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+
+    p = argparse.ArgumentParser()
+    p.add_argument("--clients", type=int, default=10)
+    p.add_argument("--tables", type=int, default=10, help="Concurrent tables per client")
+    p.add_argument("--players", type=int, default=4)
+    p.add_argument("--path", default=None, help="Unix socket path, TCP on localhost if omitted")
+    p.add_argument("--sweep", action="store_true", help="Double the tables until p99 exceeds --budget")
+    p.add_argument("--budget", type=float, default=50.0, help="p99 latency budget in ms for --sweep")
+    args = p.parse_args()
+
+    if not args.sweep:
+        print_report(asyncio.run(run_load(args.clients, args.tables, args.players, args.path)))
+    else:
+        tables, best = args.tables, 0
+        while True:
+            report = asyncio.run(run_load(args.clients, tables, args.players, args.path))
+            print_report(report)
+            if report["p99_ms"] > args.budget:
+                break
+            best = report["tables"]
+            tables *= 2
+        print(f"Max live tables within p99 {args.budget} ms on one core: {best}")
@@ -0,0 +1,91 @@
+"""
+This module defines the `GameObserver` interface for following card moves.
+
+`Player` and `GameBoard` each hold an optional observer and notify it every
+time a card enters or leaves a hand or a pile, so incremental bookkeeping
+such as position hashing or card counting can be kept up to date in O(1) per
+move instead of rescanning the game. `Game.attach` installs an observer on a
+running game, and `ObserverGroup` lets several observers share the slot.
+When no observer is attached the cost is a single `is not None` check.
+"""
+
+from __future__ import annotations
+from data_structures import ArrayList
+
+
+class GameObserver:
+    """
+    GameObserver class with a no-op handler for every card move
+    """
+
+    def attached(self, game) -> None:
+        """Called once by Game.attach, before any other event, with the game observed."""
+        pass
+
+    def card_added(self, player, card) -> None:
+        """Called after a card is added to a player's hand."""
+        pass
+
+    def card_removed(self, player, card) -> None:
+        """Called after a card is removed from a player's hand to be played."""
+        pass
+
+    def card_drawn(self, game_board, card) -> None:
+        """Called after a card is popped from the draw pile."""
+        pass
+
+    def card_discarded(self, game_board, card) -> None:
+        """Called after a card is appended to the discard pile."""
+        pass
+
+    def reshuffled(self, game_board) -> None:
+        """Called after the discard pile has been reshuffled into the draw pile."""
+        pass
+
+
+class ObserverGroup(GameObserver):
+    """
+    ObserverGroup class forwarding every event to several observers in order
+    """
+
+    def __init__(self, *observers: GameObserver) -> None:
+        """
+        Constructor for the ObserverGroup class
+
+        Args:
+            observers (GameObserver): The observers to notify
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(N), where N is the number of observers
+            Worst Case Complexity: O(N), where N is the number of observers
+        """
+        self.observers = ArrayList[GameObserver](len(observers))
+        for observer in observers:
+            self.observers.append(observer)
+
+    def attached(self, game) -> None:
+        for i in range(len(self.observers)):
+            self.observers[i].attached(game)
+
+    def card_added(self, player, card) -> None:
+        for i in range(len(self.observers)):
+            self.observers[i].card_added(player, card)
+
+    def card_removed(self, player, card) -> None:
+        for i in range(len(self.observers)):
+            self.observers[i].card_removed(player, card)
+
+    def card_drawn(self, game_board, card) -> None:
+        for i in range(len(self.observers)):
+            self.observers[i].card_drawn(game_board, card)
+
+    def card_discarded(self, game_board, card) -> None:
+        for i in range(len(self.observers)):
+            self.observers[i].card_discarded(game_board, card)
+
+    def reshuffled(self, game_board) -> None:
+        for i in range(len(self.observers)):
+            self.observers[i].reshuffled(game_board)
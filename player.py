@@ -1,7 +1,8 @@
 from __future__ import annotations
-from card import Card, CardColor, CardLabel
+from typing import Sequence
+from card import Card, CardColor, CardLabel, NUM_CARD_CODES, NUM_LABELS, PLAYABLE
 from config import Config
-from data_structures import *
+from data_structures import ArrayList
 
 
 class Player:
@@ -27,6 +28,7 @@ class Player:
         """
         self.name = name
         self.hand = ArrayList[Card](Config.NUM_CARDS_AT_INIT)
+        self.observer = None
 
     def add_card(self, card: Card) -> None:
         """
@@ -49,6 +51,48 @@ class Player:
             where N is the length of the list (self.hand). This doubles the internal capacity of the list and copy all existing elements.
         """
         self.hand.append(card)
+        if self.observer is not None:
+            self.observer.card_added(self, card)
+
+    def add_cards(self, cards: ArrayList[Card] | Sequence[Card]) -> None:
+        """
+        Method to add several cards to the player's hand, in order
+
+        Args:
+            cards (ArrayList[Card] | Sequence[Card]): The cards, e.g. a batch from GameBoard.draw_many
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(K), where K is the number of cards added
+            Worst Case Complexity: O(N + K), where N is length of self.hand
+            Explanation:
+            - The cards are appended with one slice copy (see ArrayList.extend), and the hand
+            grows at most once, O(N), instead of up to log K times
+            - An attached observer is told about each card, O(K)
+        """
+        self.hand.extend(cards)
+        if self.observer is not None:
+            for i in range(len(self.hand) - len(cards), len(self.hand)):
+                self.observer.card_added(self, self.hand[i])
+
+    def reset(self) -> None:
+        """
+        Method to empty the player's hand for a new game, keeping its storage
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+            Explanation: Clearing an ArrayList only resets its length
+        """
+        self.hand.clear()
 
     def is_empty(self) -> bool:
         """
@@ -93,6 +137,58 @@ class Player:
         """
         Method to play a card from the player's hand
 
+        Args:
+            current_color (CardColor): The current color of the game
+            current_label (CardLabel): The current label of the game
+
+        Returns:
+            Card: The first card that is playable from the player's hand  
+
+        Complexity:
+            Best Case Complexity: O(N), where N is length of self.hand
+            Worst Case Complexity: O(N + N) = O(N), where N is length of self.hand
+            Explanation: 
+            - Regardless of best or worst case, the for loop will examine each card in the player's hand, O(N)
+            - Playability is a single lookup in the precomputed PLAYABLE table and preference compares card codes, O(1)
+            - The best case happens when after the loop, selected card is still None (no playable card)
+            which skips the part of removing a playable card (delete_at_index) and returns None.
+            - The worst case happens when there is a selected best playable card and the card's index is at the front (selected_index = 0)
+            of the list, and delete_at_index is called which is O(len(self.hand) - selected_index),
+            but in this case since selected_index is 0, the complexity is simply O(N) 
+            where N is the number of cards in player's hand or length of self.hand as all other cards will be shuffled left
+        """
+        state = (current_color * NUM_LABELS + current_label) * NUM_CARD_CODES
+        selected_card = None
+        selected_index = -1
+        selected_code = -1
+        for i in range(len(self.hand)):
+            card = self.hand[i]
+            code = card.code
+            #conditional statement to check if the card is playable
+            if PLAYABLE[state + code]:
+                # If we haven't found a playable card yet, or the card is better (smaller color, then label)
+                if selected_card is None or code < selected_code:
+                    selected_card = card
+                    selected_index = i
+                    selected_code = code
+        
+        # If we found a playable card, remove it from hand and return it
+        if selected_card is not None:       
+            self.hand.delete_at_index(selected_index)
+            if self.observer is not None:
+                self.observer.card_removed(self, selected_card)
+            return selected_card
+        
+        return None
+
+    def play_card_reference(
+        self, current_color: CardColor, current_label: CardLabel
+    ) -> Card | None:
+        """
+        Reference version of play_card that evaluates the rules on the enums
+        directly instead of through the PLAYABLE table and card codes, kept for
+        differential tests
+
         Args:
             current_color (CardColor): The current color of the game
             current_label (CardLabel): The current label of the game
@@ -128,6 +224,8 @@ class Player:
         # If we found a playable card, remove it from hand and return it
         if selected_card is not None:       
             self.hand.delete_at_index(selected_index)
+            if self.observer is not None:
+                self.observer.card_removed(self, selected_card)
             return selected_card
         
         return None
@@ -67,9 +67,37 @@ class RandomGen:
         :complexity: O(NlogN) where N is the number of elements in the collection.
         """
         cards = [card for card in collection]
-        cards.sort(key=lambda x: (x.color, x.label))
-        positions = [(RandomGen.random(), i) for i in range(len(collection))]
+        cards.sort(key=lambda x: x.code)
+        positions = [(cls.random(), i) for i in range(len(collection))]
         positions.sort()  # I can use inbuilt list sorting here - YOU CANNOT ANYWHERE ELSE! >:D
         tmp = [cards[p[1]] for p in positions]
         for x in range(len(cards)):
             collection[x] = tmp[x]
+
+
+class RandomStream(RandomGen):
+    """
+    Instance version of `RandomGen` with its own seed, for code that needs
+    several independent streams at once. Its methods are the functions behind
+    RandomGen's classmethods bound to the instance instead of the class, so it
+    draws the same sequence as `RandomGen` from the same seed and either can be
+    passed wherever a source of randomness is expected.
+
+    Usage:
+    ```
+    deck = RandomStream(123)
+    deck.randint(1, 10)          # Same as RandomGen.randint after RandomGen.set_seed(123)
+    ```
+    """
+
+    def __init__(self, seed: int = None) -> None:
+        """Starts the stream at seed, or at the current time if seed is None."""
+        self.set_seed(seed)
+
+    set_seed = RandomGen.set_seed.__func__
+    random = RandomGen.random.__func__
+    random_float = RandomGen.random_float.__func__
+    randint = RandomGen.randint.__func__
+    random_chance = RandomGen.random_chance.__func__
+    random_choice = RandomGen.random_choice.__func__
+    random_shuffle = RandomGen.random_shuffle.__func__
@@ -0,0 +1,257 @@
+"""
+This module contains the rule sets of the game: what happens after a card is
+played, looked up by the card's label.
+
+A `RuleSet` holds one effect per `CardLabel` in an array built once when the
+rule set is registered, so `Game.step` applies a card with a single indexed
+lookup whatever the number of house rules, instead of a chain of comparisons.
+An effect is called with the game and the card once the card has been
+discarded and the current color and label set, while the current player is
+out of the player queue; it must put the current player back.
+
+Variants are registered declaratively with `register_rules`, as a base rule
+set plus the labels whose effect they replace, and are looked up by name in
+`RULE_SETS`. Three are registered here:
+
+- "standard": the rules Game has always played
+- "seven-o": a SEVEN swaps hands with the next player and a ZERO passes every
+  hand on to the next player in turn order
+- "stacking": a player hit by a DRAW_TWO who holds one passes the penalty on,
+  two cards larger, to the player after them
+
+Usage:
+```
+game.rules = RULE_SETS["seven-o"]
+```
+"""
+
+from __future__ import annotations
+from typing import Callable
+from card import Card, CardLabel, DRAW_TWO, NUM_LABELS
+from data_structures.referential_array import ArrayR
+
+Effect = Callable[["Game", Card], None]
+
+
+def number_effect(game, card: Card) -> None:
+    """
+    Effect of a card without an action: the turn passes to the next player
+
+    Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+    """
+    game.players.append(game.current_player)
+
+
+def skip_effect(game, card: Card) -> None:
+    """
+    Effect of a SKIP: the next player loses their turn
+
+    Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+    """
+    game.players.append(game.current_player)
+    game.skip_next_player()
+
+
+def reverse_effect(game, card: Card) -> None:
+    """
+    Effect of a REVERSE: the turn order is reversed
+
+    Complexity:
+        Best Case Complexity: O(P), where P is the number of players
+        Worst Case Complexity: O(P)
+    """
+    game.reverse_players()
+    game.players.append(game.current_player)
+
+
+def draw_two_effect(game, card: Card) -> None:
+    """
+    Effect of a DRAW_TWO: the next player draws two cards and loses their turn
+
+    Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(NlogN + M), see Game.play_draw_two
+    """
+    game.players.append(game.current_player)
+    game.play_draw_two()
+
+
+def wild_effect(game, card: Card) -> None:
+    """
+    Effect of a BLACK card: a random color is chosen, and a DRAW_FOUR makes the
+    next player draw four cards and lose their turn
+
+    Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(NlogN + M), see Game.play_black
+    """
+    game.players.append(game.current_player)
+    game.play_black(card)
+
+
+def hands_moved(game) -> None:
+    """
+    Method to let an attached observer recount after hands changed owners,
+    which no card event describes
+
+    Complexity:
+        Best Case Complexity: O(1) without an observer
+        Worst Case Complexity: O(P + A), where A is the cost of the observer's attached
+    """
+    observer = game.game_board.observer
+    if observer is not None:
+        game.attach(observer)
+
+
+def swap_with_next_effect(game, card: Card) -> None:
+    """
+    Effect of a SEVEN in seven-o: the current player swaps hands with the next player
+
+    Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1) without an observer, see hands_moved
+    """
+    game.players.append(game.current_player)
+    other = game.players.peek()
+    game.current_player.hand, other.hand = other.hand, game.current_player.hand
+    hands_moved(game)
+
+
+def pass_hands_effect(game, card: Card) -> None:
+    """
+    Effect of a ZERO in seven-o: every hand passes to the next player in turn order
+
+    Complexity:
+        Best Case Complexity: O(P), where P is the number of players
+        Worst Case Complexity: O(P) without an observer, see hands_moved
+    """
+    game.players.append(game.current_player)
+    players = game.players
+    last = len(players) - 1
+    passed = players.peek_at(last).hand
+    for position in range(last, 0, -1):
+        players.peek_at(position).hand = players.peek_at(position - 1).hand
+    players.peek_at(0).hand = passed
+    hands_moved(game)
+
+
+def stack_draw_two_effect(game, card: Card) -> None:
+    """
+    Effect of a DRAW_TWO in stacking: while the player hit holds a DRAW_TWO
+    and at least one other card, they play it at once and the penalty, two
+    cards larger, moves on to the player after them. The last player hit draws
+    the whole penalty and loses their turn. Stacking never plays a player's
+    last card, so nobody wins out of turn.
+
+    Complexity:
+        Best Case Complexity: O(H), where H is the length of the next player's hand
+        Worst Case Complexity: O(PH + NlogN + K), where P is the number of players, N the
+        length of the discard pile and K the penalty
+    """
+    game.players.append(game.current_player)
+    penalty = 2
+    victim = game.players.serve()
+    while victim.cards_in_hand() > 1:
+        hand = victim.hand
+        index = 0
+        while index < len(hand) and hand[index].code % NUM_LABELS != DRAW_TWO:
+            index += 1
+        if index == len(hand):
+            break
+        stacked = hand.delete_at_index(index)
+        if victim.observer is not None:
+            victim.observer.card_removed(victim, stacked)
+        game.game_board.discard_card(stacked)
+        game.current_code = stacked.code
+        if game.verbose:
+            print(f"{victim.name} stacks, Current Color: {game.current_color}, Current Label: {game.current_label}")
+        penalty += 2
+        game.players.append(victim)
+        victim = game.players.serve()
+    game.draw_cards(victim, penalty)
+    game.players.append(victim)
+
+
+class RuleSet:
+    """
+    RuleSet class to hold the effect of every label
+    """
+
+    def __init__(self, name: str, effects: dict[CardLabel, Effect], base: RuleSet | None = None) -> None:
+        """
+        Constructor for the RuleSet class
+
+        Args:
+            name (str): The name of the rule set
+            effects (dict[CardLabel, Effect]): The effects of labels, replacing those of base
+            base (RuleSet | None): The rule set to start from, or None for number_effect everywhere
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(L), where L is NUM_LABELS
+            Worst Case Complexity: O(L)
+        """
+        self.name = name
+        self.base = base
+        self.effects = ArrayR[Effect](NUM_LABELS)
+        for label in range(NUM_LABELS):
+            self.effects[label] = base.effects[label] if base is not None else number_effect
+        for label, effect in effects.items():
+            self.effects[label] = effect
+
+    def __str__(self) -> str:
+        """
+        Method to return the name of the rule set
+        """
+        return self.name
+
+
+RULE_SETS: dict[str, RuleSet] = {}
+
+
+def register_rules(name: str, effects: dict[CardLabel, Effect], base: RuleSet | None = None) -> RuleSet:
+    """
+    Method to build a rule set and register it under its name
+
+    Args:
+        name (str): The name, unique among RULE_SETS
+        effects (dict[CardLabel, Effect]): The effects of labels, replacing those of base
+        base (RuleSet | None): The rule set the variant starts from
+
+    Returns:
+        RuleSet: The rule set
+
+    Raises:
+        ValueError: If a rule set of that name is registered already
+
+    Complexity:
+        Best Case Complexity: O(L), where L is NUM_LABELS
+        Worst Case Complexity: O(L)
+    """
+    if name in RULE_SETS:
+        raise ValueError(f"Rule set {name} is registered already")
+    rules = RuleSet(name, effects, base)
+    RULE_SETS[name] = rules
+    return rules
+
+
+STANDARD = register_rules(
+    "standard",
+    {
+        CardLabel.SKIP: skip_effect,
+        CardLabel.REVERSE: reverse_effect,
+        CardLabel.DRAW_TWO: draw_two_effect,
+        CardLabel.CRAZY: wild_effect,
+        CardLabel.DRAW_FOUR: wild_effect,
+    },
+)
+SEVEN_O = register_rules(
+    "seven-o", {CardLabel.SEVEN: swap_with_next_effect, CardLabel.ZERO: pass_hands_effect}, STANDARD
+)
+STACKING = register_rules("stacking", {CardLabel.DRAW_TWO: stack_draw_two_effect}, STANDARD)
@@ -0,0 +1,420 @@
+"""
+This module contains an asyncio game server that hosts many `Game` tables
+in one thread.
+
+Clients talk newline-delimited JSON over a local TCP or Unix socket:
+
+- `{"type": "create", "players": 4, "seed": 7}` opens a table. The client
+  controls seat 0 and the server plays the other seats with the greedy
+  `Player`. The reply is `{"type": "table", "table": id}`.
+- When seat 0 is up the server sends `{"type": "turn", "table": id,
+  "hand": [codes], "color": c, "label": l}` with packed card codes.
+- The client answers `{"type": "move", "table": id, "card": code}`, or
+  `"card": null` to draw. Illegal moves get an `error` message and the
+  server keeps waiting, and so does any line that is not a valid message. A move that misses `move_timeout` is played
+  greedily for the client.
+- After every turn the server queues `{"type": "state", ...}`, and
+  `{"type": "over", "table": id, "winner": name}` ends the table.
+
+Each table runs as its own task, and outbound messages for a connection
+are batched into one write per event loop iteration. All tables share the
+global `RandomGen`, so only the deal of a seeded table is reproducible.
+"""
+
+from __future__ import annotations
+import asyncio
+import json
+from card import Card, CardColor, CardLabel, NUM_CARD_CODES, PLAYABLE, card_code
+from data_structures import ArrayList
+from game import Game, GameOutcome
+from player import Player
+from random_gen import RandomGen
+
+
+class RemotePlayer(Player):
+    """
+    Player whose moves arrive over a connection instead of being chosen greedily
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Constructor for the RemotePlayer class
+
+        Args:
+            name (str): The name of the player
+
+        Returns:
+            None
+        """
+        Player.__init__(self, name)
+        self.move: int | None = None
+        self.auto: bool = True
+
+    def find_move(self, code: int | None, current_color: CardColor, current_label: CardLabel) -> int:
+        """
+        Method to check a move against the player's hand
+
+        Args:
+            code (int | None): The packed code of the card to play, or None to draw
+            current_color (CardColor): The current color of the game
+            current_label (CardLabel): The current label of the game
+
+        Returns:
+            int: The index of the card in the hand, -1 to draw, or -2 if the move is illegal
+
+        Complexity:
+            Best Case Complexity: O(1), when drawing
+            Worst Case Complexity: O(N), where N is the length of self.hand
+            Explanation: The hand is searched for the first card with the code
+        """
+        if code is None:
+            return -1
+        state = card_code(current_color, current_label) * NUM_CARD_CODES
+        for i in range(len(self.hand)):
+            if self.hand[i].code == code:
+                return i if PLAYABLE[state + code] else -2
+        return -2
+
+    def play_card(self, current_color: CardColor, current_label: CardLabel) -> Card | None:
+        """
+        Method to play the move received from the client, or the greedy move if
+        the client timed out
+
+        Args:
+            current_color (CardColor): The current color of the game
+            current_label (CardLabel): The current label of the game
+
+        Returns:
+            Card: The card played, or None to draw
+
+        Complexity:
+            Best Case Complexity: O(1), when drawing
+            Worst Case Complexity: O(N), where N is the length of self.hand
+        """
+        if self.auto:
+            return Player.play_card(self, current_color, current_label)
+        index = self.find_move(self.move, current_color, current_label)
+        if index < 0:
+            return None
+        card = self.hand.delete_at_index(index)
+        if self.observer is not None:
+            self.observer.card_removed(self, card)
+        return card
+
+
+class Connection:
+    """
+    Connection class that batches outbound messages to one client
+    """
+
+    def __init__(self, writer: asyncio.StreamWriter) -> None:
+        """
+        Constructor for the Connection class
+
+        Args:
+            writer (asyncio.StreamWriter): The stream to the client
+
+        Returns:
+            None
+        """
+        self.writer = writer
+        self.outbox = ArrayList[bytes]()
+        self.flush_scheduled = False
+
+    def send(self, message: dict) -> None:
+        """
+        Method to queue a message, flushed with the others at the end of the
+        current event loop iteration
+
+        Args:
+            message (dict): The JSON message
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(N), where N is the number of queued messages, when the outbox resizes
+        """
+        self.outbox.append(json.dumps(message).encode() + b"\n")
+        if not self.flush_scheduled:
+            self.flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self.flush)
+
+    def flush(self) -> None:
+        """
+        Method to write every queued message in a single write
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(N), where N is the number of queued messages
+            Worst Case Complexity: O(N)
+        """
+        self.flush_scheduled = False
+        if not self.writer.is_closing():
+            self.writer.write(b"".join(self.outbox[i] for i in range(len(self.outbox))))
+        self.outbox.clear()
+
+
+class Table:
+    """
+    Table class holding one game, its remote seat and the moves sent for it
+    """
+
+    def __init__(self, table_id: int, game: Game, remote: RemotePlayer, connection: Connection) -> None:
+        """
+        Constructor for the Table class
+
+        Args:
+            table_id (int): The id of the table on its server
+            game (Game): The initialised game
+            remote (RemotePlayer): The seat controlled by the client
+            connection (Connection): The client's connection
+
+        Returns:
+            None
+        """
+        self.table_id = table_id
+        self.game = game
+        self.remote = remote
+        self.connection = connection
+        self.moves: asyncio.Queue = asyncio.Queue()
+        self.task: asyncio.Task | None = None
+
+    def state(self, message_type: str) -> dict:
+        """
+        Method to describe the table for the client
+
+        Args:
+            message_type (str): The type of the message
+
+        Returns:
+            dict: The JSON message
+
+        Complexity:
+            Best Case Complexity: O(N), where N is the length of self.remote.hand
+            Worst Case Complexity: O(N)
+        """
+        hand = self.remote.hand
+        return {
+            "type": message_type,
+            "table": self.table_id,
+            "turn": self.game.turn_counter,
+            "color": int(self.game.current_color),
+            "label": int(self.game.current_label),
+            "hand": [hand[i].code for i in range(len(hand))],
+        }
+
+
+class GameServer:
+    """
+    GameServer class to run many tables as asyncio tasks
+    """
+
+    def __init__(self, move_timeout: float = 5.0) -> None:
+        """
+        Constructor for the GameServer class
+
+        Args:
+            move_timeout (float): Seconds a client has for each move before it is played greedily
+
+        Returns:
+            None
+        """
+        self.move_timeout = move_timeout
+        self.tables: dict[int, Table] = {}
+        self.next_table_id = 0
+        self.server: asyncio.AbstractServer | None = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0, path: str | None = None) -> asyncio.AbstractServer:
+        """
+        Method to listen on a TCP port, or on a Unix socket if a path is given
+
+        Args:
+            host (str): The TCP host
+            port (int): The TCP port, 0 for any free port
+            path (str | None): The Unix socket path
+
+        Returns:
+            asyncio.AbstractServer: The listening server
+        """
+        if path is not None:
+            self.server = await asyncio.start_unix_server(self.handle_client, path=path)
+        else:
+            self.server = await asyncio.start_server(self.handle_client, host, port)
+        return self.server
+
+    async def stop(self) -> None:
+        """
+        Method to stop listening and cancel every table
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        for table in list(self.tables.values()):
+            table.task.cancel()
+        self.tables.clear()
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Method to serve one client connection until it closes
+
+        Args:
+            reader (asyncio.StreamReader): The stream from the client
+            writer (asyncio.StreamWriter): The stream to the client
+
+        Returns:
+            None
+        """
+        connection = Connection(writer)
+        owned = ArrayList[Table]()
+        try:
+            while line := await reader.readline():
+                try:
+                    self.handle_message(connection, owned, json.loads(line))
+                except Exception as error:
+                    connection.send({"type": "error", "reason": f"{type(error).__name__}: {error}"})
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for i in range(len(owned)):
+                owned[i].task.cancel()
+                # A task cancelled before it first ran never reaches the finally of run_table
+                self.tables.pop(owned[i].table_id, None)
+            writer.close()
+
+    def handle_message(self, connection: Connection, owned: ArrayList[Table], message: dict) -> None:
+        """
+        Method to act on one message from a client
+
+        Args:
+            connection (Connection): The client's connection
+            owned (ArrayList[Table]): The tables the client created, the only ones it may move at
+            message (dict): The decoded message
+
+        Returns:
+            None
+
+        Raises:
+            KeyError: If the message lacks a required field
+            TypeError: If the message is not a JSON object
+            ValueError: If a create message asks for an invalid table
+        """
+        if message["type"] == "create":
+            owned.append(self.create_table(connection, message["players"], message.get("seed")))
+        elif message["type"] == "move":
+            table = self.tables.get(message["table"])
+            for i in range(len(owned)):
+                if owned[i] is table:
+                    table.moves.put_nowait(message.get("card"))
+                    return
+            connection.send({"type": "error", "reason": "unknown table"})
+        else:
+            connection.send({"type": "error", "reason": "unknown message"})
+
+    def create_table(self, connection: Connection, num_players: int, seed: int | None) -> Table:
+        """
+        Method to deal a new table and start its task
+
+        Args:
+            connection (Connection): The client controlling seat 0
+            num_players (int): The number of seats
+            seed (int | None): The RandomGen seed of the deal
+
+        Returns:
+            Table: The new table
+
+        Raises:
+            ValueError: If num_players is not an integer of at least 2 or seed is not an integer or None
+        """
+        if type(num_players) is not int or num_players < 2:
+            raise ValueError(f"players must be an integer of at least 2, not {num_players!r}")
+        if seed is not None and type(seed) is not int:
+            raise ValueError(f"seed must be an integer or null, not {seed!r}")
+        remote = RemotePlayer("client")
+        players = ArrayList[Player](num_players)
+        players.append(remote)
+        for seat in range(1, num_players):
+            players.append(Player(f"bot{seat}"))
+        RandomGen.set_seed(seed)
+        game = Game()
+        game.verbose = False
+        game.initialise_game(players)
+
+        table = Table(self.next_table_id, game, remote, connection)
+        self.next_table_id += 1
+        self.tables[table.table_id] = table
+        connection.send({"type": "table", "table": table.table_id})
+        table.task = asyncio.create_task(self.run_table(table))
+        return table
+
+    async def wait_for_move(self, table: Table) -> None:
+        """
+        Method to prompt the client and wait for a legal move or the timeout
+
+        Args:
+            table (Table): The table whose remote seat is up
+
+        Returns:
+            None
+        """
+        game, remote = table.game, table.remote
+        # Moves that arrived after an earlier turn timed out are stale
+        while not table.moves.empty():
+            table.moves.get_nowait()
+        table.connection.send(table.state("turn"))
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.move_timeout
+        remote.auto = True
+        while True:
+            try:
+                code = await asyncio.wait_for(table.moves.get(), deadline - loop.time())
+            except asyncio.TimeoutError:
+                return
+            if remote.find_move(code, game.current_color, game.current_label) != -2:
+                remote.move = code
+                remote.auto = False
+                return
+            table.connection.send({"type": "error", "table": table.table_id, "reason": "illegal move"})
+
+    async def run_table(self, table: Table) -> None:
+        """
+        Method to play a table to the end, waiting on the client at its seat
+
+        Args:
+            table (Table): The table to play
+
+        Returns:
+            None
+        """
+        try:
+            while True:
+                if table.game.next_player() is table.remote:
+                    await self.wait_for_move(table)
+                winner = table.game.step()
+                if winner is not None:
+                    table.connection.send({"type": "over", "table": table.table_id, "winner": winner.name})
+                    return
+                if table.game.outcome != GameOutcome.PLAYING:
+                    reason = table.game.end_reason
+                    table.connection.send({"type": "over", "table": table.table_id, "winner": None, "reason": reason})
+                    return
+                table.connection.send(table.state("state"))
+                if table.game.next_player() is not table.remote:
+                    await asyncio.sleep(0)
+        except Exception as error:
+            table.connection.send({"type": "over", "table": table.table_id, "winner": None, "reason": str(error)})
+        finally:
+            self.tables.pop(table.table_id, None)
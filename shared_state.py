@@ -0,0 +1,62 @@
+"""
+This module moves game state between processes through shared memory.
+
+A pickled `Game` (or any ADT) is written once into a
+`multiprocessing.shared_memory` block prefixed by its length. Rollout workers
+attach to the block by name and unpickle straight from the shared buffer, so
+the state is never copied through a pipe. The ADTs pickle only their live
+elements and cards pickle as their packed codes, which keeps the block small.
+"""
+
+from __future__ import annotations
+import pickle
+from multiprocessing.shared_memory import SharedMemory
+
+HEADER_SIZE = 8
+
+
+def share_state(state: object) -> SharedMemory:
+    """
+    Method to place a picklable state in a new shared memory block
+
+    Args:
+        state (object): The state to share, usually a Game
+
+    Returns:
+        SharedMemory: The block holding the state. The caller owns it and
+        must close and unlink it once every worker is done with it.
+
+    Complexity:
+        Best Case Complexity: O(N), where N is the size of the pickled state
+        Worst Case Complexity: O(N), where N is the size of the pickled state
+        Explanation: The state is pickled once and copied once into the block
+    """
+    payload = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+    block = SharedMemory(create=True, size=HEADER_SIZE + len(payload))
+    block.buf[:HEADER_SIZE] = len(payload).to_bytes(HEADER_SIZE, "little")
+    block.buf[HEADER_SIZE : HEADER_SIZE + len(payload)] = payload
+    return block
+
+
+def load_state(name: str) -> object:
+    """
+    Method to rebuild a state from the shared memory block with the given name
+
+    Args:
+        name (str): The name of the block returned by share_state
+
+    Returns:
+        object: A private copy of the shared state
+
+    Complexity:
+        Best Case Complexity: O(N), where N is the size of the pickled state
+        Worst Case Complexity: O(N), where N is the size of the pickled state
+        Explanation: Unpickling reads the shared buffer in place through a memoryview
+    """
+    block = SharedMemory(name=name)
+    try:
+        size = int.from_bytes(block.buf[:HEADER_SIZE], "little")
+        with block.buf[HEADER_SIZE : HEADER_SIZE + size] as payload:
+            return pickle.loads(payload)
+    finally:
+        block.close()
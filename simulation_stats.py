@@ -0,0 +1,349 @@
+"""
+This module contains streaming statistics for large batches of simulated
+games, and `simulate`, which stops a batch as soon as the answers converge.
+
+`RunningStat` keeps the count, mean and sum of squared deviations of a stream
+with Welford's update, so the variance and a normal confidence interval are
+available after every sample in O(1) memory; two of them merge exactly with
+Chan's formula, for batches split across workers. `GameRecorder` is a
+`GameObserver` that counts draws and reshuffles while one game is played, and
+`SimulationStats` folds each finished game into per-seat win rates, the game
+length (with a histogram for quantiles), draws per game and reshuffles per
+game. `SimulationStats.converged` is true once the confidence interval
+half-width of every metric given a target is at or below it.
+"""
+
+from __future__ import annotations
+import math
+from statistics import NormalDist
+from data_structures import ArrayList
+from data_structures.referential_array import ArrayR
+from game import Game
+from observer import GameObserver
+from player import Player
+from random_gen import RandomGen
+
+
+class RunningStat:
+    """
+    RunningStat class to keep the mean and variance of a stream of numbers
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor for the RunningStat class
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, x: float) -> None:
+        """
+        Method to add a sample with Welford's update
+
+        Args:
+            x (float): The sample
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+
+    def merge(self, other: RunningStat) -> None:
+        """
+        Method to add every sample of another RunningStat with Chan's formula
+
+        Args:
+            other (RunningStat): The statistics of the other samples
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        count = self.count + other.count
+        if count == 0:
+            return
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.mean += delta * other.count / count
+        self.count = count
+
+    @property
+    def variance(self) -> float:
+        """
+        The sample variance, 0.0 with fewer than two samples
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def half_width(self, confidence: float = 0.95) -> float:
+        """
+        Method to compute the half-width of the normal confidence interval of the mean
+
+        Args:
+            confidence (float): The confidence level
+
+        Returns:
+            float: z * sqrt(variance / count), or inf with fewer than two samples
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if self.count < 2:
+            return math.inf
+        return NormalDist().inv_cdf((1 + confidence) / 2) * math.sqrt(self.variance / self.count)
+
+    def interval(self, confidence: float = 0.95) -> tuple[float, float]:
+        """
+        Method to compute the confidence interval of the mean
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        half_width = self.half_width(confidence)
+        return self.mean - half_width, self.mean + half_width
+
+
+class GameRecorder(GameObserver):
+    """
+    GameRecorder class to count the draws and reshuffles of one game
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor for the GameRecorder class
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.draws = 0
+        self.reshuffles = 0
+
+    def attached(self, game) -> None:
+        """Starts counting a new game."""
+        self.draws = 0
+        self.reshuffles = 0
+
+    def card_drawn(self, game_board, card) -> None:
+        """Counts a card drawn after the deal."""
+        self.draws += 1
+
+    def reshuffled(self, game_board) -> None:
+        """Counts a reshuffle."""
+        self.reshuffles += 1
+
+
+class SimulationStats:
+    """
+    SimulationStats class to aggregate the results of many games
+    """
+
+    METRICS = ("length", "draws", "reshuffles")
+
+    def __init__(self, num_players: int, targets: dict[str, float] | None = None, confidence: float = 0.95) -> None:
+        """
+        Constructor for the SimulationStats class
+
+        Args:
+            num_players (int): The number of seats
+            targets (dict[str, float] | None): The half-width to reach per metric, keyed by
+            "win_rate" (every seat), "length", "draws" or "reshuffles"
+            confidence (float): The confidence level of the intervals
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(P), where P is num_players
+            Worst Case Complexity: O(P)
+        """
+        self.targets = targets if targets is not None else {"win_rate": 0.01}
+        self.confidence = confidence
+        self.wins = ArrayR[RunningStat](num_players)
+        for seat in range(num_players):
+            self.wins[seat] = RunningStat()
+        self.stats = {metric: RunningStat() for metric in self.METRICS}
+        self.length_histogram = ArrayList[int]()
+        self.errors = 0
+        self.unfinished = 0
+
+    @property
+    def games(self) -> int:
+        """
+        The number of games recorded
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return self.stats["length"].count
+
+    def record(self, game: Game, recorder: GameRecorder) -> None:
+        """
+        Method to fold a finished game into the statistics
+
+        Args:
+            game (Game): The game, after play_game returned
+            recorder (GameRecorder): The recorder attached to the game
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(P), where P is the number of seats
+            Worst Case Complexity: O(P + L), where L is the length of the game, when the histogram grows
+        """
+        for seat in range(len(self.wins)):
+            self.wins[seat].add(1.0 if game.seating[seat] is game.winner else 0.0)
+        self.stats["length"].add(game.turn_counter)
+        self.stats["draws"].add(recorder.draws)
+        self.stats["reshuffles"].add(recorder.reshuffles)
+        while len(self.length_histogram) <= game.turn_counter:
+            self.length_histogram.append(0)
+        self.length_histogram[game.turn_counter] += 1
+
+    def merge(self, other: SimulationStats) -> None:
+        """
+        Method to add the games recorded by another SimulationStats with the same seats
+
+        Complexity:
+            Best Case Complexity: O(P + L), where L is the length of the longest game
+            Worst Case Complexity: O(P + L)
+        """
+        for seat in range(len(self.wins)):
+            self.wins[seat].merge(other.wins[seat])
+        for metric in self.METRICS:
+            self.stats[metric].merge(other.stats[metric])
+        while len(self.length_histogram) < len(other.length_histogram):
+            self.length_histogram.append(0)
+        for length in range(len(other.length_histogram)):
+            self.length_histogram[length] += other.length_histogram[length]
+        self.errors += other.errors
+        self.unfinished += other.unfinished
+
+    def length_quantile(self, q: float) -> int:
+        """
+        Method to read a quantile of the game length from the histogram
+
+        Args:
+            q (float): The quantile, between 0 and 1
+
+        Returns:
+            int: The smallest length with at least a fraction q of the games at or below it
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(L), where L is the length of the longest game
+        """
+        needed = max(1, math.ceil(q * self.games))
+        seen = 0
+        for length in range(len(self.length_histogram)):
+            seen += self.length_histogram[length]
+            if seen >= needed:
+                return length
+        return len(self.length_histogram) - 1
+
+    def half_widths(self) -> dict[str, float]:
+        """
+        Method to compute the half-width of every metric with a target, the
+        widest seat for "win_rate"
+
+        Complexity:
+            Best Case Complexity: O(P), where P is the number of seats
+            Worst Case Complexity: O(P)
+        """
+        widths = {}
+        for metric in self.targets:
+            if metric == "win_rate":
+                widths[metric] = max(self.wins[seat].half_width(self.confidence) for seat in range(len(self.wins)))
+            else:
+                widths[metric] = self.stats[metric].half_width(self.confidence)
+        return widths
+
+    def converged(self) -> bool:
+        """
+        Method to check whether every metric with a target has reached it
+
+        Complexity:
+            Best Case Complexity: O(P), where P is the number of seats
+            Worst Case Complexity: O(P)
+        """
+        widths = self.half_widths()
+        return all(widths[metric] <= target for metric, target in self.targets.items())
+
+
+def simulate(
+    stats: SimulationStats,
+    first_seed: int = 0,
+    max_games: int = 1_000_000,
+    min_games: int = 100,
+    check_every: int = 100,
+    time_limit: float | None = Game.TIME_LIMIT,
+) -> SimulationStats:
+    """
+    Method to play seeded games between greedy players until the statistics converge
+
+    Args:
+        stats (SimulationStats): The statistics to fill, which set the number of seats and the targets
+        first_seed (int): The seed of the first game, the next ones count up
+        max_games (int): The number of games after which to stop regardless
+        min_games (int): The number of games before convergence is checked
+        check_every (int): The number of games between convergence checks
+        time_limit (float | None): The wall-clock seconds each game may take, see Game.play_game
+
+    Returns:
+        SimulationStats: stats
+
+    Complexity:
+        Best Case Complexity: O(G * T), where G is the number of games played and T the cost of a game
+        Worst Case Complexity: O(max_games * T)
+        Explanation: One Game is recycled with Game.reset for every seed. Games that raise
+        are counted in stats.errors, and games ended without a winner (turn cap, stalemate
+        or time limit) in stats.unfinished; both are left out of the metrics
+    """
+    num_players = len(stats.wins)
+    players = ArrayList[Player](num_players)
+    for seat in range(num_players):
+        players.append(Player(str(seat)))
+    game = Game()
+    game.verbose = False
+    recorder = GameRecorder()
+    for seed in range(first_seed, first_seed + max_games):
+        if game.seating is None:
+            RandomGen.set_seed(seed)
+            game.initialise_game(players)
+            game.attach(recorder)
+        else:
+            game.reset(seed)
+        try:
+            winner = game.play_game(time_limit)
+        except Exception:
+            stats.errors += 1
+            continue
+        if winner is None:
+            stats.unfinished += 1
+            continue
+        stats.record(game, recorder)
+        if stats.games >= min_games and stats.games % check_every == 0 and stats.converged():
+            break
+    return stats
@@ -0,0 +1,324 @@
+"""
+This module contains a sequential probability ratio test (SPRT) gate for
+promoting a new bot policy over the incumbent.
+
+The policies play two-player games head to head. Every seeded deal is played
+twice with the seats swapped, and the deck, reshuffles and wild colors come
+from `RandomStream`s of the deal, so neither seat order nor the global
+`RandomGen` biases the match. A game is a win or a loss for the new policy
+(games that raise are counted apart), so the log-likelihood ratio of
+H1: elo = elo1 against H0: elo = elo0 is a sum of Bernoulli terms. The match
+stops as soon as the LLR leaves (log(beta / (1 - alpha)), log((1 - beta) /
+alpha)): above it H1 is accepted and the new policy passes, below it H0 is
+accepted and it fails.
+
+Batches of deals are played on a process pool and folded in the order they
+were submitted, so a match is reproducible whatever the number of
+processes, and the LLR is streamed to a progress callback after every batch.
+
+Usage: python sprt.py [--elo0 0] [--elo1 10] [--alpha 0.05] [--beta 0.05] [--processes N]
+"""
+
+from __future__ import annotations
+import argparse
+import math
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable
+from data_structures import ArrayList, CircularQueue
+from game import Game
+from player import Player
+from random_gen import RandomStream
+
+H0, H1 = "H0", "H1"
+
+
+def elo_to_score(elo: float) -> float:
+    """
+    Method to convert an Elo difference to the expected score of the stronger side
+
+    Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+    """
+    return 1 / (1 + 10 ** (-elo / 400))
+
+
+def score_to_elo(score: float) -> float:
+    """
+    Method to convert an expected score to an Elo difference
+
+    Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+    """
+    if score <= 0:
+        return -math.inf
+    if score >= 1:
+        return math.inf
+    return -400 * math.log10(1 / score - 1)
+
+
+class SPRT:
+    """
+    SPRT class to accumulate the log-likelihood ratio of a match
+    """
+
+    def __init__(self, elo0: float = 0.0, elo1: float = 5.0, alpha: float = 0.05, beta: float = 0.05) -> None:
+        """
+        Constructor for the SPRT class
+
+        Args:
+            elo0 (float): The Elo difference of H0, under which the new policy fails
+            elo1 (float): The Elo difference of H1, under which it passes; above elo0
+            alpha (float): The probability of passing when H0 holds
+            beta (float): The probability of failing when H1 holds
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If elo1 is not above elo0 or alpha or beta is not in (0, 1)
+        """
+        if elo1 <= elo0 or not 0 < alpha < 1 or not 0 < beta < 1:
+            raise ValueError("Need elo0 < elo1 and alpha, beta in (0, 1)")
+        self.elo0, self.elo1, self.alpha, self.beta = elo0, elo1, alpha, beta
+        p0, p1 = elo_to_score(elo0), elo_to_score(elo1)
+        self.win_llr = math.log(p1 / p0)
+        self.loss_llr = math.log((1 - p1) / (1 - p0))
+        self.lower = math.log(beta / (1 - alpha))
+        self.upper = math.log((1 - beta) / alpha)
+        self.wins = 0
+        self.losses = 0
+        self.errors = 0
+
+    def add(self, wins: int, losses: int, errors: int = 0) -> None:
+        """
+        Method to add the results of some games
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.wins += wins
+        self.losses += losses
+        self.errors += errors
+
+    @property
+    def games(self) -> int:
+        """
+        The number of decided games
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return self.wins + self.losses
+
+    @property
+    def llr(self) -> float:
+        """
+        The log-likelihood ratio of H1 against H0
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return self.wins * self.win_llr + self.losses * self.loss_llr
+
+    def elo(self) -> float:
+        """
+        Method to estimate the Elo difference from the score so far
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return score_to_elo(self.wins / self.games) if self.games else 0.0
+
+    def status(self) -> str | None:
+        """
+        Method to read the decision
+
+        Returns:
+            str | None: H1 if the new policy passed, H0 if it failed, None if undecided
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        llr = self.llr
+        if llr >= self.upper:
+            return H1
+        if llr <= self.lower:
+            return H0
+        return None
+
+
+def play_match_game(
+    new: type[Player], incumbent: type[Player], seed: int, new_first: bool, time_limit: float | None = Game.TIME_LIMIT
+) -> Player | None:
+    """
+    Method to play one game of a deal between the two policies
+
+    Args:
+        new (type[Player]): The new policy
+        incumbent (type[Player]): The incumbent policy
+        seed (int): The seed of the deal
+        new_first (bool): Whether the new policy takes the first seat
+        time_limit (float | None): The wall-clock seconds the game may take, see Game.play_game
+
+    Returns:
+        Player | None: The new player if it won, the incumbent if it won, None if the game
+        raised or ended without a winner
+
+    Complexity:
+        Best Case Complexity: O(T), where T is the cost of a game
+        Worst Case Complexity: O(T)
+    """
+    challenger, defender = new("new"), incumbent("incumbent")
+    players = ArrayList[Player](2)
+    players.append(challenger if new_first else defender)
+    players.append(defender if new_first else challenger)
+    game = Game()
+    game.verbose = False
+    game.deck_random = RandomStream(2 * seed)
+    game.color_random = RandomStream(2 * seed + 1)
+    game.initialise_game(players)
+    try:
+        winner = game.play_game(time_limit)
+    except Exception:
+        return None
+    if winner is None:
+        return None
+    return challenger if winner is challenger else defender
+
+
+def play_batch(
+    new: type[Player], incumbent: type[Player], first_seed: int, num_deals: int, time_limit: float | None = Game.TIME_LIMIT
+) -> tuple[int, int, int]:
+    """
+    Method to play a batch of deals, each with both seat orders; runs in the worker processes
+
+    Args:
+        new (type[Player]): The new policy, importable by the workers
+        incumbent (type[Player]): The incumbent policy, importable by the workers
+        first_seed (int): The seed of the first deal, the next ones count up
+        num_deals (int): The number of deals
+        time_limit (float | None): The wall-clock seconds each game may take
+
+    Returns:
+        tuple[int, int, int]: The wins, losses and errors of the new policy; games
+        without a winner count as errors
+
+    Complexity:
+        Best Case Complexity: O(num_deals * T), where T is the cost of a game
+        Worst Case Complexity: O(num_deals * T)
+    """
+    wins = losses = errors = 0
+    for seed in range(first_seed, first_seed + num_deals):
+        for new_first in (True, False):
+            winner = play_match_game(new, incumbent, seed, new_first, time_limit)
+            if winner is None:
+                errors += 1
+            elif winner.name == "new":
+                wins += 1
+            else:
+                losses += 1
+    return wins, losses, errors
+
+
+def run_match(
+    new: type[Player],
+    incumbent: type[Player],
+    sprt: SPRT,
+    batch_size: int = 100,
+    processes: int | None = None,
+    max_games: int = 1_000_000,
+    first_seed: int = 0,
+    progress: Callable[[SPRT], None] | None = None,
+    time_limit: float | None = Game.TIME_LIMIT,
+) -> SPRT:
+    """
+    Method to play the match until the SPRT decides or max_games is reached
+
+    Args:
+        new (type[Player]): The new policy
+        incumbent (type[Player]): The incumbent policy
+        sprt (SPRT): The test, which is updated in place
+        batch_size (int): The number of deals per batch, each played twice
+        processes (int | None): The size of the process pool, None for one per CPU,
+        0 to play in this process
+        max_games (int): The number of games after which to stop undecided
+        first_seed (int): The seed of the first deal
+        progress (Callable[[SPRT], None] | None): Called with the test after every batch
+        time_limit (float | None): The wall-clock seconds each game may take, a watchdog
+        for workers that only ends games far longer than the turn cap allows; None relies
+        on the turn cap alone
+
+    Returns:
+        SPRT: sprt
+
+    Complexity:
+        Best Case Complexity: O(B * T), where B is batch_size and T the cost of a game
+        Worst Case Complexity: O(max_games * T)
+        Explanation: Twice the pool size of batches are kept in flight; batches still
+        running when the test decides are cancelled or ignored
+    """
+    next_seed = first_seed
+    last_seed = first_seed + (max_games + 1) // 2
+    if processes == 0:
+        while sprt.status() is None and next_seed < last_seed:
+            count = min(batch_size, last_seed - next_seed)
+            sprt.add(*play_batch(new, incumbent, next_seed, count, time_limit))
+            next_seed += count
+            if progress is not None:
+                progress(sprt)
+        return sprt
+
+    workers = processes if processes is not None else os.cpu_count() or 1
+    with ProcessPoolExecutor(workers) as pool:
+        in_flight = CircularQueue[Future](2 * workers)
+        while True:
+            while not in_flight.is_full() and next_seed < last_seed:
+                count = min(batch_size, last_seed - next_seed)
+                in_flight.append(pool.submit(play_batch, new, incumbent, next_seed, count, time_limit))
+                next_seed += count
+            if in_flight.is_empty():
+                break
+            sprt.add(*in_flight.serve().result())
+            if progress is not None:
+                progress(sprt)
+            if sprt.status() is not None:
+                break
+        while not in_flight.is_empty():
+            in_flight.serve().cancel()
+    return sprt
+
+
+def print_progress(sprt: SPRT) -> None:
+    """Prints the LLR and the score so far on a line."""
+    print(
+        f"games {sprt.games:8d}  W {sprt.wins:7d}  L {sprt.losses:7d}  elo {sprt.elo():+7.1f}  "
+        f"LLR {sprt.llr:+6.2f} ({sprt.lower:+.2f}, {sprt.upper:+.2f})"
+    )
+
+
+if __name__ == "__main__":
+    from ab_test import ReversePlayer
+
+    p = argparse.ArgumentParser()
+    p.add_argument("--elo0", type=float, default=0.0)
+    p.add_argument("--elo1", type=float, default=10.0)
+    p.add_argument("--alpha", type=float, default=0.05)
+    p.add_argument("--beta", type=float, default=0.05)
+    p.add_argument("--batch", type=int, default=200, help="Deals per batch, each played twice")
+    p.add_argument("--processes", type=int, default=None, help="Pool size, one per CPU if omitted")
+    p.add_argument("--max-games", type=int, default=1_000_000)
+    args = p.parse_args()
+
+    result = run_match(
+        Player, ReversePlayer, SPRT(args.elo0, args.elo1, args.alpha, args.beta),
+        args.batch, args.processes, args.max_games, progress=print_progress,
+    )
+    print({H1: "PASS", H0: "FAIL", None: "UNDECIDED"}[result.status()])
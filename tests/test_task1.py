@@ -1,5 +1,5 @@
 from unittest import TestCase
-from card import Card, CardColor, CardLabel
+from card import Card, CardColor, CardLabel, NUM_CARD_CODES, PLAYABLE, is_playable
 from data_structures.referential_array import ArrayR
 from player import Player
 from ed_utils.decorators import number, visibility
@@ -57,3 +57,31 @@ class TestTask1(TestCase):
         self.assertEqual(self.player.play_card(CardColor.RED, CardLabel.TWO), None)
         self.assertEqual(self.player.play_card(CardColor.BLUE, CardLabel.THREE), card)
         self.assertEqual(len(self.player.hand), 0)
+
+    @number("1.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_playable_table(self) -> None:
+        for current in range(NUM_CARD_CODES):
+            top: Card = Card.from_code(current)
+            for candidate in range(NUM_CARD_CODES):
+                card: Card = Card.from_code(candidate)
+                self.assertEqual(
+                    bool(PLAYABLE[current * NUM_CARD_CODES + candidate]),
+                    is_playable(card, top.color, top.label),
+                )
+
+    @number("1.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_play_card_matches_reference(self) -> None:
+        other: Player = Player("Player 2")
+        for i in range(40):
+            card: Card = Card.from_code((i * 37) % NUM_CARD_CODES)
+            self.player.add_card(card)
+            other.add_card(card)
+        for color in [CardColor.RED, CardColor.BLUE, CardColor.GREEN, CardColor.YELLOW]:
+            for label in CardLabel:
+                self.assertEqual(
+                    str(self.player.play_card(color, label)),
+                    str(other.play_card_reference(color, label)),
+                )
+        self.assertEqual(str(self.player.hand), str(other.hand))
@@ -0,0 +1,84 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+
+from game import Game
+from random_gen import RandomGen
+from player import Player
+from config import Config
+from data_structures import ArrayList
+from transposition import TranspositionTable, NO_MOVE
+from zobrist import ZobristHash
+
+
+class TestTranspositionTable(TestCase):
+
+    @number("10.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_store_and_lookup(self) -> None:
+        table = TranspositionTable(4096)
+        table.store(12345, 0.5, 3, 17)
+        self.assertEqual(table.lookup(12345), (0.5, 3, 17))
+        self.assertIsNone(table.lookup(54321))
+        self.assertIsNone(table.lookup(12345, min_depth=4))
+        self.assertEqual((table.hits, table.misses, table.stores), (1, 2, 1))
+        table.store(12345, -1.0, 1)
+        self.assertEqual(table.lookup(12345), (0.5, 3, 17), "A shallower result must not replace a deeper one")
+        table.new_search()
+        table.store(12345, -1.0, 1)
+        self.assertEqual(table.lookup(12345), (-1.0, 1, NO_MOVE), "Results of older searches are replaced")
+
+    @number("10.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_memory_budget(self) -> None:
+        for budget in [1 << 10, 1 << 16, 1 << 20]:
+            table = TranspositionTable(budget)
+            self.assertLessEqual(table.memory_bytes(), budget)
+            self.assertGreater(table.memory_bytes(), budget // 2)
+        table = TranspositionTable(1 << 12)
+        for key in range(10 * len(table)):
+            table.store(key * 0x9E3779B97F4A7C15 % (1 << 64), float(key), key % 5)
+        self.assertEqual(table.stores, 10 * len(table))
+        occupied = sum(1 for slot in range(len(table)) if table.depths[slot])
+        self.assertEqual(table.evictions, table.stores - occupied)
+        self.assertGreaterEqual(table.evictions, 9 * len(table))
+        table.clear()
+        self.assertIsNone(table.lookup(0))
+
+    @number("10.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_replacement_prefers_depth_and_recency(self) -> None:
+        table = TranspositionTable(TranspositionTable.ENTRY_BYTES * TranspositionTable.BUCKET_SIZE)
+        size = TranspositionTable.BUCKET_SIZE
+        for key in range(size):
+            table.store(key, 0.0, 10 if key == 0 else 1)
+        self.assertIsNotNone(table.lookup(1))
+        table.store(size, 0.0, 1)
+        self.assertIsNotNone(table.lookup(0), "The deepest entry is kept")
+        self.assertIsNotNone(table.lookup(1), "A recently used entry is kept")
+        self.assertIsNone(table.lookup(2), "The shallow unused entry is evicted")
+        table.new_search()
+        table.store(size + 1, 0.0, 1)
+        self.assertIsNotNone(table.lookup(size + 1))
+        self.assertIsNotNone(table.lookup(0), "Depth outweighs one generation of age")
+        self.assertEqual(table.evictions, 2)
+
+    @number("10.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_keyed_by_zobrist(self) -> None:
+        RandomGen.set_seed(5)
+        Config.NUM_CARDS_AT_INIT = 7
+        players: ArrayList[Player] = ArrayList(2)
+        for name in ["Alice", "Bob"]:
+            players.append(Player(name))
+        game = Game()
+        game.verbose = False
+        game.initialise_game(players)
+        position = ZobristHash()
+        game.attach(position)
+        table = TranspositionTable(1 << 16)
+        turns = 0
+        while turns < 20 and game.step() is None:
+            table.store(position.value, float(turns), 0)
+            turns += 1
+        self.assertEqual(table.lookup(position.value)[0], float(turns - 1))
@@ -0,0 +1,142 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures import ArrayList
+
+from game import Game
+from random_gen import RandomGen
+from player import Player
+from config import Config
+from endgame import EndgamePlayer, EndgameSolver, AGAIN, ERROR, PASS, UNKNOWN, WIN, WON
+
+
+class CountingSolver(EndgameSolver):
+    """EndgameSolver counting its solves and how many were proven."""
+
+    def __init__(self) -> None:
+        EndgameSolver.__init__(self)
+        self.solves = self.proven = 0
+
+    def solve(self, player: Player) -> tuple[int, int]:
+        value, move = EndgameSolver.solve(self, player)
+        self.solves += 1
+        self.proven += value != UNKNOWN
+        return value, move
+
+
+class TestEndgame(TestCase):
+
+    def setUp(self) -> None:
+        self.init_cards = Config.NUM_CARDS_AT_INIT
+        Config.NUM_CARDS_AT_INIT = 3
+
+    def tearDown(self) -> None:
+        Config.NUM_CARDS_AT_INIT = self.init_cards
+
+    def deal(self, seed: int, first: Player, second: Player, solver: EndgameSolver) -> Game:
+        RandomGen.set_seed(seed)
+        players: ArrayList[Player] = ArrayList(2)
+        players.append(first)
+        players.append(second)
+        game = Game()
+        game.verbose = False
+        game.initialise_game(players)
+        game.attach(solver)
+        return game
+
+    def snapshot(self, position) -> tuple:
+        return (
+            position.mine, position.theirs, position.state,
+            position.pile[position.top:], tuple(sorted(position.discard)), position.seed,
+        )
+
+    @number("11.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_position_follows_engine(self) -> None:
+        for seed in range(40):
+            solver = EndgameSolver()
+            game = self.deal(seed, Player("Alice"), Player("Bob"), solver)
+            while True:
+                mover = game.players.peek()
+                position = solver.position(mover)
+                moves = position.moves()
+                # Player.play_card prefers the smallest code
+                outcome = position.play(min(moves)) if moves else position.draw_turn()
+                try:
+                    winner = game.step()
+                except Exception:
+                    self.assertEqual(outcome, ERROR)
+                    break
+                if winner is not None:
+                    self.assertEqual(outcome, WON)
+                    break
+                self.assertEqual(game.players.peek() is mover, outcome == AGAIN)
+                if outcome == PASS:
+                    position.swap()
+                self.assertEqual(self.snapshot(position), self.snapshot(solver.position(game.players.peek())))
+
+    @number("11.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_proven_wins_are_won(self) -> None:
+        proven = 0
+        for seed in range(40):
+            solver = EndgameSolver()
+            alice = EndgamePlayer("Alice", solver)
+            game = self.deal(seed, alice, Player("Bob"), solver)
+            value, _ = solver.solve(alice)
+            if value == WIN:
+                proven += 1
+                self.assertIs(game.play_game(), alice, f"Seed {seed} was proven but not won")
+        self.assertGreater(proven, 0)
+
+    @number("11.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_solve_leaves_game_untouched(self) -> None:
+        solver = EndgameSolver()
+        alice, bob = Player("Alice"), Player("Bob")
+        game = self.deal(7, alice, bob, solver)
+        seed = RandomGen.seed
+        before = self.snapshot(solver.position(alice))
+        solver.solve(alice)
+        solver.solve(bob)
+        self.assertEqual(RandomGen.seed, seed)
+        self.assertEqual(self.snapshot(solver.position(alice)), before)
+        self.assertLess(solver.nodes, 3 * solver.max_nodes)
+
+    @number("11.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_threshold(self) -> None:
+        solver = EndgameSolver(threshold=2)
+        alice = EndgamePlayer("Alice", solver)
+        self.deal(3, alice, Player("Bob"), solver)
+        self.assertFalse(solver.applies(alice))
+        solver.threshold = 3
+        self.assertTrue(solver.applies(alice))
+        players: ArrayList[Player] = ArrayList(3)
+        for name in ["A", "B", "C"]:
+            players.append(Player(name))
+        game = Game()
+        game.verbose = False
+        game.initialise_game(players)
+        solver.attached(game)
+        self.assertFalse(solver.applies(players[0]), "The solver only handles two players")
+
+    @number("11.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_proven_rate(self) -> None:
+        # the search is bounded, so these are regression floors for the default budget,
+        # a little under the rates measured over these seeds (42%, 57% and 36%)
+        for cards, floor in ((3, 0.4), (4, 0.5), (5, 0.35)):
+            Config.NUM_CARDS_AT_INIT = cards
+            solves = proven = 0
+            for seed in range(20):
+                solver = CountingSolver()
+                game = self.deal(seed, EndgamePlayer("Alice", solver), Player("Bob"), solver)
+                try:
+                    game.play_game()
+                except Exception:
+                    pass
+                solves += solver.solves
+                proven += solver.proven
+            with self.subTest(cards=cards):
+                self.assertGreaterEqual(proven / solves, floor, f"Only {proven} of {solves} solves were proven")
@@ -0,0 +1,90 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures import ArrayList
+
+from game import Game
+from random_gen import RandomGen
+from card import CardColor, CardLabel, NUM_CARD_CODES, PLAYABLE, card_code
+from player import Player
+from config import Config
+from card_tracker import CardCounter, CardTracker
+
+
+class TestCardTracker(TestCase):
+
+    def deal(self, seed: int) -> Game:
+        RandomGen.set_seed(seed)
+        Config.NUM_CARDS_AT_INIT = 7
+        players: ArrayList[Player] = ArrayList(4)
+        for name in ["Alice", "Bob", "Charlie", "David"]:
+            players.append(Player(name))
+        game = Game()
+        game.verbose = False
+        game.initialise_game(players)
+        return game
+
+    def counts(self, counter: CardCounter) -> list[int]:
+        return [counter[code] for code in range(NUM_CARD_CODES)]
+
+    @number("12.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_playable_matches_table(self) -> None:
+        counter = CardCounter()
+        RandomGen.set_seed(3)
+        for _ in range(200):
+            counter.add(RandomGen.randint(0, NUM_CARD_CODES - 1))
+        for color in CardColor:
+            for label in CardLabel:
+                state = card_code(color, label) * NUM_CARD_CODES
+                expected = sum(counter[code] for code in range(NUM_CARD_CODES) if PLAYABLE[state + code])
+                self.assertEqual(counter.playable(color, label), expected, f"{color} {label}")
+        self.assertEqual(len(counter), 200)
+
+    @number("12.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_incremental_matches_recount(self) -> None:
+        for seed in range(10):
+            game = self.deal(seed)
+            tracker = CardTracker()
+            game.attach(tracker)
+            turns = 0
+            while turns < 300:
+                board = game.game_board
+                if turns % 10 == 9 and len(board.draw_pile) + len(board.discard_pile) <= Config.DECK_SIZE:
+                    # Greedy games rarely run the draw pile dry, so reshuffle by hand
+                    board.reshuffle()
+                try:
+                    if game.step() is not None:
+                        break
+                except Exception:
+                    break
+                turns += 1
+                fresh = CardTracker()
+                fresh.attached(game)
+                self.assertEqual(self.counts(tracker.pile), self.counts(fresh.pile))
+                for i in range(len(game.seating)):
+                    player = game.seating[i]
+                    self.assertEqual(self.counts(tracker.counter(player)), self.counts(fresh.counter(player)))
+                    self.assertAlmostEqual(tracker.draw_probability(player), fresh.draw_probability(player))
+
+    @number("12.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_probability_queries(self) -> None:
+        game = self.deal(11)
+        tracker = CardTracker()
+        game.attach(tracker)
+        pile = game.game_board.draw_pile
+        state = card_code(game.current_color, game.current_label) * NUM_CARD_CODES
+        playable = sum(1 for i in range(len(pile)) if PLAYABLE[state + pile.array[i].code])
+        self.assertAlmostEqual(tracker.draw_probability(), playable / len(pile))
+        self.assertAlmostEqual(tracker.expected_draws(), (len(pile) + 1) / (playable + 1))
+        alice = game.seating[0]
+        self.assertEqual(len(tracker.counter(alice)), len(pile) + 3 * Config.NUM_CARDS_AT_INIT)
+
+        counter = CardCounter()
+        counter.add(card_code(CardColor.RED, CardLabel.FIVE), 3)
+        self.assertEqual(counter.expected_draws(CardColor.BLUE, CardLabel.ONE), float("inf"))
+        counter.add(card_code(CardColor.BLUE, CardLabel.TWO))
+        self.assertAlmostEqual(counter.probability(CardColor.BLUE, CardLabel.ONE), 0.25)
+        self.assertAlmostEqual(counter.expected_draws(CardColor.BLUE, CardLabel.ONE), 2.5)
@@ -0,0 +1,60 @@
+import statistics
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+
+from random_gen import RandomGen
+from simulation_stats import RunningStat, SimulationStats, simulate
+
+
+class TestSimulationStats(TestCase):
+
+    @number("13.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_running_stat(self) -> None:
+        RandomGen.set_seed(1)
+        samples = [RandomGen.random_float() * 100 for _ in range(500)]
+        stat = RunningStat()
+        for x in samples:
+            stat.add(x)
+        self.assertEqual(stat.count, 500)
+        self.assertAlmostEqual(stat.mean, statistics.mean(samples))
+        self.assertAlmostEqual(stat.variance, statistics.variance(samples))
+        low, high = stat.interval(0.95)
+        self.assertAlmostEqual((high - low) / 2, 1.959964 * statistics.stdev(samples) / 500 ** 0.5, places=4)
+        self.assertEqual(RunningStat().half_width(), float("inf"))
+
+    @number("13.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_merge(self) -> None:
+        samples = [float(x * x % 17) for x in range(300)]
+        whole, left, right = RunningStat(), RunningStat(), RunningStat()
+        for i, x in enumerate(samples):
+            whole.add(x)
+            (left if i < 120 else right).add(x)
+        left.merge(right)
+        self.assertEqual(left.count, whole.count)
+        self.assertAlmostEqual(left.mean, whole.mean)
+        self.assertAlmostEqual(left.variance, whole.variance)
+
+        first = simulate(SimulationStats(3), first_seed=0, max_games=40)
+        second = simulate(SimulationStats(3), first_seed=40, max_games=40)
+        both = simulate(SimulationStats(3), first_seed=0, max_games=80)
+        first.merge(second)
+        self.assertEqual(first.games, both.games)
+        self.assertAlmostEqual(first.stats["length"].mean, both.stats["length"].mean)
+        self.assertEqual(first.length_quantile(0.9), both.length_quantile(0.9))
+
+    @number("13.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_early_stopping(self) -> None:
+        stats = simulate(SimulationStats(2, {"win_rate": 0.1, "length": 5.0}), max_games=5000, min_games=50, check_every=10)
+        self.assertLess(stats.games, 5000)
+        self.assertTrue(stats.converged())
+        widths = stats.half_widths()
+        self.assertLessEqual(widths["win_rate"], 0.1)
+        self.assertLessEqual(widths["length"], 5.0)
+        self.assertAlmostEqual(stats.wins[0].mean + stats.wins[1].mean, 1.0)
+        self.assertEqual(sum(stats.length_histogram[i] for i in range(len(stats.length_histogram))), stats.games)
+        self.assertLessEqual(stats.length_quantile(0.5), stats.length_quantile(0.99))
+        self.assertGreater(stats.stats["draws"].mean, 0)
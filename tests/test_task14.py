@@ -0,0 +1,64 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures import ArrayList
+
+from ab_test import ReversePlayer, compare, paired_game, play_paired
+from card import Card, CardColor, CardLabel
+from player import Player
+from random_gen import RandomGen, RandomStream
+
+
+class TestPairedHarness(TestCase):
+
+    @number("14.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_stream_matches_random_gen(self) -> None:
+        RandomGen.set_seed(99)
+        stream = RandomStream(99)
+        for _ in range(50):
+            self.assertEqual(stream.randint(0, 1000), RandomGen.randint(0, 1000))
+        cards = [Card(CardColor(i % 5), CardLabel(i % 15)) for i in range(40)]
+        expected: ArrayList[Card] = ArrayList(40)
+        shuffled: ArrayList[Card] = ArrayList(40)
+        for card in cards:
+            expected.append(card)
+            shuffled.append(card)
+        RandomGen.random_shuffle(expected)
+        stream.random_shuffle(shuffled)
+        self.assertEqual([expected[i] for i in range(40)], [shuffled[i] for i in range(40)])
+        self.assertEqual(stream.seed, RandomGen.seed)
+
+    @number("14.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_deals_are_paired(self) -> None:
+        seed = RandomGen.seed
+        for deal in range(10):
+            greedy, _ = paired_game(Player, deal, 3)
+            reverse, _ = paired_game(ReversePlayer, deal, 3)
+            for game in (greedy, reverse):
+                self.assertIs(game.seating[deal % 3].__class__, Player if game is greedy else ReversePlayer)
+            pile_a, pile_b = greedy.game_board.draw_pile, reverse.game_board.draw_pile
+            self.assertEqual([pile_a.array[i] for i in range(len(pile_a))], [pile_b.array[i] for i in range(len(pile_b))])
+            self.assertEqual((greedy.current_color, greedy.current_label), (reverse.current_color, reverse.current_label))
+        self.assertEqual(RandomGen.seed, seed, "The harness must not touch the global generator")
+
+    @number("14.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_identical_policies_have_no_variance(self) -> None:
+        for deal in range(20):
+            scores = play_paired(Player, Player, deal, 2)
+            if scores is not None:
+                self.assertEqual(scores[0], scores[1])
+        report = compare(Player, Player, 50, 4)
+        self.assertEqual(report["difference"], 0.0)
+        self.assertEqual(report["paired_variance"], 0.0)
+        self.assertEqual(report["pairs"] + report["errors"], 50)
+
+    @number("14.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_compare(self) -> None:
+        report = compare(Player, ReversePlayer, 200, 2)
+        self.assertAlmostEqual(report["difference"], report["win_rate_a"] - report["win_rate_b"])
+        self.assertGreater(report["paired_variance"], 0.0)
+        self.assertLess(report["paired_variance"], report["unpaired_variance"])
@@ -0,0 +1,57 @@
+import math
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+
+from ab_test import ReversePlayer
+from player import Player
+from sprt import H0, H1, SPRT, elo_to_score, play_batch, run_match, score_to_elo
+
+
+class TestSPRT(TestCase):
+
+    @number("15.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_llr(self) -> None:
+        sprt = SPRT(0, 10, 0.05, 0.05)
+        self.assertAlmostEqual(sprt.upper, math.log(19))
+        self.assertAlmostEqual(sprt.lower, -math.log(19))
+        p1 = elo_to_score(10)
+        sprt.add(3, 2)
+        self.assertAlmostEqual(sprt.llr, 3 * math.log(p1 / 0.5) + 2 * math.log((1 - p1) / 0.5))
+        self.assertIsNone(sprt.status())
+        self.assertAlmostEqual(score_to_elo(elo_to_score(37.5)), 37.5)
+        with self.assertRaises(ValueError):
+            SPRT(5, 5)
+
+    @number("15.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_decisions(self) -> None:
+        strong = SPRT(0, 20)
+        weak = SPRT(0, 20)
+        while strong.status() is None:
+            strong.add(60, 40)
+        while weak.status() is None:
+            weak.add(45, 55)
+        self.assertEqual(strong.status(), H1)
+        self.assertEqual(weak.status(), H0)
+        self.assertGreater(strong.elo(), 0)
+        self.assertLess(weak.elo(), 0)
+
+    @number("15.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_seats_are_swapped(self) -> None:
+        wins, losses, errors = play_batch(Player, Player, 0, 30)
+        self.assertEqual(wins + losses + errors, 60)
+        self.assertEqual(wins, losses, "Identical policies split every deal")
+
+    @number("15.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_match_is_reproducible(self) -> None:
+        progress = []
+        local = run_match(ReversePlayer, Player, SPRT(-10, 10), batch_size=25, processes=0, max_games=400,
+                          progress=lambda sprt: progress.append(sprt.llr))
+        pooled = run_match(ReversePlayer, Player, SPRT(-10, 10), batch_size=25, processes=2, max_games=400)
+        self.assertEqual((local.wins, local.losses, local.errors), (pooled.wins, pooled.losses, pooled.errors))
+        self.assertEqual(progress[-1], local.llr)
+        self.assertTrue(local.status() is not None or local.games + local.errors == 400)
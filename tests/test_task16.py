@@ -0,0 +1,117 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures import ArrayList
+from data_structures.referential_array import ArrayR
+
+from game import Game
+from random_gen import RandomGen
+from player import Player
+from config import Config
+from zobrist import ZobristHash
+
+
+class TestGameReset(TestCase):
+
+    def setUp(self) -> None:
+        Config.NUM_CARDS_AT_INIT = 7
+
+    def new_game(self, seed: int, num_players: int = 3) -> Game:
+        RandomGen.set_seed(seed)
+        players: ArrayList[Player] = ArrayList(num_players)
+        for seat in range(num_players):
+            players.append(Player(str(seat)))
+        game = Game()
+        game.verbose = False
+        game.initialise_game(players)
+        return game
+
+    def state(self, game: Game) -> tuple:
+        board = game.game_board
+        hands = tuple(
+            tuple(game.seating[seat].hand[i].code for i in range(len(game.seating[seat].hand)))
+            for seat in range(len(game.seating))
+        )
+        draw = tuple(board.draw_pile.array[i].code for i in range(len(board.draw_pile)))
+        discard = tuple(board.discard_pile[i].code for i in range(len(board.discard_pile)))
+        order = tuple(game.players.peek_at(i).name for i in range(len(game.players)))
+        return hands, draw, discard, order, game.current_color, game.current_label, game.turn_counter
+
+    def outcome(self, game: Game) -> tuple:
+        try:
+            winner = game.play_game().name
+        except Exception as error:
+            winner = str(error)
+        return winner, game.turn_counter, RandomGen.seed
+
+    @number("16.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_reset_matches_fresh_game(self) -> None:
+        recycled = self.new_game(1000)
+        self.outcome(recycled)
+        for seed in range(30):
+            recycled.reset(seed)
+            fresh = self.new_game(seed)
+            self.assertEqual(self.state(recycled), self.state(fresh))
+            RandomGen.set_seed(seed * 7)
+            fresh_outcome = self.outcome(fresh)
+            RandomGen.set_seed(seed * 7)
+            self.assertEqual(self.outcome(recycled), fresh_outcome)
+
+    @number("16.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_storage_is_reused(self) -> None:
+        game = self.new_game(5)
+        board = game.game_board
+        storage = (board.draw_pile.array, board.discard_pile.array, game.players.array, game.deck)
+        cards = set(id(game.deck[i]) for i in range(len(game.deck)))
+        for _ in range(60):
+            game.seating[0].hand.append(game.deck[0])
+        self.assertGreaterEqual(len(game.seating[0].hand.array), 60)
+        for seed in range(10):
+            hands = [game.seating[seat].hand.array for seat in range(3)]
+            game.reset(seed)
+            self.assertIs(game.game_board, board)
+            self.assertEqual((board.draw_pile.array, board.discard_pile.array, game.players.array, game.deck), storage)
+            self.assertEqual(set(id(game.deck[i]) for i in range(len(game.deck))), cards)
+            for seat in range(3):
+                self.assertIs(game.seating[seat].hand.array, hands[seat], "Grown hands keep their storage")
+            self.outcome(game)
+
+    @number("16.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_reset_reattaches_observer(self) -> None:
+        game = self.new_game(8)
+        position = ZobristHash()
+        game.attach(position)
+        for seed in range(5):
+            self.outcome(game)
+            game.reset(seed)
+            fresh = ZobristHash()
+            fresh.attached(game)
+            self.assertEqual(position.value, fresh.value)
+            self.assertIs(game.seating[1].observer, position)
+
+    @number("16.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_reset_and_play_build_no_arrays(self) -> None:
+        game = self.new_game(0, 4)
+        for seed in range(20):
+            game.reset(seed)
+            self.outcome(game)
+        built = [0]
+        init = ArrayR.__init__
+
+        def counting(array, *args, **kwargs) -> None:
+            built[0] += 1
+            init(array, *args, **kwargs)
+
+        ArrayR.__init__ = counting
+        try:
+            # Deals and penalty draws reuse Game.draw_batch, and hands keep their storage
+            for seed in range(20):
+                game.reset(seed)
+                self.outcome(game)
+        finally:
+            ArrayR.__init__ = init
+        self.assertEqual(built[0], 0)
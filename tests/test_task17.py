@@ -0,0 +1,101 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures import ArrayList
+from data_structures.referential_array import ArrayR
+
+from card import Card, CardColor, CardLabel, deck_template
+from game import Game
+from random_gen import RandomGen
+from player import Player
+from config import Config
+
+
+def legacy_cards() -> ArrayList[Card]:
+    """The deck as Game.generate_cards built it card by card."""
+    cards: ArrayList[Card] = ArrayList(Config.DECK_SIZE)
+    for color in CardColor:
+        if color != CardColor.BLACK:
+            for i in range(10):
+                cards.append(Card(color, CardLabel(i)))
+                cards.append(Card(color, CardLabel(i)))
+            for i in range(2):
+                cards.append(Card(color, CardLabel.SKIP))
+                cards.append(Card(color, CardLabel.REVERSE))
+                cards.append(Card(color, CardLabel.DRAW_TWO))
+        else:
+            for i in range(4):
+                cards.append(Card(CardColor.BLACK, CardLabel.CRAZY))
+                cards.append(Card(CardColor.BLACK, CardLabel.DRAW_FOUR))
+    return cards
+
+
+class TestDeckTemplate(TestCase):
+
+    def setUp(self) -> None:
+        Config.NUM_CARDS_AT_INIT = 7
+
+    @number("17.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_template_is_canonical_and_cached(self) -> None:
+        legacy = legacy_cards()
+        template = deck_template()
+        self.assertEqual(len(template), Config.DECK_SIZE)
+        self.assertEqual([template[i].code for i in range(len(template))], [legacy[i].code for i in range(len(legacy))])
+        self.assertIs(deck_template(), template)
+        self.assertEqual(len({id(template[i]) for i in range(len(template))}), Config.DECK_SIZE)
+
+    @number("17.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_generate_cards_matches_legacy_shuffle(self) -> None:
+        game = Game()
+        for seed in range(20):
+            RandomGen.set_seed(seed)
+            legacy = legacy_cards()
+            RandomGen.random_shuffle(legacy)
+            RandomGen.set_seed(seed)
+            cards = game.generate_cards()
+            self.assertEqual([cards[i].code for i in range(len(cards))], [legacy[i].code for i in range(len(legacy))])
+
+    @number("17.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_multi_deck_tables(self) -> None:
+        for decks, num_players in ((2, 20), (4, 40)):
+            template = deck_template(decks)
+            self.assertEqual(len(template), decks * Config.DECK_SIZE)
+            self.assertIs(deck_template(decks), template)
+            self.assertEqual(len({id(template[i]) for i in range(len(template))}), decks * Config.DECK_SIZE)
+            single = deck_template()
+            for i in range(len(template)):
+                self.assertEqual(template[i].code, single[i % Config.DECK_SIZE].code)
+
+            RandomGen.set_seed(decks)
+            players: ArrayList[Player] = ArrayList(num_players)
+            for seat in range(num_players):
+                players.append(Player(str(seat)))
+            game = Game()
+            game.verbose = False
+            game.decks = decks
+            game.initialise_game(players)
+            board = game.game_board
+            in_hands = sum(len(players[seat].hand) for seat in range(num_players))
+            self.assertEqual(in_hands + len(board.draw_pile) + len(board.discard_pile), decks * Config.DECK_SIZE)
+        with self.assertRaises(ValueError):
+            deck_template(0)
+
+    @number("17.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_extend_bulk_copies(self) -> None:
+        source = ArrayR[int](5)
+        for i in range(5):
+            source[i] = i * 10
+        items: ArrayList[int] = ArrayList(2)
+        items.append(-1)
+        items.extend(source)
+        items.extend(items)
+        self.assertEqual([items[i] for i in range(len(items))], [-1, 0, 10, 20, 30, 40] * 2)
+        typed: ArrayList[int] = ArrayList(1, "h")
+        typed.extend(ArrayR.typed("h", 3))
+        typed.extend(typed)
+        self.assertEqual(len(typed), 6)
+        self.assertEqual(bytes(typed.view()), bytes(12))
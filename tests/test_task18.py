@@ -0,0 +1,99 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures import ArrayList
+
+from card import Card, CardColor, CardLabel
+from game import Game
+from game_board import GameBoard, ReshuffleMode
+from observer import GameObserver
+from random_gen import RandomGen
+from player import Player
+from config import Config
+
+
+class DrawLog(GameObserver):
+
+    def __init__(self) -> None:
+        self.cards = []
+        self.reshuffles = 0
+
+    def card_drawn(self, game_board, card) -> None:
+        self.cards.append(id(card))
+
+    def reshuffled(self, game_board) -> None:
+        self.reshuffles += 1
+
+
+class TestReshuffleSwap(TestCase):
+
+    def setUp(self) -> None:
+        Config.NUM_CARDS_AT_INIT = 7
+
+    def play(self, seed: int, mode: ReshuffleMode, num_players: int = 4) -> tuple:
+        RandomGen.set_seed(seed)
+        players: ArrayList[Player] = ArrayList(num_players)
+        for seat in range(num_players):
+            players.append(Player(str(seat)))
+        game = Game()
+        game.verbose = False
+        game.reshuffle_mode = mode
+        game.initialise_game(players)
+        log = DrawLog()
+        game.attach(log)
+        try:
+            winner = game.play_game().name
+        except Exception as error:
+            winner = str(error)
+        return winner, game.turn_counter, RandomGen.seed, log.cards, log.reshuffles
+
+    @number("18.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_swap_draws_the_same_cards(self) -> None:
+        reshuffled = 0
+        for seed in range(40):
+            copy = self.play(seed, ReshuffleMode.COPY, 8)
+            swap = self.play(seed, ReshuffleMode.SWAP, 8)
+            self.assertEqual(swap, copy)
+            reshuffled += copy[4]
+        self.assertGreater(reshuffled, 0)
+
+    @number("18.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_swap_exchanges_buffers(self) -> None:
+        cards: ArrayList[Card] = ArrayList(6)
+        for label in range(6):
+            cards.append(Card(CardColor.RED, CardLabel(label)))
+        board = GameBoard(cards)
+        while len(board.draw_pile) > 0:
+            board.discard_card(board.draw_card())
+        draw_buffer, discard_buffer = board.draw_pile.array, board.discard_pile.array
+        RandomGen.set_seed(5)
+        board.reshuffle()
+        self.assertIs(board.draw_pile.array, discard_buffer)
+        self.assertIs(board.discard_pile.array, draw_buffer)
+        self.assertEqual(len(board.discard_pile), 0)
+
+        expected: ArrayList[Card] = ArrayList(6)
+        for i in range(len(cards)):
+            expected.append(cards[len(cards) - 1 - i])
+        RandomGen.set_seed(5)
+        RandomGen.random_shuffle(expected)
+        for i in range(len(expected)):
+            self.assertIs(board.draw_card(), expected[i])
+
+    @number("18.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_overfull_discard_pile_still_raises(self) -> None:
+        for mode in ReshuffleMode:
+            cards: ArrayList[Card] = ArrayList(3)
+            for label in range(3):
+                cards.append(Card(CardColor.BLUE, CardLabel(label)))
+            board = GameBoard(cards)
+            board.reshuffle_mode = mode
+            while len(board.draw_pile) > 0:
+                card = board.draw_card()
+                board.discard_card(card)
+                board.discard_card(card)
+            with self.assertRaises(Exception):
+                board.reshuffle()
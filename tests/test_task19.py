@@ -0,0 +1,117 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures import ArrayList
+
+from card import Card, CardColor, CardLabel
+from card_tracker import CardTracker
+from endgame import EndgameSolver
+from game import Game
+from game_board import GameBoard, ReshuffleMode
+from observer import ObserverGroup
+from random_gen import RandomGen, RandomStream
+from player import Player
+from config import Config
+from zobrist import ZobristHash
+
+
+class CountingStream(RandomStream):
+
+    def __init__(self, seed: int) -> None:
+        RandomStream.__init__(self, seed)
+        self.calls = 0
+
+    def random(self) -> int:
+        self.calls += 1
+        return RandomStream.random(self)
+
+
+class TestLazyReshuffle(TestCase):
+
+    def setUp(self) -> None:
+        Config.NUM_CARDS_AT_INIT = 7
+
+    def board(self, size: int, seed: int) -> GameBoard:
+        cards: ArrayList[Card] = ArrayList(size)
+        for i in range(size):
+            cards.append(Card(CardColor(i % 4), CardLabel(i % 10)))
+        board = GameBoard(cards)
+        board.reshuffle_mode = ReshuffleMode.LAZY
+        board.random = CountingStream(seed)
+        while len(board.draw_pile) > 0:
+            board.discard_card(board.draw_card())
+        return board
+
+    @number("19.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_cost_follows_draws(self) -> None:
+        board = self.board(100, 1)
+        discarded = [id(board.discard_pile[i]) for i in range(100)]
+        board.reshuffle()
+        self.assertEqual(board.random.calls, 0)
+        self.assertEqual(board.unshuffled, 100)
+        drawn = [id(board.draw_card()) for _ in range(5)]
+        self.assertEqual(board.random.calls, 5)
+        self.assertEqual(board.unshuffled, 95)
+        while len(board.draw_pile) > 0:
+            drawn.append(id(board.draw_card()))
+        self.assertEqual(sorted(drawn), sorted(discarded))
+        self.assertEqual(board.unshuffled, 0)
+
+    @number("19.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_draws_are_uniform(self) -> None:
+        counts = {}
+        for seed in range(6000):
+            board = self.board(3, seed)
+            board.reshuffle()
+            order = tuple(board.draw_card().label for _ in range(3))
+            counts[order] = counts.get(order, 0) + 1
+        self.assertEqual(len(counts), 6)
+        for count in counts.values():
+            self.assertLess(abs(count - 1000), 150)
+
+    @number("19.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_lazy_game_keeps_observers_exact(self) -> None:
+        lazy_turns = 0
+        for seed in range(10):
+            RandomGen.set_seed(seed)
+            players: ArrayList[Player] = ArrayList(8)
+            for seat in range(8):
+                players.append(Player(str(seat)))
+            game = Game()
+            game.verbose = False
+            game.reshuffle_mode = ReshuffleMode.LAZY
+            game.initialise_game(players)
+            zobrist, tracker = ZobristHash(), CardTracker()
+            game.attach(ObserverGroup(zobrist, tracker))
+            try:
+                while game.step() is None:
+                    if game.game_board.unshuffled == 0:
+                        continue
+                    lazy_turns += 1
+                    fresh = ZobristHash()
+                    fresh.attached(game)
+                    self.assertEqual(zobrist.value, fresh.value)
+                    self.assertEqual(len(tracker.counter()), len(game.game_board.draw_pile))
+            except Exception as error:
+                self.assertEqual(str(error), "Stack is full")
+        self.assertGreater(lazy_turns, 0)
+
+    @number("19.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_endgame_solver_needs_replayable_draws(self) -> None:
+        Config.NUM_CARDS_AT_INIT = 2
+        RandomGen.set_seed(3)
+        players: ArrayList[Player] = ArrayList(2)
+        players.append(Player("a"))
+        players.append(Player("b"))
+        game = Game()
+        game.verbose = False
+        game.initialise_game(players)
+        solver = EndgameSolver()
+        game.attach(solver)
+        self.assertTrue(solver.applies(players[0]))
+        game.game_board.reshuffle_mode = ReshuffleMode.LAZY
+        self.assertFalse(solver.applies(players[0]))
@@ -0,0 +1,107 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures import ArrayList, ArrayStack
+from data_structures.referential_array import ArrayR
+
+from card import Card, CardColor, CardLabel
+from card_tracker import CardTracker
+from game import Game
+from game_board import GameBoard, ReshuffleMode
+from random_gen import RandomGen
+from player import Player
+from config import Config
+
+
+class TestBatchedDraws(TestCase):
+
+    def setUp(self) -> None:
+        Config.NUM_CARDS_AT_INIT = 7
+
+    def board(self, mode: ReshuffleMode) -> GameBoard:
+        cards: ArrayList[Card] = ArrayList(12)
+        for i in range(12):
+            cards.append(Card(CardColor(i % 4), CardLabel(i % 10)))
+        board = GameBoard(cards)
+        board.reshuffle_mode = mode
+        for _ in range(9):
+            board.discard_card(board.draw_card())
+        return board
+
+    def table(self, seed: int, num_players: int, decks: int = 1) -> Game:
+        RandomGen.set_seed(seed)
+        players: ArrayList[Player] = ArrayList(num_players)
+        for seat in range(num_players):
+            players.append(Player(str(seat)))
+        game = Game()
+        game.verbose = False
+        game.decks = decks
+        game.initialise_game(players)
+        return game
+
+    @number("20.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_pop_many(self) -> None:
+        stack: ArrayStack[int] = ArrayStack(5)
+        for i in range(5):
+            stack.push(i)
+        self.assertEqual(stack.pop_many(3), [4, 3, 2])
+        self.assertEqual(len(stack), 2)
+        self.assertEqual(stack.pop(), 1)
+        with self.assertRaises(Exception):
+            stack.pop_many(2)
+        stack.push(1)
+        stack.push(2)
+        array = ArrayR(4)
+        stack.pop_many_into(2, array, 1)
+        self.assertEqual(array[1:3], [2, 1])
+        self.assertEqual(len(stack), 1)
+        stack.pop_many_into(1, array, 3)
+        self.assertEqual(array[3], 0)
+        self.assertTrue(stack.is_empty())
+        stack.pop_many_into(0, array, 0)
+        with self.assertRaises(Exception):
+            stack.pop_many_into(1, array, 0)
+
+    @number("20.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_draw_many_matches_draw_card_across_a_reshuffle(self) -> None:
+        for mode in ReshuffleMode:
+            one_by_one, batched = self.board(mode), self.board(mode)
+            RandomGen.set_seed(9)
+            expected = [one_by_one.draw_card() for _ in range(7)]
+            RandomGen.set_seed(9)
+            batch = batched.draw_many(7)
+            self.assertEqual([batch[i].code for i in range(len(batch))], [card.code for card in expected])
+            self.assertEqual(len(batched.draw_pile), len(one_by_one.draw_pile))
+            self.assertIs(batched.draw_many(2, batch), batch)
+            self.assertEqual(len(batch), 2)
+
+    @number("20.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_add_cards(self) -> None:
+        tracker = CardTracker()
+        game = self.table(4, 2)
+        game.attach(tracker)
+        player = game.seating[0]
+        cards = [Card(CardColor.RED, CardLabel.ONE), Card(CardColor.BLUE, CardLabel.TWO)]
+        before = len(player.hand)
+        unseen = len(tracker.counter(player))
+        player.add_cards(cards)
+        self.assertEqual(len(player.hand), before + 2)
+        self.assertIs(player.hand[before + 1], cards[1])
+        self.assertEqual(len(tracker.counter(player)), unseen - 2)
+
+    @number("20.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_deal_matches_rounds_around_the_table(self) -> None:
+        for seed, num_players, decks in ((1, 3, 1), (2, 8, 1), (3, 50, 4)):
+            game = self.table(seed, num_players, decks)
+            deck = game.deck
+            for seat in range(num_players):
+                hand = game.seating[seat].hand
+                self.assertEqual(len(hand), Config.NUM_CARDS_AT_INIT)
+                for card_round in range(Config.NUM_CARDS_AT_INIT):
+                    self.assertIs(hand[card_round], deck[seat + card_round * num_players])
+            order = [game.players.peek_at(i) for i in range(num_players)]
+            self.assertEqual(order, [game.seating[seat] for seat in range(num_players)])
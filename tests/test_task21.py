@@ -0,0 +1,82 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures import ArrayList
+
+from card import BLACK, NINE, SKIP, REVERSE, DRAW_TWO, DRAW_FOUR, COLORS, LABELS
+from card import Card, CardColor, CardLabel
+from game import Game, GameOutcome
+from random_gen import RandomGen
+from player import Player
+from config import Config
+
+
+class TestIntFastPath(TestCase):
+
+    def setUp(self) -> None:
+        Config.NUM_CARDS_AT_INIT = 7
+
+    def table(self, seed: int) -> Game:
+        RandomGen.set_seed(seed)
+        players: ArrayList[Player] = ArrayList(3)
+        for seat in range(3):
+            players.append(Player(str(seat)))
+        game = Game()
+        game.verbose = False
+        game.initialise_game(players)
+        return game
+
+    @number("21.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_constants_match_the_enums(self) -> None:
+        for constant, member in (
+            (BLACK, CardColor.BLACK), (NINE, CardLabel.NINE), (SKIP, CardLabel.SKIP),
+            (REVERSE, CardLabel.REVERSE), (DRAW_TWO, CardLabel.DRAW_TWO), (DRAW_FOUR, CardLabel.DRAW_FOUR),
+        ):
+            self.assertIs(type(constant), int)
+            self.assertEqual(constant, member)
+        for color in CardColor:
+            self.assertIs(COLORS[color], color)
+        for label in CardLabel:
+            self.assertIs(LABELS[label], label)
+
+    @number("21.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_api_still_speaks_enums(self) -> None:
+        for seed in range(20):
+            game = self.table(seed)
+            while True:
+                try:
+                    winner = game.step()
+                except Exception as error:
+                    # the double discard of a drawn playable card can overfill the discard pile
+                    self.assertEqual(str(error), "Stack is full")
+                    break
+                if winner is not None or game.outcome != GameOutcome.PLAYING:
+                    break
+                self.assertIsInstance(game.current_color, CardColor)
+                self.assertIsInstance(game.current_label, CardLabel)
+                self.assertEqual(game.current_color * len(CardLabel) + game.current_label, game.current_code)
+        card = Card(CardColor.BLACK, CardLabel.DRAW_FOUR)
+        self.assertIs(card.color, CardColor.BLACK)
+        self.assertIs(card.label, CardLabel.DRAW_FOUR)
+        self.assertEqual(str(card), "BLACK DRAW_FOUR")
+
+    @number("21.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_internal_state_is_plain_int(self) -> None:
+        game = self.table(3)
+        for _ in range(30):
+            if game.step() is not None:
+                break
+            self.assertIs(type(game.current_code), int)
+            for seat in range(len(game.seating)):
+                hand = game.seating[seat].hand
+                for i in range(len(hand)):
+                    # a card keeps nothing but its code
+                    self.assertEqual(vars(hand[i]), {"code": hand[i].code})
+                    self.assertIs(type(hand[i].code), int)
+        self.assertNotIn("current_color", vars(game))
+        self.assertNotIn("current_label", vars(game))
+        self.assertIs(type(Card.from_code(int(CardLabel.SKIP)).code), int)
+        self.assertIs(type(Card(CardColor.RED, CardLabel.SKIP).code), int)
@@ -0,0 +1,109 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures import ArrayList
+
+from card import Card, CardColor, CardLabel
+from endgame import EndgameSolver
+from game import Game
+from random_gen import RandomGen
+from player import Player
+from config import Config
+from rules import (
+    RULE_SETS, SEVEN_O, STACKING, STANDARD, RuleSet, draw_two_effect, number_effect, pass_hands_effect,
+    register_rules, stack_draw_two_effect, swap_with_next_effect,
+)
+from zobrist import ZobristHash
+
+
+class TestRules(TestCase):
+
+    def setUp(self) -> None:
+        Config.NUM_CARDS_AT_INIT = 7
+
+    def table(self, seed: int, num_players: int, rules: RuleSet = STANDARD) -> Game:
+        RandomGen.set_seed(seed)
+        players: ArrayList[Player] = ArrayList(num_players)
+        for seat in range(num_players):
+            players.append(Player(str(seat)))
+        game = Game()
+        game.verbose = False
+        game.rules = rules
+        game.initialise_game(players)
+        return game
+
+    def hand(self, player: Player) -> list:
+        return [player.hand[i].code for i in range(len(player.hand))]
+
+    @number("22.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_registry(self) -> None:
+        self.assertIs(RULE_SETS["standard"], STANDARD)
+        self.assertIs(RULE_SETS["seven-o"], SEVEN_O)
+        self.assertIs(RULE_SETS["stacking"], STACKING)
+        self.assertIs(STANDARD.effects[CardLabel.FIVE], number_effect)
+        self.assertIs(STANDARD.effects[CardLabel.DRAW_TWO], draw_two_effect)
+        self.assertIs(SEVEN_O.effects[CardLabel.DRAW_TWO], draw_two_effect)
+        self.assertIs(SEVEN_O.effects[CardLabel.SEVEN], swap_with_next_effect)
+        self.assertIs(STACKING.effects[CardLabel.DRAW_TWO], stack_draw_two_effect)
+        self.assertIs(STACKING.effects[CardLabel.SEVEN], number_effect)
+        with self.assertRaises(ValueError):
+            register_rules("standard", {})
+
+    @number("22.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_seven_o(self) -> None:
+        game = self.table(1, 3, SEVEN_O)
+        a, b, c = (game.players.peek_at(i) for i in range(3))
+        hands = {player.name: self.hand(player) for player in (a, b, c)}
+        game.current_player = game.players.serve()
+        swap_with_next_effect(game, Card(CardColor.RED, CardLabel.SEVEN))
+        self.assertEqual(self.hand(a), hands[b.name])
+        self.assertEqual(self.hand(b), hands[a.name])
+        self.assertEqual([game.players.peek_at(i) for i in range(3)], [b, c, a])
+
+        hands = {player.name: self.hand(player) for player in (a, b, c)}
+        game.current_player = game.players.serve()
+        pass_hands_effect(game, Card(CardColor.RED, CardLabel.ZERO))
+        self.assertEqual(self.hand(c), hands[b.name])
+        self.assertEqual(self.hand(a), hands[c.name])
+        self.assertEqual(self.hand(b), hands[a.name])
+        self.assertEqual([game.players.peek_at(i) for i in range(3)], [c, a, b])
+
+    @number("22.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_stacking(self) -> None:
+        game = self.table(2, 3, STACKING)
+        a, b, c = (game.players.peek_at(i) for i in range(3))
+        for player in (b, c):
+            player.reset()
+        b.add_card(Card(CardColor.RED, CardLabel.ONE))
+        b.add_card(Card(CardColor.BLUE, CardLabel.DRAW_TWO))
+        c.add_card(Card(CardColor.GREEN, CardLabel.DRAW_TWO))
+        game.current_player = game.players.serve()
+        stack_draw_two_effect(game, Card(CardColor.RED, CardLabel.DRAW_TWO))
+        self.assertEqual(self.hand(b), [Card(CardColor.RED, CardLabel.ONE).code])
+        self.assertEqual(len(c.hand), 5)
+        self.assertEqual((game.current_color, game.current_label), (CardColor.BLUE, CardLabel.DRAW_TWO))
+        self.assertEqual([game.players.peek_at(i) for i in range(3)], [a, b, c])
+
+    @number("22.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_variants_keep_observers_exact(self) -> None:
+        for rules in (SEVEN_O, STACKING):
+            for seed in range(6):
+                game = self.table(seed, 4, rules)
+                zobrist = ZobristHash()
+                game.attach(zobrist)
+                solver = EndgameSolver()
+                try:
+                    while game.step() is None:
+                        if game.current_label not in (CardLabel.ZERO, CardLabel.SEVEN, CardLabel.DRAW_TWO):
+                            continue
+                        fresh = ZobristHash()
+                        fresh.attached(game)
+                        self.assertEqual(zobrist.value, fresh.value)
+                except Exception as error:
+                    self.assertEqual(str(error), "Stack is full")
+                solver.attached(game)
+                self.assertFalse(solver.applies(game.seating[0]))
@@ -0,0 +1,117 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures import ArrayList
+
+from game import Game, GameOutcome
+from random_gen import RandomGen
+from player import Player
+from config import Config
+from simulation_stats import SimulationStats, simulate
+
+
+class TestTurnCap(TestCase):
+
+    def setUp(self) -> None:
+        Config.NUM_CARDS_AT_INIT = 7
+        self.max_rounds = Config.MAX_ROUNDS_PER_PLAYER
+
+    def tearDown(self) -> None:
+        Config.MAX_ROUNDS_PER_PLAYER = self.max_rounds
+
+    def table(self, seed: int, num_players: int) -> Game:
+        RandomGen.set_seed(seed)
+        players: ArrayList[Player] = ArrayList(num_players)
+        for seat in range(num_players):
+            players.append(Player(str(seat)))
+        game = Game()
+        game.verbose = False
+        game.initialise_game(players)
+        return game
+
+    @number("23.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_natural_games_win(self) -> None:
+        for seed in range(20):
+            game = self.table(seed, 4)
+            winner = game.play_game()
+            self.assertIsNotNone(winner)
+            self.assertIs(winner, game.winner)
+            self.assertEqual(game.outcome, GameOutcome.WON)
+
+    @number("23.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_turn_limit(self) -> None:
+        Config.MAX_ROUNDS_PER_PLAYER = 2
+        game = self.table(1, 4)
+        self.assertIsNone(game.play_game())
+        self.assertIsNone(game.winner)
+        self.assertEqual(game.outcome, GameOutcome.TURN_LIMIT)
+        self.assertEqual(game.turn_counter, 8)
+        self.assertIn("8 turns", game.end_reason)
+
+    @number("23.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_stalemate(self) -> None:
+        game = self.table(2, 3)
+        # Rounds that leave every hand size unchanged
+        for _ in range(Game.STALL_ROUNDS):
+            game.turn_counter += 3
+            self.assertEqual(game.check_progress(), GameOutcome.PLAYING)
+        game.turn_counter += 3
+        self.assertEqual(game.check_progress(), GameOutcome.STALEMATE)
+        self.assertIn("unchanged", game.end_reason)
+        # The outcome sticks
+        self.assertEqual(game.check_progress(), GameOutcome.STALEMATE)
+
+    @number("23.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_progress_resets_stall(self) -> None:
+        game = self.table(3, 2)
+        for _ in range(Game.STALL_ROUNDS - 1):
+            game.turn_counter += 2
+            game.check_progress()
+        game.seating[0].hand.append(game.game_board.draw_card())
+        for _ in range(Game.STALL_ROUNDS):
+            game.turn_counter += 2
+            self.assertEqual(game.check_progress(), GameOutcome.PLAYING)
+
+    @number("23.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_timeout(self) -> None:
+        game = self.table(4, 4)
+        self.assertIsNone(game.play_game(time_limit=0))
+        self.assertEqual(game.outcome, GameOutcome.TIMEOUT)
+        self.assertEqual(game.turn_counter, 1)
+
+    @number("23.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_reset_clears_outcome(self) -> None:
+        Config.MAX_ROUNDS_PER_PLAYER = 1
+        game = self.table(5, 3)
+        self.assertIsNone(game.play_game())
+        Config.MAX_ROUNDS_PER_PLAYER = self.max_rounds
+        game.reset(5)
+        self.assertEqual(game.outcome, GameOutcome.PLAYING)
+        self.assertIsNone(game.end_reason)
+        self.assertIsNotNone(game.play_game())
+        self.assertEqual(game.outcome, GameOutcome.WON)
+
+    @number("23.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_simulate_counts_unfinished(self) -> None:
+        Config.MAX_ROUNDS_PER_PLAYER = 1
+        stats = simulate(SimulationStats(3), max_games=10, min_games=10)
+        self.assertEqual(stats.unfinished, 10)
+        self.assertEqual(stats.games, 0)
+
+    @number("23.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_step_ends_capped_game(self) -> None:
+        Config.MAX_ROUNDS_PER_PLAYER = 2
+        game = self.table(1, 4)
+        # a loop driving step directly stops at the cap like play_game
+        while game.step() is None and game.outcome == GameOutcome.PLAYING:
+            pass
+        self.assertEqual(game.outcome, GameOutcome.TURN_LIMIT)
+        self.assertEqual(game.turn_counter, 8)
@@ -0,0 +1,139 @@
+import inspect
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures import ArrayList
+from data_structures.referential_array import ArrayR
+
+from complexity import (
+    CASES, GROWTH_CLASSES, ComplexityCase, big_o_terms, count_elements, documented_complexity, documented_methods,
+    fit_growth, growth_order, register_case, uncovered_methods, verify,
+)
+from config import Config
+
+
+def linear_lookup(items: ArrayList, item) -> int:
+    """
+    Claims more than it delivers
+
+    Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+    """
+    return items.index(item)
+
+
+def reallocating_clear(items: ArrayList) -> None:
+    """
+    Empties a list into a fresh array of its initial capacity, in a single line per step
+
+    Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+    """
+    items.clear()
+    items.array = ArrayR(items.min_capacity)
+
+
+class TestComplexity(TestCase):
+
+    def setUp(self) -> None:
+        Config.NUM_CARDS_AT_INIT = 7
+
+    @number("24.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_big_o_terms(self) -> None:
+        self.assertEqual(big_o_terms("O(NlogN + N) = O(NlogN), where N is"), ["NlogN + N", "NlogN"])
+        self.assertEqual(big_o_terms(":complexity: O(len(self) - index)"), ["len(self) - index"])
+        self.assertEqual(big_o_terms("no claim"), [])
+
+    @number("24.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_growth_order(self) -> None:
+        self.assertEqual(GROWTH_CLASSES[growth_order("1", ("N",))], "O(1)")
+        self.assertEqual(GROWTH_CLASSES[growth_order("NlogN + M", ("N",))], "O(NlogN)")
+        self.assertEqual(GROWTH_CLASSES[growth_order("NlogN + M", ("M",))], "O(N)")
+        self.assertEqual(GROWTH_CLASSES[growth_order("KN", ("N", "K"))], "O(N^2)")
+        self.assertEqual(GROWTH_CLASSES[growth_order("KN", ("N",))], "O(N)")
+        self.assertEqual(GROWTH_CLASSES[growth_order("len(self)*Comp==", ("len(self)",))], "O(N)")
+        self.assertEqual(GROWTH_CLASSES[growth_order("log N", ("N",))], "O(logN)")
+        with self.assertRaises(ValueError):
+            growth_order("N^3", ("N",))
+
+    @number("24.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_documented_complexity(self) -> None:
+        self.assertEqual(documented_complexity(linear_lookup.__doc__, ("N",)), (0, 0))
+        self.assertEqual(documented_complexity(inspect.getdoc(ArrayList.index), ("len(self)",)), (0, 2))
+        self.assertEqual(documented_complexity(inspect.getdoc(ArrayList.insert), ("len(self)",)), (2, 2))
+        with self.assertRaises(ValueError):
+            documented_complexity("Nothing documented.", ("N",))
+
+    @number("24.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_fit_growth(self) -> None:
+        sizes = (32, 64, 128, 256, 512, 1024)
+        self.assertEqual(GROWTH_CLASSES[fit_growth(sizes, [7] * 6)], "O(1)")
+        self.assertEqual(GROWTH_CLASSES[fit_growth(sizes, [3 * n + 40 for n in sizes])], "O(N)")
+        self.assertEqual(GROWTH_CLASSES[fit_growth(sizes, [n * n + n for n in sizes])], "O(N^2)")
+        self.assertEqual(GROWTH_CLASSES[fit_growth(sizes, [n.bit_length() * 5 for n in sizes])], "O(logN)")
+
+    @number("24.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_registered_claims_hold(self) -> None:
+        for name, case in CASES.items():
+            result = verify(case, repeats=1)
+            self.assertEqual(result.violations(), [], name)
+            for kind in ("best", "worst"):
+                self.assertEqual(len(result.counts[kind]), len(case.sizes))
+
+    @number("24.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_regression_flagged(self) -> None:
+        def build(n: int):
+            items = ArrayList(n)
+            items.extend(range(n))
+            return lambda: linear_lookup(items, n - 1)
+
+        case = ComplexityCase("linear_lookup", linear_lookup, ("N",), build, build)
+        result = verify(case, repeats=1)
+        self.assertEqual(result.violations(), ["best: documented O(1), measured O(N)", "worst: documented O(1), measured O(N)"])
+        self.assertIn("FAIL", str(result))
+        self.assertNotIn("linear_lookup", CASES)
+
+    @number("24.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_register_duplicate(self) -> None:
+        case = CASES["ArrayList.index"]
+        with self.assertRaises(ValueError):
+            register_case("ArrayList.index", case.method, case.symbols, case.best, case.worst)
+
+    @number("24.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_allocations_and_copies_counted(self) -> None:
+        items = ArrayList(8)
+        items.extend(range(5))
+        self.assertEqual(count_elements(lambda: ArrayList(16)), 16)
+        # reading the 5 items, a new array of 16, copying the 5 old items into it, writing the 5 read
+        self.assertEqual(count_elements(lambda: items.extend(items)), 5 + 16 + 5 + 5 + 5)
+
+        def build(n: int):
+            items = ArrayList(n)
+            items.extend(range(n + 1))
+            return lambda: reallocating_clear(items)
+
+        case = ComplexityCase("reallocating_clear", reallocating_clear, ("N",), build, build)
+        self.assertEqual(verify(case, repeats=1).violations(), [
+            "best: documented O(1), measured O(N)", "worst: documented O(1), measured O(N)"
+        ])
+
+    @number("24.9")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_documented_methods_covered(self) -> None:
+        documented = documented_methods()
+        for name in ("Game.draw_card", "Game.play_black", "GameBoard.discard_card", "ArrayList.append",
+                     "ArrayList.__getitem__", "ArrayList._ArrayList__resize", "Card.color"):
+            self.assertIn(name, documented)
+        self.assertNotIn("List.append", documented)
+        self.assertFalse(any(name.startswith("Counting") for name in documented))
+        self.assertEqual(uncovered_methods(), [])
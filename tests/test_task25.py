@@ -0,0 +1,169 @@
+import json
+import os
+import subprocess
+import sys
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+import data_structures
+from data_structures import array_list, referential_array
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+COUNTED = """
+import json
+import pickle
+from data_structures import *
+from data_structures.instrumented import COUNTS, OpReport, installed
+from data_structures.referential_array import ArrayR
+from card import PLAYABLE, Card, CardColor, CardLabel
+from config import Config
+from game import Game
+from game_board import GameBoard
+from player import Player
+from random_gen import RandomGen
+from zobrist import zobrist_keys
+
+results = {"installed": installed(), "array": type(ArrayList().array).__name__}
+
+items = ArrayList(4)
+for i in range(5):
+    items.append(i)
+results["append"] = items.ops.as_dict()
+items.ops.clear()
+items.insert(0, -1)
+results["insert"] = items.ops.as_dict()
+items.ops.clear()
+results["index"] = items.index(3)
+results["index_ops"] = items.ops.as_dict()
+items.ops.clear()
+items.delete_at_index(1)
+results["delete"] = items.ops.as_dict()
+
+ordered = ArraySortedList(1)
+for i in (5, 1, 3):
+    ordered.add(i)
+results["sorted"] = ordered.ops.as_dict()
+
+members = ASet(4)
+members.add(1)
+members.add(2)
+members.ops.clear()
+results["contains"] = 2 in members
+results["set_ops"] = members.ops.as_dict()
+
+bits = BSet()
+bits.add(3)
+results["bits"] = [3 in bits, bits.ops.as_dict()]
+
+stack = ArrayStack(3)
+stack.push(1)
+stack.push(2)
+stack.pop_many(2)
+results["stack"] = stack.ops.as_dict()
+
+before = COUNTS.copy()
+keys = zobrist_keys(4, 1)
+results["lookup"] = [type(PLAYABLE).__name__, type(keys).__name__, PLAYABLE[0], (COUNTS - before).as_dict()]
+
+array = ArrayR(2)
+array[0] = 1
+restored = pickle.loads(pickle.dumps(array))
+results["pickled_array"] = [restored[0], restored.ops.as_dict(), restored.adopted]
+members = ASet(2)
+members.add(1)
+restored = pickle.loads(pickle.dumps(members))
+results["pickled_set"] = [restored.array.ops is restored.ops, restored.array.adopted, restored.ops.as_dict() == members.ops.as_dict()]
+
+Config.NUM_CARDS_AT_INIT = 7
+report = OpReport()
+report.watch(Player, "play_card")
+RandomGen.set_seed(3)
+players = ArrayList(2)
+for seat in range(2):
+    players.append(Player(str(seat)))
+game = Game()
+game.verbose = False
+game.initialise_game(players)
+winner = game.play_game()
+report.close()
+results["game"] = [game.turn_counter, report.calls["Player.play_card"], report.totals["Player.play_card"].as_dict()]
+results["restored"] = "counted" not in repr(Player.play_card)
+results["global"] = COUNTS.as_dict()
+print(json.dumps(results))
+"""
+
+
+class TestInstrumented(TestCase):
+
+    def run_counted(self) -> dict:
+        env = dict(os.environ, UNO_COUNT_OPS="1")
+        out = subprocess.run(
+            [sys.executable, "-c", COUNTED], cwd=ROOT, env=env, capture_output=True, text=True, check=True
+        ).stdout
+        return json.loads(out)
+
+    @number("25.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_disabled_by_default(self) -> None:
+        if os.environ.get("UNO_COUNT_OPS"):
+            self.skipTest("counting mode enabled for this run")
+        self.assertIs(data_structures.ArrayList, array_list.ArrayList)
+        self.assertEqual(data_structures.ArrayList.__module__, "data_structures.array_list")
+        self.assertEqual(referential_array.ArrayR.__module__, "data_structures.referential_array")
+        self.assertFalse(hasattr(data_structures.ArrayList(), "ops"))
+
+    @number("25.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_array_list_counts(self) -> None:
+        results = self.run_counted()
+        self.assertTrue(results["installed"])
+        self.assertEqual(results["array"], "CountingArrayR")
+        # 4 appends fill the list, the 5th doubles it: 4 copies and 5 writes
+        self.assertEqual(results["append"]["resizes"], 1)
+        self.assertEqual(results["append"]["writes"], 9)
+        self.assertEqual(results["append"]["reads"], 4)
+        # Inserting at the front shifts all 5 items right
+        self.assertEqual(results["insert"]["shifts"], 5)
+        self.assertEqual(results["insert"]["writes"], 6)
+        # [-1, 0, 1, 2, 3, 4].index(3) compares 5 items
+        self.assertEqual(results["index"], 4)
+        self.assertEqual(results["index_ops"]["comparisons"], 5)
+        self.assertEqual(results["delete"]["shifts"], 4)
+
+    @number("25.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_other_adts_count(self) -> None:
+        results = self.run_counted()
+        self.assertEqual(results["sorted"]["resizes"], 2)
+        self.assertGreater(results["sorted"]["comparisons"], 0)
+        self.assertGreater(results["sorted"]["shifts"], 0)
+        self.assertTrue(results["contains"])
+        self.assertEqual(results["set_ops"]["comparisons"], 2)
+        self.assertEqual(results["bits"], [True, {"reads": 1, "writes": 1, "shifts": 0, "comparisons": 1, "resizes": 0}])
+        self.assertEqual(results["stack"]["writes"], 2)
+        self.assertEqual(results["stack"]["reads"], 2)
+
+    @number("25.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_game_report(self) -> None:
+        results = self.run_counted()
+        turns, calls, totals = results["game"]
+        self.assertEqual(calls, turns)
+        self.assertGreater(totals["reads"], turns)
+        self.assertGreater(results["global"]["reads"], totals["reads"])
+        self.assertTrue(results["restored"])
+
+    @number("25.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_lookup_tables_not_counted(self) -> None:
+        results = self.run_counted()
+        self.assertEqual(results["lookup"], ["LookupArrayR", "LookupArrayR", 1, {"reads": 0, "writes": 0, "shifts": 0, "comparisons": 0, "resizes": 0}])
+
+    @number("25.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_pickle_keeps_counts(self) -> None:
+        results = self.run_counted()
+        # The write of array[0] before pickling and the read of restored[0] after
+        self.assertEqual(results["pickled_array"], [1, {"reads": 1, "writes": 1, "shifts": 0, "comparisons": 0, "resizes": 0}, False])
+        self.assertEqual(results["pickled_set"], [True, True, True])
@@ -0,0 +1,152 @@
+import pickle
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures import ArrayList
+
+from config import Config
+from game import Game
+from player import Player
+from random_gen import RandomGen
+
+
+class TestResizePolicy(TestCase):
+
+    def filled(self, n: int, capacity: int = 1, typecode: str | None = None) -> ArrayList:
+        items = ArrayList(capacity, typecode)
+        for i in range(n):
+            items.append(i)
+        return items
+
+    def items(self, items: ArrayList) -> list:
+        return [items[i] for i in range(len(items))]
+
+    @number("26.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_growth_factor(self) -> None:
+        self.assertEqual(len(self.filled(9, 4).array), 16)
+        items = ArrayList(4)
+        items.GROWTH_FACTOR = 1.5
+        for i in range(5):
+            items.append(i)
+        self.assertEqual(len(items.array), 6)
+        # A factor that would not grow still adds room
+        items.GROWTH_FACTOR = 1
+        for i in range(5, 7):
+            items.append(i)
+        self.assertEqual(len(items.array), 7)
+        self.assertEqual(self.items(items), list(range(7)))
+        items.extend(range(7, 20))
+        self.assertEqual(len(items.array), 20)
+
+    @number("26.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_shrink_with_hysteresis(self) -> None:
+        items = self.filled(64, 4)
+        self.assertEqual(len(items.array), 64)
+        while len(items) > 17:
+            items.delete_at_index(0)
+        self.assertEqual(len(items.array), 64)
+        items.delete_at_index(0)
+        # At a quarter full the capacity halves, to twice the length
+        self.assertEqual(len(items.array), 32)
+        self.assertEqual(self.items(items), list(range(48, 64)))
+        # Growing back does not resize until the list is full again
+        for i in range(16):
+            items.append(i)
+        self.assertEqual(len(items.array), 32)
+        while len(items) > 0:
+            items.delete_at_index(len(items) - 1)
+        # Never below GROWTH_FACTOR ** 2 times the capacity the list was created with
+        self.assertEqual(len(items.array), 16)
+        # so a list that stays within its usual sizes never reallocates
+        items = self.filled(8, 7)
+        storage = items.array
+        while len(items) > 0:
+            items.delete_at_index(0)
+        self.assertIs(items.array, storage)
+
+    @number("26.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_clear_keeps_storage(self) -> None:
+        items = self.filled(100, 7, "i")
+        storage = items.array
+        items.clear()
+        self.assertEqual(len(items), 0)
+        self.assertIs(items.array, storage)
+        items.extend(range(100))
+        self.assertIs(items.array, storage)
+        items.clear()
+        items.shrink_to_fit()
+        self.assertEqual(len(items.array), ArrayList.MIN_CAPACITY)
+        self.assertEqual(items.array.typecode, "i")
+
+    @number("26.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_shrink_disabled(self) -> None:
+        items = self.filled(64)
+        items.SHRINK_THRESHOLD = 0
+        while len(items) > 1:
+            items.delete_at_index(0)
+        items.clear()
+        self.assertEqual(len(items.array), 64)
+        # Deleting the last element does not shrink either
+        items.extend(range(64))
+        while len(items) > 0:
+            items.delete_at_index(len(items) - 1)
+        self.assertEqual(len(items.array), 64)
+
+    @number("26.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_shrink_to_fit(self) -> None:
+        items = self.filled(10, 10)
+        items.append(10)
+        self.assertEqual(len(items.array), 20)
+        items.shrink_to_fit()
+        self.assertEqual(len(items.array), 11)
+        self.assertEqual(self.items(items), list(range(11)))
+        items.clear()
+        items.shrink_to_fit()
+        self.assertEqual(len(items.array), ArrayList.MIN_CAPACITY)
+        items.append(1)
+        items.append(2)
+        self.assertEqual(self.items(items), [1, 2])
+
+    @number("26.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_ballooned_hand_shrinks_as_played(self) -> None:
+        Config.NUM_CARDS_AT_INIT = 7
+        RandomGen.set_seed(6)
+        players = ArrayList(3)
+        for seat in range(3):
+            players.append(Player(str(seat)))
+        game = Game()
+        game.verbose = False
+        game.initialise_game(players)
+        hand = game.seating[0].hand
+        for _ in range(57):
+            hand.append(game.deck[0])
+        self.assertEqual(len(hand.array), 112)
+        # Playing the hand down gives the memory back
+        while len(hand) > Config.NUM_CARDS_AT_INIT:
+            hand.delete_at_index(0)
+        self.assertEqual(len(hand.array), 4 * Config.NUM_CARDS_AT_INIT)
+        storage = hand.array
+        # and a reset keeps what is left
+        game.reset(6)
+        self.assertIs(hand.array, storage)
+        self.assertEqual(len(hand), Config.NUM_CARDS_AT_INIT)
+        self.assertIsNotNone(game.play_game())
+
+    @number("26.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_pickle_keeps_shrink_floor(self) -> None:
+        items = self.filled(64, 4)
+        restored = pickle.loads(pickle.dumps(items))
+        self.assertEqual(restored.min_capacity, 4)
+        self.assertEqual(len(restored.array), 64)
+        self.assertEqual(self.items(restored), list(range(64)))
+        # It shrinks as the original would, not only down to its unpickled capacity
+        while len(restored) > 0:
+            restored.delete_at_index(len(restored) - 1)
+        self.assertEqual(len(restored.array), 16)
@@ -0,0 +1,249 @@
+import os
+import statistics
+import subprocess
+import sys
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures import ArrayStack, CircularQueue
+
+from benchmarks.bench_import import BUDGET_MS, import_times
+
+
+class TestQueue(TestCase):
+    """Tests for CircularQueue, moved out of data_structures/queue_adt.py."""
+
+    EMPTY = 0
+    ROOMY = 5
+    LARGE = 10
+    CAPACITY = 20
+
+    def setUp(self) -> None:
+        self.lengths = [self.EMPTY, self.ROOMY, self.LARGE, self.ROOMY, self.LARGE]
+        self.queues = [CircularQueue(self.CAPACITY) for i in range(len(self.lengths))]
+        for queue, length in zip(self.queues, self.lengths):
+            for i in range(length):
+                queue.append(i)
+        self.empty_queue = self.queues[0]
+        self.roomy_queue = self.queues[1]
+        self.large_queue = self.queues[2]
+        # we build empty queues from clear.
+        # this is an indirect way of testing if clear works!
+        # (perhaps not the best)
+        self.clear_queue = self.queues[3]
+        self.clear_queue.clear()
+        self.lengths[3] = 0
+        self.queues[4].clear()
+        self.lengths[4] = 0
+
+    def tearDown(self) -> None:
+        for s in self.queues:
+            s.clear()
+
+    @number("27.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_init(self) -> None:
+        self.assertTrue(self.empty_queue.is_empty())
+        self.assertEqual(len(self.empty_queue), 0)
+
+    @number("27.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_len(self) -> None:
+        """Tests the length of all queues created during setup."""
+        for queue, length in zip(self.queues, self.lengths):
+            self.assertEqual(len(queue), length)
+
+    @number("27.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_is_empty_add(self) -> None:
+        """Tests queues that have been created empty/non-empty."""
+        self.assertTrue(self.empty_queue.is_empty())
+        self.assertFalse(self.roomy_queue.is_empty())
+        self.assertFalse(self.large_queue.is_empty())
+
+    @number("27.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_is_empty_clear(self) -> None:
+        """Tests queues that have been cleared."""
+        for queue in self.queues:
+            queue.clear()
+            self.assertTrue(queue.is_empty())
+
+    @number("27.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_is_empty_serve(self) -> None:
+        """Tests queues that have been served completely."""
+        for queue in self.queues:
+            # we empty the queue
+            try:
+                while True:
+                    was_empty = queue.is_empty()
+                    queue.serve()
+                    # if we have served without raising an assertion,
+                    # then the queue was not empty.
+                    self.assertFalse(was_empty)
+            except:
+                self.assertTrue(queue.is_empty())
+
+    @number("27.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_is_full_add(self) -> None:
+        """Tests queues that have been created not full."""
+        self.assertFalse(self.empty_queue.is_full())
+        self.assertFalse(self.roomy_queue.is_full())
+        self.assertFalse(self.large_queue.is_full())
+
+    @number("27.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_append_and_serve(self) -> None:
+        for queue in self.queues:
+            nitems = self.ROOMY
+            for i in range(nitems):
+                queue.append(i)
+            for i in range(nitems):
+                self.assertEqual(queue.serve(), i)
+
+    @number("27.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_clear(self) -> None:
+        for queue in self.queues:
+            queue.clear()
+            self.assertEqual(len(queue), 0)
+            self.assertTrue(queue.is_empty())
+
+
+class TestStack(TestCase):
+    """Tests for ArrayStack, moved out of data_structures/stack_adt.py."""
+
+    EMPTY = 0
+    ROOMY = 5
+    LARGE = 10
+    CAPACITY = 20
+
+    def setUp(self) -> None:
+        self.lengths = [self.EMPTY, self.ROOMY, self.LARGE, self.ROOMY, self.LARGE]
+        self.stacks = [ArrayStack(self.CAPACITY) for i in range(len(self.lengths))]
+        for stack, length in zip(self.stacks, self.lengths):
+            for i in range(length):
+                stack.push(i)
+        self.empty_stack = self.stacks[0]
+        self.roomy_stack = self.stacks[1]
+        self.large_stack = self.stacks[2]
+        # we build empty stacks from clear.
+        # this is an indirect way of testing if clear works!
+        # (perhaps not the best)
+        self.clear_stack = self.stacks[3]
+        self.clear_stack.clear()
+        self.lengths[3] = 0
+        self.stacks[4].clear()
+        self.lengths[4] = 0
+
+    def tearDown(self) -> None:
+        for s in self.stacks:
+            s.clear()
+
+    @number("27.9")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_init(self) -> None:
+        self.assertTrue(self.empty_stack.is_empty())
+        self.assertEqual(len(self.empty_stack), 0)
+
+    @number("27.10")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_len(self) -> None:
+        """Tests the length of all stacks created during setup."""
+        for stack, length in zip(self.stacks, self.lengths):
+            self.assertEqual(len(stack), length)
+
+    @number("27.11")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_is_empty_add(self) -> None:
+        """Tests stacks that have been created empty/non-empty."""
+        self.assertTrue(self.empty_stack.is_empty())
+        self.assertFalse(self.roomy_stack.is_empty())
+        self.assertFalse(self.large_stack.is_empty())
+
+    @number("27.12")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_is_empty_clear(self) -> None:
+        """Tests stacks that have been cleared."""
+        for stack in self.stacks:
+            stack.clear()
+            self.assertTrue(stack.is_empty())
+
+    @number("27.13")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_is_empty_pop(self) -> None:
+        """Tests stacks that have been popped completely."""
+        for stack in self.stacks:
+            # we empty the stack
+            try:
+                while True:
+                    was_empty = stack.is_empty()
+                    stack.pop()
+                    # if we have popped without raising an assertion,
+                    # then the stack was not empty.
+                    self.assertFalse(was_empty)
+            except:
+                self.assertTrue(stack.is_empty())
+
+    @number("27.14")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_is_full_add(self) -> None:
+        """Tests stacks that have been created not full."""
+        self.assertFalse(self.empty_stack.is_full())
+        self.assertFalse(self.roomy_stack.is_full())
+        self.assertFalse(self.large_stack.is_full())
+
+    @number("27.15")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_push_and_pop(self) -> None:
+        for stack in self.stacks:
+            nitems = self.ROOMY
+            for i in range(nitems):
+                stack.push(i)
+            for i in range(nitems - 1, -1, -1):
+                self.assertEqual(stack.pop(), i)
+
+    @number("27.16")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_clear(self) -> None:
+        for stack in self.stacks:
+            stack.clear()
+            self.assertEqual(len(stack), 0)
+            self.assertTrue(stack.is_empty())
+
+
+class TestImportTime(TestCase):
+    """Checks that importing the engine stays cheap for short-lived workers."""
+
+    @number("27.17")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_no_test_framework_at_runtime(self) -> None:
+        times = import_times("game")
+        self.assertNotIn("unittest", times)
+        self.assertIn("data_structures.array_list", times)
+
+    @number("27.18")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_lazy_package(self) -> None:
+        script = (
+            "import sys, data_structures; loaded = 'data_structures.aset' in sys.modules; "
+            "data_structures.ASet; print(loaded, 'data_structures.aset' in sys.modules, "
+            "'data_structures.bset' in sys.modules)"
+        )
+        # The counting mode of data_structures/instrumented.py loads every ADT eagerly
+        env = {key: value for key, value in os.environ.items() if key != "UNO_COUNT_OPS"}
+        out = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True).stdout
+        self.assertEqual(out.split(), ["False", "True", "False"])
+        import data_structures
+
+        with self.assertRaises(AttributeError):
+            data_structures.Missing
+        self.assertIn("ArrayList", dir(data_structures))
+
+    @number("27.19")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_import_budget(self) -> None:
+        median = statistics.median(import_times("game")["game"] for _ in range(3)) / 1000
+        self.assertLess(median, BUDGET_MS, f"import game took {median:.1f} ms")
@@ -275,4 +275,30 @@ class TestTask4(TestCase):
             total_cards_remaining,
             5,
             "There should be a significant number of cards remaining with other players"
-        )
\ No newline at end of file
+        )
+
+    @number("4.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_step_matches_play_game(self) -> None:
+        Config.NUM_CARDS_AT_INIT = 7
+        games = []
+        for _ in range(2):
+            RandomGen.set_seed(123)
+            players: ArrayList[Player] = ArrayList(3)
+            for name in ["Alice", "Bob", "Charlie"]:
+                players.append(Player(name))
+            game: Game = Game()
+            game.initialise_game(players)
+            games.append(game)
+
+        winner: Player = games[0].play_game()
+
+        stepped: Game = games[1]
+        turns = 0
+        while stepped.step() is None:
+            turns += 1
+            self.assertEqual(stepped.turn_counter, turns)
+            self.assertIsNone(stepped.winner)
+        self.assertEqual(stepped.winner.name, winner.name)
+        self.assertEqual(stepped.turn_counter, games[0].turn_counter)
+        self.assertEqual(stepped.current_color, games[0].current_color)
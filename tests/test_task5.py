@@ -0,0 +1,65 @@
+from unittest import TestCase, skipUnless
+from importlib.util import find_spec
+
+from data_structures.referential_array import ArrayR
+from ed_utils.decorators import number, visibility
+from data_structures import ArrayList, ArrayStack, CircularQueue
+
+
+class TestTypedArrays(TestCase):
+
+    @number("5.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_typed_init(self) -> None:
+        array: ArrayR[int] = ArrayR.typed("B", 60)
+        self.assertTrue(array.is_typed())
+        self.assertEqual(len(array), 60)
+        self.assertEqual(array[59], 0)
+        self.assertEqual(array.view().nbytes, 60)
+        self.assertFalse(ArrayR(3).is_typed())
+        self.assertRaises(TypeError, ArrayR(3).view)
+
+    @number("5.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_typed_list_resize(self) -> None:
+        cards: ArrayList[int] = ArrayList(2, "B")
+        for code in range(5):
+            cards.append(code)
+        self.assertTrue(cards.array.is_typed())
+        self.assertEqual(bytes(cards.view()), bytes([0, 1, 2, 3, 4]))
+        cards.delete_at_index(0)
+        self.assertEqual(cards.view().tolist(), [1, 2, 3, 4])
+
+    @number("5.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_typed_stack_and_queue(self) -> None:
+        stack: ArrayStack[int] = ArrayStack(4, "h")
+        stack.push(-3)
+        stack.push(300)
+        self.assertEqual(stack.view().tolist(), [-3, 300])
+        self.assertEqual(stack.pop(), 300)
+
+        queue: CircularQueue[int] = CircularQueue(3, "B")
+        for seat in range(3):
+            queue.append(seat)
+        queue.append(queue.serve())
+        first, second = queue.views()
+        self.assertEqual(first.tolist() + second.tolist(), [1, 2, 0])
+
+    @number("5.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_view_is_zero_copy(self) -> None:
+        stack: ArrayStack[int] = ArrayStack(3, "i")
+        stack.push(1)
+        view = stack.view()
+        stack.array[0] = 42
+        self.assertEqual(view[0], 42)
+
+    @number("5.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @skipUnless(find_spec("numpy"), "NumPy is not installed")
+    def test_to_numpy(self) -> None:
+        array: ArrayR[int] = ArrayR.typed("B", 4)
+        shared = array.to_numpy()
+        shared[1] = 9
+        self.assertEqual(array[1], 9)
@@ -0,0 +1,87 @@
+import io
+import pickle
+from contextlib import redirect_stdout
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures import ArrayList, ArrayStack, CircularQueue
+
+from game import Game
+from random_gen import RandomGen
+from card import Card, CardColor, CardLabel
+from player import Player
+from config import Config
+from shared_state import share_state, load_state
+
+
+class TestSerialisation(TestCase):
+
+    def setUp(self) -> None:
+        RandomGen.set_seed(5)
+        Config.NUM_CARDS_AT_INIT = 7
+        self.players: ArrayList[Player] = ArrayList(4)
+        for name in ["Alice", "Bob", "Charlie", "David"]:
+            self.players.append(Player(name))
+        self.game: Game = Game()
+        self.game.initialise_game(self.players)
+
+    def play_from(self, game: Game, seed: int) -> Player:
+        RandomGen.set_seed(seed)
+        with redirect_stdout(io.StringIO()):
+            return game.play_game()
+
+    @number("6.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_card_code(self) -> None:
+        card: Card = Card(CardColor.GREEN, CardLabel.SKIP)
+        copy: Card = pickle.loads(pickle.dumps(card))
+        self.assertEqual(copy, card)
+        self.assertIs(copy.color, CardColor.GREEN)
+        self.assertEqual(Card.from_code(card.code), card)
+
+    @number("6.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_adts_keep_live_range(self) -> None:
+        items: ArrayList[int] = ArrayList(100)
+        stack: ArrayStack[int] = ArrayStack(100)
+        for i in range(3):
+            items.append(i)
+            stack.push(i)
+        items_copy: ArrayList[int] = pickle.loads(pickle.dumps(items))
+        self.assertEqual(str(items_copy), "[0, 1, 2]")
+        self.assertEqual(len(items_copy.array), 100)
+        stack_copy: ArrayStack[int] = pickle.loads(pickle.dumps(stack))
+        self.assertEqual(stack_copy.pop(), 2)
+        self.assertLess(len(pickle.dumps(items)), len(pickle.dumps(list(range(100)))))
+
+    @number("6.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_queue_wraps(self) -> None:
+        queue: CircularQueue[int] = CircularQueue(3)
+        for i in range(3):
+            queue.append(i)
+        queue.append(queue.serve())
+        queue.append(queue.serve())
+        copy: CircularQueue[int] = pickle.loads(pickle.dumps(queue))
+        self.assertEqual([copy.serve() for _ in range(3)], [2, 0, 1])
+        copy.append(5)
+        self.assertEqual(copy.peek(), 5)
+
+    @number("6.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_game_round_trip(self) -> None:
+        copy: Game = pickle.loads(pickle.dumps(self.game))
+        self.assertEqual(self.play_from(copy, 9).name, self.play_from(self.game, 9).name)
+
+    @number("6.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_shared_memory(self) -> None:
+        block = share_state(self.game)
+        try:
+            copy: Game = load_state(block.name)
+        finally:
+            block.close()
+            block.unlink()
+        self.assertEqual(copy.current_color, self.game.current_color)
+        self.assertEqual(len(copy.game_board.draw_pile), len(self.game.game_board.draw_pile))
+        self.assertEqual(self.play_from(copy, 3).name, self.play_from(self.game, 3).name)
@@ -0,0 +1,76 @@
+import io
+from contextlib import redirect_stdout
+from importlib.util import find_spec
+from unittest import TestCase, skipUnless
+
+from ed_utils.decorators import number, visibility
+from data_structures import ArrayList
+
+from game import Game
+from random_gen import RandomGen
+from player import Player
+from config import Config
+
+
+@skipUnless(find_spec("numpy"), "NumPy is not installed")
+class TestBatchGame(TestCase):
+
+    def setUp(self) -> None:
+        Config.NUM_CARDS_AT_INIT = 7
+
+    def scalar_winner(self, seed: int, num_players: int) -> int:
+        RandomGen.set_seed(seed)
+        players: ArrayList[Player] = ArrayList(num_players)
+        for seat in range(num_players):
+            players.append(Player(str(seat)))
+        game: Game = Game()
+        game.initialise_game(players)
+        try:
+            with redirect_stdout(io.StringIO()):
+                winner = game.play_game()
+        except Exception:
+            # the object engine fails on some seeds, BatchGame reports ERROR
+            return -2
+        # a game still unwon at the turn cap is a draw, BatchGame reports TURN_LIMIT
+        return -3 if winner is None else int(winner.name)
+
+    @number("7.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_same_winners(self) -> None:
+        from batch_game import BatchGame
+
+        seeds = [1, 3, 5, 112, 123, 456, 5678]
+        for num_players in (2, 3, 4):
+            winners = BatchGame(seeds, num_players).play()
+            for seed, winner in zip(seeds, winners):
+                self.assertEqual(winner, self.scalar_winner(seed, num_players))
+
+    @number("7.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_finished_games_leave(self) -> None:
+        from batch_game import BatchGame, PLAYING
+
+        batch = BatchGame(range(20), 4)
+        batch.step()
+        self.assertTrue((batch.winner[batch.active] == PLAYING).all())
+        batch.play()
+        self.assertFalse(batch.active.any())
+        self.assertTrue((batch.hand_size[range(20), batch.winner] == 0).all())
+
+    @number("7.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_turn_cap(self) -> None:
+        from batch_game import BatchGame, TURN_LIMIT
+
+        batch = BatchGame(range(20), 4)
+        winners = batch.play(max_turns=3)
+        self.assertFalse(batch.active.any())
+        self.assertTrue((winners == TURN_LIMIT).all())
+        max_rounds = Config.MAX_ROUNDS_PER_PLAYER
+        Config.MAX_ROUNDS_PER_PLAYER = 2
+        try:
+            batch = BatchGame(range(20), 4)
+            batch.play()
+            self.assertTrue((batch.turns <= 8).all())
+        finally:
+            Config.MAX_ROUNDS_PER_PLAYER = max_rounds
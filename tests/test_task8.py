@@ -0,0 +1,150 @@
+import asyncio
+import json
+from unittest import IsolatedAsyncioTestCase
+
+from ed_utils.decorators import number, visibility
+
+from data_structures import ArrayList
+from game import Game
+from load_generator import choose_move, run_load
+from player import Player
+from random_gen import RandomGen
+from server import GameServer, RemotePlayer
+from zobrist import ZobristHash
+
+
+class TestServer(IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self) -> None:
+        self.server = GameServer(move_timeout=0.05)
+        await self.server.start()
+        host, port = self.server.server.sockets[0].getsockname()[:2]
+        self.reader, self.writer = await asyncio.open_connection(host, port)
+
+    async def asyncTearDown(self) -> None:
+        self.writer.close()
+        await self.server.stop()
+
+    async def send(self, message: dict) -> None:
+        self.writer.write(json.dumps(message).encode() + b"\n")
+        await self.writer.drain()
+
+    async def receive(self) -> dict:
+        return json.loads(await asyncio.wait_for(self.reader.readline(), 5))
+
+    @number("8.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    async def test_play_table(self) -> None:
+        await self.send({"type": "create", "players": 3, "seed": 123})
+        self.assertEqual((await self.receive())["type"], "table")
+        while True:
+            message = await self.receive()
+            if message["type"] == "turn":
+                move = choose_move(message["hand"], message["color"], message["label"])
+                await self.send({"type": "move", "table": message["table"], "card": move})
+            elif message["type"] == "over":
+                break
+        self.assertIsNotNone(message["winner"])
+        self.assertEqual(len(self.server.tables), 0)
+
+    @number("8.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    async def test_illegal_move_and_timeout(self) -> None:
+        await self.send({"type": "create", "players": 2, "seed": 5})
+        table = (await self.receive())["table"]
+        message = await self.receive()
+        while message["type"] != "turn":
+            message = await self.receive()
+        missing = next(code for code in range(75) if code not in message["hand"])
+        await self.send({"type": "move", "table": table, "card": missing})
+        self.assertEqual((await self.receive())["type"], "error")
+        # no further moves: every turn of the client times out and is played greedily
+        while message["type"] != "over":
+            message = await self.receive()
+
+    @number("8.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    async def test_load_generator(self) -> None:
+        report = await run_load(num_clients=2, tables_per_client=3, num_players=4)
+        self.assertEqual(report["tables"], 6)
+        self.assertGreater(report["moves"], 0)
+        self.assertLessEqual(report["p50_ms"], report["p99_ms"])
+
+    @number("8.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    async def test_bad_lines_keep_the_connection(self) -> None:
+        self.writer.write(b"not json\n")
+        self.assertEqual((await self.receive())["type"], "error")
+        await self.send({"type": "create", "players": "four"})
+        self.assertEqual((await self.receive())["type"], "error")
+        await self.send({"type": "create"})
+        self.assertEqual((await self.receive())["type"], "error")
+        await self.send({"type": "create", "players": 2, "seed": 5})
+        self.assertEqual((await self.receive())["type"], "table")
+
+    @number("8.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    async def test_stale_move_is_dropped(self) -> None:
+        await self.send({"type": "create", "players": 2, "seed": 5})
+        table = self.server.tables[(await self.receive())["table"]]
+        table.task.cancel()
+        await asyncio.sleep(0)
+        game, hand = table.game, table.remote.hand
+        legal = next(hand[i].code for i in range(len(hand)) if table.remote.find_move(
+            hand[i].code, game.current_color, game.current_label) >= 0)
+        # a move that arrived after the last turn timed out is not played on the next turn
+        table.moves.put_nowait(legal)
+        await self.server.wait_for_move(table)
+        self.assertTrue(table.remote.auto)
+        self.assertTrue(table.moves.empty())
+
+    @number("8.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    async def test_disconnect_removes_tables(self) -> None:
+        # the connection closes before the tables' tasks first run
+        self.writer.write(b"".join(
+            json.dumps({"type": "create", "players": 3, "seed": seed}).encode() + b"\n" for seed in range(3)
+        ))
+        self.writer.close()
+        for _ in range(100):
+            if not self.server.tables:
+                break
+            await asyncio.sleep(0.01)
+        self.assertEqual(len(self.server.tables), 0)
+
+    @number("8.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    async def test_moves_only_at_own_tables(self) -> None:
+        await self.send({"type": "create", "players": 2, "seed": 5})
+        table = self.server.tables[(await self.receive())["table"]]
+        host, port = self.server.server.sockets[0].getsockname()[:2]
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(json.dumps({"type": "move", "table": table.table_id, "card": None}).encode() + b"\n")
+        await writer.drain()
+        self.assertEqual(json.loads(await asyncio.wait_for(reader.readline(), 5))["type"], "error")
+        self.assertTrue(table.moves.empty())
+        writer.close()
+
+    @number("8.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    async def test_remote_moves_notify_observer(self) -> None:
+        RandomGen.set_seed(11)
+        remote = RemotePlayer("Remote")
+        remote.auto = False
+        players: ArrayList[Player] = ArrayList(2)
+        players.append(remote)
+        players.append(Player("Bob"))
+        game = Game()
+        game.verbose = False
+        game.initialise_game(players)
+        position = ZobristHash()
+        game.attach(position)
+        for _ in range(30):
+            hand = remote.hand
+            remote.move = next((hand[i].code for i in range(len(hand)) if remote.find_move(
+                hand[i].code, game.current_color, game.current_label) >= 0), None)
+            if game.step() is not None:
+                break
+        fresh = ZobristHash()
+        fresh.attached(game)
+        self.assertEqual(position.value, fresh.value)
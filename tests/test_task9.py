@@ -0,0 +1,73 @@
+import pickle
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures import ArrayList
+
+from game import Game
+from random_gen import RandomGen
+from card import Card, CardColor, CardLabel
+from player import Player
+from config import Config
+from zobrist import ZobristHash
+
+
+class TestZobrist(TestCase):
+
+    def setUp(self) -> None:
+        RandomGen.set_seed(112)
+        Config.NUM_CARDS_AT_INIT = 7
+        self.players: ArrayList[Player] = ArrayList(4)
+        for name in ["Alice", "Bob", "Charlie", "David"]:
+            self.players.append(Player(name))
+        self.game: Game = Game()
+        self.game.verbose = False
+        self.game.initialise_game(self.players)
+        self.hash: ZobristHash = ZobristHash()
+        self.game.attach(self.hash)
+
+    def rehash(self, game: Game) -> int:
+        fresh: ZobristHash = ZobristHash()
+        fresh.attached(game)
+        return fresh.value
+
+    @number("9.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_incremental_matches_full(self) -> None:
+        seen = set()
+        while self.game.step() is None:
+            self.assertEqual(self.hash.value, self.rehash(self.game))
+            seen.add(self.hash.value)
+        self.assertEqual(len(seen), self.game.turn_counter - 1)
+
+    @number("9.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_turn_order_and_color(self) -> None:
+        before = self.hash.value
+        self.game.reverse_players()
+        reversed_value = self.hash.value
+        self.assertNotEqual(before, reversed_value)
+        self.game.reverse_players()
+        self.assertEqual(before, self.hash.value)
+        self.game.skip_next_player()
+        self.assertNotEqual(before, self.hash.value)
+        self.game.current_color = CardColor((self.game.current_color + 1) % 4)
+        self.assertEqual(self.hash.value, self.rehash(self.game))
+
+    @number("9.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_hand_is_a_multiset(self) -> None:
+        a = self.players[0]
+        before = self.hash.value
+        a.add_card(Card(CardColor.RED, CardLabel.ONE))
+        a.add_card(Card(CardColor.RED, CardLabel.ONE))
+        self.assertNotEqual(before, self.hash.value)
+        a.play_card(CardColor.RED, CardLabel.ONE)
+        a.play_card(CardColor.RED, CardLabel.ONE)
+        self.assertEqual(before, self.hash.value)
+
+    @number("9.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_copies_hash_equal(self) -> None:
+        copy: Game = pickle.loads(pickle.dumps(self.game))
+        self.assertEqual(self.rehash(copy), self.hash.value)
@@ -0,0 +1,216 @@
+"""
+This module contains the `TranspositionTable` class, a fixed-memory cache of
+search results keyed by a 64-bit position hash such as `ZobristHash.value`.
+
+Entries live in parallel typed arrays (key, value, depth, best move, clock
+bits), so the footprint is fixed when the table is created and never grows.
+A key maps to one small bucket of slots. When the bucket is full, the victim
+is the slot with the lowest score, where the score combines the searched
+depth, whether the entry was stored in the current search generation, and a
+clock reference bit that is set on every hit and cleared when the slot
+survives an eviction (second chance). Deep, recent and recently used entries
+therefore stay.
+"""
+
+from __future__ import annotations
+from data_structures.referential_array import ArrayR
+
+EMPTY = 0
+NO_MOVE = -1
+
+
+class TranspositionTable:
+    """
+    TranspositionTable class to memoise position evaluations in bounded memory
+    """
+
+    BUCKET_SIZE = 4
+    ENTRY_BYTES = 8 + 8 + 2 + 2 + 1 + 1
+    GENERATION_BONUS = 64
+    REFERENCE_BONUS = 16
+
+    def __init__(self, max_bytes: int = 1 << 20) -> None:
+        """
+        Constructor for the TranspositionTable class
+
+        Args:
+            max_bytes (int): The memory budget of the entries in bytes
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(N), where N is the number of slots that fit in max_bytes
+            Worst Case Complexity: O(N)
+            Explanation: Each typed array is allocated and zeroed once
+        """
+        self.num_buckets = max(1, max_bytes // (self.ENTRY_BYTES * self.BUCKET_SIZE))
+        slots = self.num_buckets * self.BUCKET_SIZE
+        self.keys = ArrayR.typed("Q", slots)
+        self.values = ArrayR.typed("d", slots)
+        self.depths = ArrayR.typed("h", slots)
+        self.moves = ArrayR.typed("h", slots)
+        self.generations = ArrayR.typed("B", slots)
+        self.referenced = ArrayR.typed("B", slots)
+        # Probes and stores index the buffers through memoryviews, which skips a method call per access
+        self.__keys, self.__depths = self.keys.view(), self.depths.view()
+        self.__values, self.__moves = self.values.view(), self.moves.view()
+        self.__generations, self.__referenced = self.generations.view(), self.referenced.view()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of slots in the table
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return len(self.keys)
+
+    def memory_bytes(self) -> int:
+        """
+        Method to measure the memory held by the entries
+
+        Returns:
+            int: The size of the typed arrays in bytes
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        total = 0
+        for array in (self.keys, self.values, self.depths, self.moves, self.generations, self.referenced):
+            total += array.view().nbytes
+        return total
+
+    def new_search(self) -> None:
+        """
+        Method to start a new search generation, making older entries easier to replace
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.generation = (self.generation + 1) % 256
+
+    def __find(self, key: int) -> int:
+        """
+        Returns the slot holding key, or -1 if it is not in its bucket.
+        :complexity: O(B), where B is BUCKET_SIZE
+        """
+        start = (key % self.num_buckets) * self.BUCKET_SIZE
+        keys, depths = self.__keys, self.__depths
+        for slot in range(start, start + self.BUCKET_SIZE):
+            if keys[slot] == key and depths[slot] != EMPTY:
+                return slot
+        return -1
+
+    def lookup(self, key: int, min_depth: int = 0) -> tuple[float, int, int] | None:
+        """
+        Method to look up a position
+
+        Args:
+            key (int): The 64-bit position hash
+            min_depth (int): Entries searched less deeply than this count as misses
+
+        Returns:
+            tuple[float, int, int] | None: (value, depth, best move) or None on a miss
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(B), where B is BUCKET_SIZE
+        """
+        slot = self.__find(key)
+        if slot < 0 or self.__depths[slot] - 1 < min_depth:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.__referenced[slot] = 1
+        return self.__values[slot], self.__depths[slot] - 1, self.__moves[slot]
+
+    def __score(self, slot: int) -> int:
+        """Returns how much a slot is worth keeping.
+        :complexity: O(1)
+        """
+        score = self.__depths[slot]
+        if self.__generations[slot] == self.generation:
+            score += self.GENERATION_BONUS
+        if self.__referenced[slot]:
+            score += self.REFERENCE_BONUS
+        return score
+
+    def store(self, key: int, value: float, depth: int, best_move: int = NO_MOVE) -> None:
+        """
+        Method to store the result of searching a position
+
+        Args:
+            key (int): The 64-bit position hash
+            value (float): The value of the position
+            depth (int): The depth searched below the position, 0 or more
+            best_move (int): The best move found, NO_MOVE if none
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(B), where B is BUCKET_SIZE
+            Explanation:
+            - A result for the same key replaces the old one unless the old one was searched deeper
+            in the current generation
+            - Otherwise an empty slot is used, and failing that the lowest scoring slot is evicted
+        """
+        slot = self.__find(key)
+        if slot >= 0:
+            if self.__depths[slot] - 1 > depth and self.__generations[slot] == self.generation:
+                return
+        else:
+            start = (key % self.num_buckets) * self.BUCKET_SIZE
+            for candidate in range(start, start + self.BUCKET_SIZE):
+                if self.__depths[candidate] == EMPTY:
+                    slot = candidate
+                    break
+            else:
+                slot = start
+                for candidate in range(start, start + self.BUCKET_SIZE):
+                    if self.__score(candidate) < self.__score(slot):
+                        slot = candidate
+                for candidate in range(start, start + self.BUCKET_SIZE):
+                    self.__referenced[candidate] = 0
+                self.evictions += 1
+        self.__keys[slot] = key
+        self.__values[slot] = value
+        self.__depths[slot] = depth + 1
+        self.__moves[slot] = best_move
+        self.__generations[slot] = self.generation
+        self.__referenced[slot] = 0
+        self.stores += 1
+
+    def clear(self) -> None:
+        """
+        Method to empty the table and reset its counters
+
+        Complexity:
+            Best Case Complexity: O(N), where N is len(self)
+            Worst Case Complexity: O(N)
+        """
+        for slot in range(len(self)):
+            self.depths[slot] = EMPTY
+        self.generation = 0
+        self.hits = self.misses = self.stores = self.evictions = 0
+
+    def hit_rate(self) -> float:
+        """
+        Method to compute the fraction of lookups that hit
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
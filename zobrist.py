@@ -0,0 +1,230 @@
+"""
+This module contains the `ZobristHash` class, an incrementally maintained
+64-bit hash of the full position of a `Game`.
+
+The position covers every hand, both piles with their order, the turn order
+and the current color and label. Random 64-bit keys are drawn once per
+(seat, card code), (pile position, card code), (front seat, direction) and
+(color, label) code. Hands are multisets, so their keys are added modulo
+2^64 (identical cards would cancel under XOR); pile keys are XORed. As a
+`GameObserver` the hash is updated in O(1) on every add, play, draw and
+discard, and the turn order and color terms are mixed in when `value` is
+read, so skips and reverses need no update at all. Equal positions hash
+equal, which search bots use for transposition lookups and simulators use to
+detect repeated positions.
+
+Cards left unshuffled by a lazy reshuffle (see `ReshuffleMode.LAZY`) have no
+order yet, so they are hashed as a multiset, like a hand.
+"""
+
+from __future__ import annotations
+from card import Card, NUM_CARD_CODES
+from data_structures.referential_array import ArrayR
+from observer import GameObserver
+
+MASK_64 = (1 << 64) - 1
+HAND_SALT, DRAW_SALT, DISCARD_SALT, TURN_SALT, STATE_SALT, UNSHUFFLED_SALT = range(6)
+
+
+def zobrist_keys(count: int, seed: int) -> ArrayR[int]:
+    """
+    Method to draw count 64-bit keys with the splitmix64 generator
+
+    Args:
+        count (int): The number of keys
+        seed (int): The seed of the key stream; a longer stream with the same
+        seed starts with the same keys
+
+    Returns:
+        ArrayR[int]: The keys in a typed array
+
+    Complexity:
+        Best Case Complexity: O(count)
+        Worst Case Complexity: O(count)
+    """
+    keys = ArrayR.lookup_table("Q", count)
+    state = seed & MASK_64
+    for i in range(count):
+        state = (state + 0x9E3779B97F4A7C15) & MASK_64
+        z = state
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK_64
+        keys[i] = z ^ (z >> 31)
+    return keys
+
+
+class ZobristHash(GameObserver):
+    """
+    ZobristHash class to hash the position of the game it is attached to
+    """
+
+    def __init__(self, seed: int = 0x5EED) -> None:
+        """
+        Constructor for the ZobristHash class
+
+        Args:
+            seed (int): The seed of the keys; hashes are only comparable between
+            instances with the same seed
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.seed = seed
+        self.game = None
+        self.seats: dict = {}
+        self.hand_keys: ArrayR[int] | None = None
+        self.draw_keys: ArrayR[int] | None = None
+        self.discard_keys: ArrayR[int] | None = None
+        self.turn_keys: ArrayR[int] | None = None
+        self.state_keys = zobrist_keys(NUM_CARD_CODES, seed * 8 + STATE_SALT)
+        self.unshuffled_keys = zobrist_keys(NUM_CARD_CODES, seed * 8 + UNSHUFFLED_SALT)
+        self.hands = 0
+        self.draw = 0
+        self.unshuffled = 0
+        self.discard = 0
+
+    def __keys(self, keys: ArrayR[int] | None, salt: int, index: int) -> ArrayR[int]:
+        """
+        Returns a key table of the given salt long enough to hold index,
+        regrowing it by doubling from the same stream when needed.
+        :complexity: O(1) amortised, O(index) when the table grows
+        """
+        if keys is None or index >= len(keys):
+            size = max(index + 1, 2 * len(keys) if keys is not None else 4 * NUM_CARD_CODES)
+            keys = zobrist_keys(size, self.seed * 8 + salt)
+        return keys
+
+    def __draw_key(self, position: int, card: Card) -> int:
+        """Returns the key of a card at a position of the draw pile.
+        :complexity: O(1) amortised
+        """
+        index = position * NUM_CARD_CODES + card.code
+        self.draw_keys = self.__keys(self.draw_keys, DRAW_SALT, index)
+        return self.draw_keys[index]
+
+    def __discard_key(self, position: int, card: Card) -> int:
+        """Returns the key of a card at a position of the discard pile.
+        :complexity: O(1) amortised
+        """
+        index = position * NUM_CARD_CODES + card.code
+        self.discard_keys = self.__keys(self.discard_keys, DISCARD_SALT, index)
+        return self.discard_keys[index]
+
+    def attached(self, game) -> None:
+        """
+        Method to hash the whole position of a game from scratch, numbering the
+        seats in the order of game.seating
+
+        Args:
+            game (Game): The game the hash is attached to
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(P + H + D), where P is the number of players,
+            H the number of cards in hands and D the number of cards in both piles
+            Worst Case Complexity: O(P + H + D)
+            Explanation: Every seat and every card contributes one key
+        """
+        self.game = game
+        self.seats = {}
+        for seat in range(len(game.seating)):
+            self.seats[game.seating[seat]] = seat
+        self.hand_keys = zobrist_keys(len(self.seats) * NUM_CARD_CODES, self.seed * 8 + HAND_SALT)
+        self.turn_keys = zobrist_keys(2 * len(self.seats), self.seed * 8 + TURN_SALT)
+
+        self.hands = 0
+        for player, seat in self.seats.items():
+            for i in range(len(player.hand)):
+                self.hands = (self.hands + self.hand_keys[seat * NUM_CARD_CODES + player.hand[i].code]) & MASK_64
+        self.reshuffled(game.game_board)
+        self.discard = 0
+        discard_pile = game.game_board.discard_pile
+        for position in range(len(discard_pile)):
+            self.discard ^= self.__discard_key(position, discard_pile[position])
+
+    def card_added(self, player, card: Card) -> None:
+        """
+        Method to add a card to the hash of a hand
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        key = self.hand_keys[self.seats[player] * NUM_CARD_CODES + card.code]
+        self.hands = (self.hands + key) & MASK_64
+
+    def card_removed(self, player, card: Card) -> None:
+        """
+        Method to remove a card from the hash of a hand
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        key = self.hand_keys[self.seats[player] * NUM_CARD_CODES + card.code]
+        self.hands = (self.hands - key) & MASK_64
+
+    def card_drawn(self, game_board, card: Card) -> None:
+        """
+        Method to remove the top card of the draw pile from the hash
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1) amortised, see __keys
+        """
+        if game_board.unshuffled > len(game_board.draw_pile):
+            self.unshuffled = (self.unshuffled - self.unshuffled_keys[card.code]) & MASK_64
+        else:
+            self.draw ^= self.__draw_key(len(game_board.draw_pile), card)
+
+    def card_discarded(self, game_board, card: Card) -> None:
+        """
+        Method to add the top card of the discard pile to the hash
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1) amortised, see __keys
+        """
+        self.discard ^= self.__discard_key(len(game_board.discard_pile) - 1, card)
+
+    def reshuffled(self, game_board) -> None:
+        """
+        Method to rehash both piles after a reshuffle
+
+        Complexity:
+            Best Case Complexity: O(N), where N is the number of cards in the draw pile
+            Worst Case Complexity: O(N)
+            Explanation: The reshuffle itself is O(NlogN), so rehashing the new draw pile adds no extra order
+        """
+        draw_pile = game_board.draw_pile
+        self.draw = 0
+        for position in range(game_board.unshuffled, len(draw_pile)):
+            self.draw ^= self.__draw_key(position, draw_pile.array[position])
+        self.unshuffled = 0
+        for position in range(game_board.unshuffled):
+            self.unshuffled = (self.unshuffled + self.unshuffled_keys[draw_pile.array[position].code]) & MASK_64
+        self.discard = 0
+
+    @property
+    def value(self) -> int:
+        """
+        The 64-bit hash of the current position, read between turns
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+            Explanation: The turn order is identified by the front seat and the seat
+            behind it, and the color and label by one packed code
+        """
+        players = self.game.players
+        front = self.seats[players.peek()]
+        backwards = len(players) > 1 and self.seats[players.peek_at(1)] != (front + 1) % len(self.seats)
+        turn = self.turn_keys[2 * front + backwards]
+        state = self.state_keys[self.game.current_code]
+        return self.hands ^ self.draw ^ self.unshuffled ^ self.discard ^ turn ^ state